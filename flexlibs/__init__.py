@@ -1,6 +1,6 @@
 #----------------------------------------------------------------------------
 # Name:         flexlibs
-# Purpose:      This package provides a Python interface to FLEx project data 
+# Purpose:      This package provides a Python interface to FLEx project data
 #               via the Fieldworks Language and Culture Model (LCM).
 #----------------------------------------------------------------------------
 
@@ -8,31 +8,107 @@ version = "1.2.8"
 
 # Define exported classes, etc. at the top level of the package
 
-from .code.FLExInit import (
-    FLExInitialize, 
-    FLExCleanup,
-    )
-    
-from .code.FLExGlobals import (
-    FWCodeDir, 
-    FWProjectsDir, 
-    FWExecutable,
-    FWShortVersion, 
-    FWLongVersion,
-    APIHelpFile,
-    )
+# These don't need Python.NET or FieldWorks, so are imported directly.
 
-from .code.FLExProject import (
-    AllProjectNames,
-    OpenProjectInFW,
-    FLExProject,
+from .code.FLExExceptions import (
     FP_FileLockedError,
     FP_FileNotFoundError,
-    FP_MigrationRequired, 
-    FP_NullParameterError, 
-    FP_ParameterError, 
-    FP_ProjectError, 
-    FP_ReadOnlyError, 
-    FP_RuntimeError, 
+    FP_MigrationRequired,
+    FP_NullParameterError,
+    FP_ParameterError,
+    FP_ProjectError,
+    FP_ReadOnlyError,
+    FP_RuntimeError,
     FP_WritingSystemError,
     )
+
+from .code.FLExFWData import (
+    FWDataProject,
+    FWDataClassCounts,
+    )
+
+from .code.FLExBatch import (
+    RunOnProjects,
+    BatchResult,
+    )
+
+from .code.FLExChanges import (
+    ChangeTracker,
+    )
+
+from .code.FLExExport import (
+    ExportToSQLite,
+    ExportToArrow,
+    ExportToParquet,
+    )
+
+from .code.FLExServer import (
+    ProjectServer,
+    ProjectClient,
+    )
+
+# The LCM-based API loads Python.NET and the FieldWorks assemblies, so
+# it is only imported when one of these names is first used.
+
+_LCMExports = {
+    "FLExInitialize"    : ".code.FLExInit",
+    "FLExCleanup"       : ".code.FLExInit",
+
+    "FWCodeDir"         : ".code.FLExGlobals",
+    "FWProjectsDir"     : ".code.FLExGlobals",
+    "FWExecutable"      : ".code.FLExGlobals",
+    "FWShortVersion"    : ".code.FLExGlobals",
+    "FWLongVersion"     : ".code.FLExGlobals",
+    "APIHelpFile"       : ".code.FLExGlobals",
+    "StartupProfile"    : ".code.FLExGlobals",
+
+    "AllProjectNames"   : ".code.FLExProject",
+    "OpenProjectInFW"   : ".code.FLExProject",
+    "FLExProject"       : ".code.FLExProject",
+    }
+
+_FWGlobals = {"FWCodeDir", "FWProjectsDir", "FWExecutable",
+              "FWShortVersion", "FWLongVersion"}
+
+__all__ = [
+    "FP_FileLockedError",
+    "FP_FileNotFoundError",
+    "FP_MigrationRequired",
+    "FP_NullParameterError",
+    "FP_ParameterError",
+    "FP_ProjectError",
+    "FP_ReadOnlyError",
+    "FP_RuntimeError",
+    "FP_WritingSystemError",
+    "FWDataProject",
+    "FWDataClassCounts",
+    "RunOnProjects",
+    "BatchResult",
+    "ChangeTracker",
+    "ExportToSQLite",
+    "ExportToArrow",
+    "ExportToParquet",
+    "ProjectServer",
+    "ProjectClient",
+    ] + list(_LCMExports)
+
+
+def __getattr__(name):
+    try:
+        moduleName = _LCMExports[name]
+    except KeyError:
+        raise AttributeError("module %r has no attribute %r"
+                             % (__name__, name)) from None
+
+    import importlib
+    module = importlib.import_module(moduleName, __name__)
+    if name in _FWGlobals:
+        # These are found on first use.
+        module.InitialiseFWGlobals()
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LCMExports))
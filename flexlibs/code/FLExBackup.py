@@ -0,0 +1,181 @@
+#
+#   FLExBackup.py
+#
+#   Module: Access to FieldWorks backup files (.fwbackup).
+#
+#           A backup is a zip archive of the project folder. The
+#           .fwdata file and the writing system definitions (.ldml) can
+#           be read directly from the archive, so FWDataProject can
+#           open a backup without restoring it.
+#
+#           LCM needs a real project folder, so for FLExProject the
+#           backup is extracted to a cache folder named by the archive's
+#           SHA-256 hash, and reused while the archive is unchanged.
+#
+#   Platform: Python 3
+#
+#   Copyright Craig Farrow, 2025
+#
+
+import os
+import shutil
+import hashlib
+import platform
+import tempfile
+import zipfile
+
+from .FLExExceptions import (
+    FP_FileNotFoundError,
+    FP_ProjectError,
+    )
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+#--- Globals --------------------------------------------------------
+
+BackupFileExtension = ".fwbackup"
+
+_WritingSystemStore = "WritingSystemStore/"
+
+if platform.system() == "Windows":
+    _cacheDir = os.environ.get("LOCALAPPDATA", os.path.expanduser("~"))
+else:
+    _cacheDir = os.environ.get("XDG_CACHE_HOME",
+                               os.path.expanduser(os.path.join("~", ".cache")))
+BackupCacheDir = os.path.join(_cacheDir, "flexlibs", "backups")
+
+
+def IsBackupFile(fileName):
+    """
+    Returns `True` if `fileName` has the .fwbackup extension.
+    """
+    return fileName.lower().endswith(BackupFileExtension)
+
+
+#--------------------------------------------------------------------
+
+class FWBackup(object):
+    """
+    A FieldWorks backup file.
+
+    Usage::
+
+        with FWBackup("MyProject 2025-06-01 1200.fwbackup") as backup:
+            print(backup.projectName)
+            with backup.OpenData() as f:
+                for line in f:          # The .fwdata file, as bytes
+                    ...
+
+        # A restored copy for LCM, extracted once
+        fwdataFile = FWBackup(fileName).Extract()
+    """
+
+    def __init__(self, fileName):
+        if not os.path.isfile(fileName):
+            raise FP_FileNotFoundError(fileName, fileName)
+        try:
+            self.zip = zipfile.ZipFile(fileName)
+        except zipfile.BadZipFile:
+            raise FP_ProjectError("Not a FieldWorks backup file: %s"
+                                  % fileName) from None
+        self.fileName = fileName
+        self.__hash = None
+
+        dataFiles = [name for name in self.zip.namelist()
+                     if "/" not in name and name.lower().endswith(".fwdata")]
+        if len(dataFiles) != 1:
+            self.zip.close()
+            raise FP_ProjectError("No project (.fwdata) file in %s" % fileName)
+        self.dataFile = dataFiles[0]
+        self.projectName = os.path.splitext(self.dataFile)[0]
+
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.Close()
+
+    def Close(self):
+        self.zip.close()
+
+
+    def OpenData(self):
+        """
+        Returns a binary file object that streams the .fwdata file from
+        the archive.
+        """
+        return self.zip.open(self.dataFile)
+
+
+    def WritingSystemFiles(self):
+        """
+        Returns a dictionary of language tag to the name in the archive
+        of the writing system definition (.ldml file).
+        """
+        files = {}
+        for name in self.zip.namelist():
+            if name.startswith(_WritingSystemStore) and name.endswith(".ldml"):
+                baseName = name[len(_WritingSystemStore):]
+                if "/" not in baseName:         # Skip the trash folder
+                    files[baseName[:-len(".ldml")]] = name
+        return files
+
+
+    def ReadWritingSystem(self, languageTag):
+        """
+        Returns the bytes of the writing system definition (.ldml) for
+        `languageTag`, or `None` if it isn't in the archive.
+        """
+        name = self.WritingSystemFiles().get(languageTag)
+        return self.zip.read(name) if name else None
+
+
+    def Hash(self):
+        """
+        Returns the SHA-256 hash (in hex) of the archive.
+        """
+        if self.__hash is None:
+            sha = hashlib.sha256()
+            with open(self.fileName, "rb") as f:
+                for block in iter(lambda: f.read(1 << 20), b""):
+                    sha.update(block)
+            self.__hash = sha.hexdigest()
+        return self.__hash
+
+
+    def Extract(self, cacheDir=None):
+        """
+        Extracts the backup (if it hasn't been already) into a folder
+        named by its hash in `cacheDir` (by default `BackupCacheDir`),
+        and returns the full path of the .fwdata file.
+
+        The cached copy is reused by every later call for the same
+        archive, so it must only be opened read-only: changes made to 
+        it would be seen by all later opens of the backup (though not
+        saved to the backup file). `FLExProject.OpenProject()` refuses
+        to open a backup with `writeEnabled`.
+        """
+        cacheDir = cacheDir or BackupCacheDir
+        folder = os.path.join(cacheDir, self.Hash())
+        dataFileName = os.path.join(folder, self.projectName, self.dataFile)
+        if os.path.isfile(dataFileName):
+            logger.debug("FWBackup: using cached copy %s" % folder)
+            return dataFileName
+
+        # Extract to a temporary folder and rename it, so that a partly
+        # extracted copy is never used.
+        os.makedirs(cacheDir, exist_ok=True)
+        tempFolder = tempfile.mkdtemp(dir=cacheDir)
+        try:
+            logger.info("FWBackup: extracting %s" % self.fileName)
+            self.zip.extractall(os.path.join(tempFolder, self.projectName))
+            os.rename(tempFolder, folder)
+        except OSError:
+            shutil.rmtree(tempFolder, ignore_errors=True)
+            # Another process may have extracted it at the same time.
+            if not os.path.isfile(dataFileName):
+                raise
+        return dataFileName
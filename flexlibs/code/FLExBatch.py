@@ -0,0 +1,164 @@
+#
+#   FLExBatch.py
+#
+#   Module: Run a function over many FieldWorks projects in parallel.
+#
+#           Each project is opened in a worker process, which does its
+#           own FLExInitialize(), so independent projects are processed
+#           concurrently rather than one after the other.
+#
+#   Platform: Python.NET
+#             FieldWorks Version 9
+#
+#   Copyright Craig Farrow, 2025
+#
+
+import time
+import pickle
+import collections
+import concurrent.futures
+
+from .FLExExceptions import (
+    FP_FileLockedError,
+    FP_ProjectError,
+    )
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+#--------------------------------------------------------------------
+
+BatchResult = collections.namedtuple("BatchResult",
+                                     ["projectName", "result", "error"])
+BatchResult.__doc__ = """
+The outcome of running the batch function on one project:
+    - `projectName`  - the project name, as passed to `OpenProject()`
+    - `result`       - the return value of the function, or `None`
+    - `error`        - the exception raised, or `None` if successful
+"""
+
+
+#--- Worker process functions ---------------------------------------
+
+def _InitialiseWorker():
+    # Each worker process needs its own initialisation of the
+    # FieldWorks libraries, and clean-up when the pool shuts down.
+    import atexit
+    from .FLExInit import FLExInitialize, FLExCleanup
+    FLExInitialize()
+    atexit.register(FLExCleanup)
+
+
+def _RunOnProject(function, projectName, writeEnabled,
+                  retries, retryDelay, projectClass):
+    if projectClass is None:
+        from .FLExProject import FLExProject
+        projectClass = FLExProject
+
+    try:
+        for attempt in range(retries + 1):
+            project = projectClass()
+            try:
+                project.OpenProject(projectName, writeEnabled=writeEnabled)
+            except FP_FileLockedError:
+                if attempt == retries:
+                    raise
+                delay = retryDelay * 2 ** attempt
+                logger.info("%s is locked; retrying in %s seconds"
+                            % (projectName, delay))
+                time.sleep(delay)
+                continue
+
+            try:
+                return BatchResult(projectName, function(project), None)
+            finally:
+                project.CloseProject()
+
+    except Exception as e:
+        # .NET exceptions can't be passed back to the main process.
+        try:
+            pickle.dumps(e)
+        except Exception:
+            e = FP_ProjectError("%s: %s" % (type(e).__name__, e))
+        return BatchResult(projectName, None, e)
+
+
+#--------------------------------------------------------------------
+
+def RunOnProjects(function,
+                  projectNames = None,
+                  writeEnabled = False,
+                  maxWorkers = None,
+                  retries = 3,
+                  retryDelay = 10.0,
+                  projectClass = None):
+    """
+    A generator that calls `function(project)` for each project in
+    `projectNames`, running the projects in parallel in separate worker
+    processes. A `BatchResult` of (`projectName`, `result`, `error`) is
+    yielded for each project as it finishes, so the results are not
+    in the order of `projectNames`.
+
+    function:
+        Called with the open project object; its return value is
+        passed back as the `result`. It must be a module-level function
+        (so that it can be sent to the worker processes), and its return
+        value must be picklable.
+
+    projectNames:
+        A list of project names or paths. Defaults to `AllProjectNames()`.
+
+    writeEnabled:
+        Passed to `OpenProject()`.
+
+    maxWorkers:
+        The number of worker processes. Defaults to the number of
+        processors.
+
+    retries, retryDelay:
+        If a project is locked (`FP_FileLockedError`) it is retried up to
+        `retries` more times, waiting `retryDelay` seconds before the
+        first retry, and doubling the wait each time.
+
+    projectClass:
+        The class used to open each project. Defaults to `FLExProject`,
+        in which case each worker process calls `FLExInitialize()`.
+        Use `FWDataProject` for read-only processing of .fwdata files.
+
+    Usage::
+
+        def CountEntries(project):
+            return project.LexiconNumberOfEntries()
+
+        if __name__ == "__main__":
+            for name, count, error in RunOnProjects(CountEntries):
+                if error:
+                    print(name, "failed:", error)
+                else:
+                    print(name, count)
+    """
+
+    if projectNames is None:
+        from .FLExProject import AllProjectNames
+        projectNames = AllProjectNames()
+
+    initializer = _InitialiseWorker if projectClass is None else None
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers = maxWorkers,
+                                                initializer = initializer) as pool:
+        futures = {pool.submit(_RunOnProject,
+                               function,
+                               projectName,
+                               writeEnabled,
+                               retries,
+                               retryDelay,
+                               projectClass) : projectName
+                   for projectName in projectNames}
+
+        for future in concurrent.futures.as_completed(futures):
+            try:
+                yield future.result()
+            except Exception as e:
+                # E.g. the worker process failed to initialise or died.
+                yield BatchResult(futures[future], None, e)
@@ -0,0 +1,104 @@
+#
+#   FLExCache.py
+#
+#   Module: A bounded least-recently-used cache of resolved objects.
+#
+#           FLExProject keeps one of these (FLExProject.objectCache) so
+#           that repeated lookups of the same hvos and guids by
+#           Object() and Objects() don't cross into LCM each time.
+#
+#   Platform: Python 3
+#
+#   Copyright Craig Farrow, 2025
+#
+
+import collections
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+#--- Globals --------------------------------------------------------
+
+DefaultCacheSize = 10000
+
+
+#--------------------------------------------------------------------
+
+class ObjectCache(object):
+    """
+    An LRU cache with hit and miss counters.
+
+    maxSize:
+        The maximum number of keys to keep. The least recently used
+        are dropped first.
+
+    isValid:
+        An optional function to check a cached value before it is
+        returned (e.g. that the object hasn't been deleted). Invalid
+        values are removed and counted as misses.
+
+    Usage::
+
+        cache = project.objectCache
+        print(cache.hits, cache.misses, len(cache))
+    """
+
+    def __init__(self, maxSize=DefaultCacheSize, isValid=None):
+        self.maxSize = maxSize
+        self.isValid = isValid
+        self.hits = 0
+        self.misses = 0
+        self.__items = collections.OrderedDict()
+
+
+    def __len__(self):
+        return len(self.__items)
+
+    def __contains__(self, key):
+        return key in self.__items
+
+
+    def Get(self, key):
+        """
+        Returns the value for `key`, or `None` if it isn't cached.
+        """
+        try:
+            value = self.__items[key]
+        except KeyError:
+            self.misses += 1
+            return None
+        if self.isValid and not self.isValid(value):
+            del self.__items[key]
+            self.misses += 1
+            return None
+        self.__items.move_to_end(key)
+        self.hits += 1
+        return value
+
+
+    def Put(self, key, value):
+        """
+        Adds or updates `key`, dropping the least recently used key if
+        the cache is full.
+        """
+        self.__items[key] = value
+        self.__items.move_to_end(key)
+        if len(self.__items) > self.maxSize:
+            self.__items.popitem(last=False)
+
+
+    def Remove(self, key):
+        """
+        Removes `key` from the cache if it is there.
+        """
+        self.__items.pop(key, None)
+
+
+    def Clear(self):
+        """
+        Empties the cache and resets the counters.
+        """
+        self.__items.clear()
+        self.hits = 0
+        self.misses = 0
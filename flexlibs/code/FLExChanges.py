@@ -0,0 +1,131 @@
+#
+#   FLExChanges.py
+#
+#   Module: Incremental change tracking for projects.
+#
+#           A ChangeTracker keeps a watermark (the latest modification
+#           date that has been processed) for each consumer, such as a
+#           search index or a web site export, so that each run only
+#           needs to process the objects that have changed since the
+#           last one. The watermarks are saved in a JSON file.
+#
+#           It works with an FLExProject or an FWDataProject, using
+#           their ObjectsModifiedSince() and DateModified() functions.
+#
+#   Platform: Python 3
+#
+#   Copyright Craig Farrow, 2025
+#
+
+import os
+import json
+import datetime
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+#--------------------------------------------------------------------
+
+class ChangeTracker(object):
+    """
+    Tracks the objects that have changed in a project since the last
+    time that `consumer` processed them.
+
+    fileName:
+        The JSON file where the watermarks are saved. Several consumers
+        can share the same file.
+
+    consumer:
+        A name for the process that uses the changes.
+
+    Usage::
+
+        tracker = ChangeTracker(project, "changes.json", "website")
+        changes = tracker.Changes([ILexEntryRepository, ILexSenseRepository])
+        for sense in changes[ILexSenseRepository]:
+            ...
+        tracker.Commit()        # Only once the changes have been processed
+
+    The first call to `Changes()` (or after `Reset()`) returns all the
+    objects.
+    """
+
+    def __init__(self, project, fileName, consumer):
+        self.project = project
+        self.fileName = fileName
+        self.consumer = consumer
+
+        watermark = self.__Read().get(consumer)
+        self.watermark = datetime.datetime.fromisoformat(watermark) \
+                         if watermark else None
+        self.__pending = None
+
+
+    def __Read(self):
+        try:
+            with open(self.fileName, encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning("ChangeTracker: couldn't read %s: %s"
+                           % (self.fileName, e))
+            return {}
+
+
+    def __Write(self, watermark):
+        # Re-read so that other consumers' watermarks are kept, and
+        # replace the file in one step.
+        data = self.__Read()
+        if watermark:
+            data[self.consumer] = watermark.isoformat()
+        else:
+            data.pop(self.consumer, None)
+        tempName = self.fileName + ".tmp"
+        with open(tempName, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=1)
+        os.replace(tempName, self.fileName)
+
+
+    def Changes(self, repositories):
+        """
+        Returns a dictionary of each repository (or class name for an
+        `FWDataProject`) in `repositories` to a list of the objects in
+        it that have been modified since the watermark.
+        """
+        changes = {}
+        latest = self.watermark
+        for repository in repositories:
+            objects = self.project.ObjectsModifiedSince(repository,
+                                                        self.watermark)
+            for obj in objects:
+                dateModified = self.project.DateModified(obj)
+                if dateModified and (latest is None or dateModified > latest):
+                    latest = dateModified
+            changes[repository] = objects
+            logger.debug("ChangeTracker: %d changed in %s"
+                         % (len(objects), repository))
+        self.__pending = latest
+        return changes
+
+
+    def Commit(self):
+        """
+        Saves the watermark for the changes returned by the last call to
+        `Changes()`, so that the next run starts from there.
+        """
+        if self.__pending and self.__pending != self.watermark:
+            self.__Write(self.__pending)
+            self.watermark = self.__pending
+        self.__pending = None
+
+
+    def Reset(self):
+        """
+        Removes the saved watermark, so that the next call to `Changes()`
+        returns all the objects.
+        """
+        self.__Write(None)
+        self.watermark = None
+        self.__pending = None
@@ -0,0 +1,279 @@
+#
+#   FLExCorpus.py
+#
+#   Module: A word index of the texts in a project, for frequency,
+#           n-gram and concordance (KWIC) queries.
+#
+#           Paragraphs are tokenised per writing system run, and the
+#           words are interned, so each paragraph is stored as an array
+#           of word numbers. A positional index maps each word to its
+#           occurrences (text, paragraph, token). When the corpus is
+#           updated, only the texts that have been modified are
+#           re-tokenised.
+#
+#           The corpus is built by FLExProject.TextsCorpus() or
+#           FWDataProject.TextsCorpus().
+#
+#   Platform: Python 3
+#
+#   Copyright Craig Farrow, 2025
+#
+
+import re
+import array
+import collections
+import unicodedata
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+#--- Globals --------------------------------------------------------
+
+# A word is a sequence of letters, digits and combining marks, which
+# may include internal apostrophes and hyphens.
+# Note that scripts without spaces (e.g. Chinese) are not segmented.
+_WordChars = r"[\w\u0300-\u036F\u1AB0-\u1AFF\u1DC0-\u1DFF\u20D0-\u20FF]"
+WordPattern = re.compile(r"%s+(?:['\u2019\u02BC-]%s+)*"
+                         % (_WordChars, _WordChars))
+
+Occurrence = collections.namedtuple("Occurrence",
+                                    ["textGuid", "paragraph", "token"])
+
+ConcordanceLine = collections.namedtuple("ConcordanceLine",
+                                         ["textName", "paragraph",
+                                          "left", "word", "right"])
+ConcordanceLine.__doc__ = """
+A line of a concordance:
+    - `textName`   - the name of the text
+    - `paragraph`  - the paragraph number (from zero)
+    - `left`       - the text before the word
+    - `word`       - the word as it occurs in the text
+    - `right`      - the text after the word
+"""
+
+
+#--------------------------------------------------------------------
+
+class _Paragraph(object):
+    __slots__ = ("text", "words", "starts", "ends")
+
+    def __init__(self, text):
+        self.text = text
+        self.words = array.array("i")       # word numbers
+        self.starts = array.array("i")      # character offsets
+        self.ends = array.array("i")
+
+
+class _Text(object):
+    __slots__ = ("stamp", "name", "paragraphs")
+
+    def __init__(self, stamp, name):
+        self.stamp = stamp
+        self.name = name
+        self.paragraphs = []
+
+
+#--------------------------------------------------------------------
+
+class Corpus(object):
+    """
+    An index of the words in a set of texts.
+
+    ignoreCase:
+        If `True` (the default) words are matched and counted without
+        regard to case.
+
+    Queries take an optional writing system (language tag); if it is
+    `None` all writing systems are included.
+
+    Usage::
+
+        corpus = project.TextsCorpus()
+        for word, count in corpus.Frequencies("fr").most_common(100):
+            print(word, count)
+        for line in corpus.Concordance("maison"):
+            print(line.left, "[%s]" % line.word, line.right)
+
+        # Later: only re-index the texts that have changed
+        project.TextsCorpus(corpus)
+    """
+
+    def __init__(self, ignoreCase=True):
+        self.ignoreCase = ignoreCase
+
+        self.__texts = {}               # guid -> _Text
+        self.__wordNumbers = {}         # (ws, normalised word) -> number
+        self.__words = []               # number -> (ws, normalised word)
+        self.__postings = []            # number -> {guid: [(para, token)]}
+        self.__counts = []              # number -> count
+        self.__wsSet = set()            # all the writing systems
+
+
+    def __Normalise(self, word):
+        word = unicodedata.normalize("NFC", word)
+        return word.casefold() if self.ignoreCase else word
+
+
+    def __WordNumber(self, ws, word):
+        key = (ws, self.__Normalise(word))
+        try:
+            return self.__wordNumbers[key]
+        except KeyError:
+            number = self.__wordNumbers[key] = len(self.__words)
+            self.__wsSet.add(ws)
+            self.__words.append(key)
+            self.__postings.append({})
+            self.__counts.append(0)
+            return number
+
+
+    # --- Building ---
+
+    def Update(self, texts):
+        """
+        Updates the corpus from `texts`, an iterable of
+        (guid, stamp, name, paragraphsFunction) tuples, where:
+
+            - `stamp` is a modification date (or any other value that
+              changes when the text changes);
+            - `paragraphsFunction()` returns the paragraphs of the
+              text, each of which is a list of (ws, text) runs.
+
+        Texts with the same guid and stamp as before are not
+        re-tokenised. Texts that are no longer in `texts` are removed.
+        Returns the number of texts that were (re)indexed.
+        """
+        seen = set()
+        updated = 0
+        for guid, stamp, name, paragraphsFunction in texts:
+            guid = str(guid).lower()
+            seen.add(guid)
+            old = self.__texts.get(guid)
+            if old and old.stamp == stamp:
+                old.name = name
+                continue
+            if old:
+                self.__Remove(guid)
+            self.__Add(guid, stamp, name, paragraphsFunction())
+            updated += 1
+
+        for guid in set(self.__texts) - seen:
+            self.__Remove(guid)
+
+        logger.debug("Corpus: %d texts indexed; %d texts in total"
+                     % (updated, len(self.__texts)))
+        return updated
+
+
+    def __Add(self, guid, stamp, name, paragraphs):
+        text = self.__texts[guid] = _Text(stamp, name)
+        for p, runs in enumerate(paragraphs):
+            paragraph = _Paragraph("".join(runText for ws, runText in runs))
+            offset = 0
+            for ws, runText in runs:
+                for match in WordPattern.finditer(runText):
+                    number = self.__WordNumber(ws, match.group())
+                    self.__postings[number].setdefault(guid, []).append(
+                        (p, len(paragraph.words)))
+                    self.__counts[number] += 1
+                    paragraph.words.append(number)
+                    paragraph.starts.append(offset + match.start())
+                    paragraph.ends.append(offset + match.end())
+                offset += len(runText)
+            text.paragraphs.append(paragraph)
+
+
+    def __Remove(self, guid):
+        text = self.__texts.pop(guid)
+        for paragraph in text.paragraphs:
+            for number in paragraph.words:
+                self.__counts[number] -= 1
+                self.__postings[number].pop(guid, None)
+
+
+    def __len__(self):
+        """
+        The number of texts in the corpus.
+        """
+        return len(self.__texts)
+
+
+    # --- Queries ---
+
+    def TokenCount(self, ws=None):
+        """
+        Returns the total number of words (tokens) in the corpus.
+        """
+        return sum(count for (w, word), count
+                   in zip(self.__words, self.__counts)
+                   if ws is None or w == ws)
+
+
+    def Frequencies(self, ws=None):
+        """
+        Returns a `collections.Counter` of word to number of occurrences.
+        If `ws` is `None`, the counts for the same word in different
+        writing systems are combined.
+        """
+        frequencies = collections.Counter()
+        for (w, word), count in zip(self.__words, self.__counts):
+            if count and (ws is None or w == ws):
+                frequencies[word] += count
+        return frequencies
+
+
+    def NGrams(self, n, ws=None):
+        """
+        Returns a `collections.Counter` of n-gram (a tuple of `n` words)
+        to number of occurrences. N-grams don't span paragraphs or
+        writing systems.
+        """
+        words = self.__words
+        ngrams = collections.Counter()
+        for text in self.__texts.values():
+            for paragraph in text.paragraphs:
+                numbers = paragraph.words
+                for i in range(len(numbers) - n + 1):
+                    keys = [words[number] for number in numbers[i:i + n]]
+                    w = keys[0][0]
+                    if (ws is None or w == ws) and \
+                       all(key[0] == w for key in keys):
+                        ngrams[tuple(key[1] for key in keys)] += 1
+        return ngrams
+
+
+    def Occurrences(self, word, ws=None):
+        """
+        Returns a list of `Occurrence` tuples of (textGuid, paragraph,
+        token) for `word`.
+        """
+        word = self.__Normalise(word)
+        occurrences = []
+        for w in ([ws] if ws else self.__wsSet):
+            number = self.__wordNumbers.get((w, word))
+            if number is not None:
+                for guid, positions in self.__postings[number].items():
+                    occurrences += [Occurrence(guid, p, t)
+                                    for p, t in positions]
+        return occurrences
+
+
+    def Concordance(self, word, width=40, ws=None):
+        """
+        Returns a list of `ConcordanceLine` tuples (keyword in context)
+        for each occurrence of `word`. `width` is the number of
+        characters of context on each side.
+        """
+        lines = []
+        for guid, p, t in self.Occurrences(word, ws):
+            text = self.__texts[guid]
+            paragraph = text.paragraphs[p]
+            start, end = paragraph.starts[t], paragraph.ends[t]
+            lines.append(ConcordanceLine(
+                text.name,
+                p,
+                paragraph.text[max(0, start - width):start],
+                paragraph.text[start:end],
+                paragraph.text[end:end + width]))
+        return lines
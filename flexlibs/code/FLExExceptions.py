@@ -0,0 +1,78 @@
+#
+#   FLExExceptions.py
+#
+#   Module: Exceptions raised by the flexlibs project classes.
+#
+#           These are kept separate from FLExProject so that the
+#           pure-Python modules (such as the .fwdata reader) can use
+#           them without loading Python.NET or the FieldWorks assemblies.
+#
+#   Platform: Python 3
+#
+#   Copyright Craig Farrow, 2008 - 2025
+#
+
+
+#--- Exceptions ------------------------------------------------------
+
+class FP_ProjectError(Exception):
+    """Exception raised for any problems opening the project.
+
+    Attributes:
+        - message -- explanation of the error
+    """
+
+    def __init__(self, message):
+        self.message = message
+
+class FP_FileNotFoundError(FP_ProjectError):
+    def __init__(self, projectName, e):
+        # Normally this will be a mispelled/wrong project name...
+        if projectName in str(e):
+            FP_ProjectError.__init__(self,
+                "Project file not found: %s" % projectName)
+        # ...however, it could be an internal FLEx error.
+        else:
+            FP_ProjectError.__init__(self,
+                "File not found error: %s" % e)
+
+class FP_FileLockedError(FP_ProjectError):
+    def __init__(self):
+        FP_ProjectError.__init__(self,
+            "This project is in use by another program. To allow shared access to this project, turn on the sharing option in the Sharing tab of the Fieldworks Project Properties dialog.")
+
+class FP_MigrationRequired(FP_ProjectError):
+    def __init__(self):
+        FP_ProjectError.__init__(self,
+            "This project needs to be opened in FieldWorks in order for it to be migrated to the latest format.")
+
+#-----------------------------------------------------
+
+class FP_RuntimeError(Exception):
+    """Exception raised for any problems running the module.
+
+    Attributes:
+        - message -- explanation of the error
+    """
+
+    def __init__(self, message):
+        self.message = message
+
+class FP_ReadOnlyError(FP_RuntimeError):
+    def __init__(self):
+        FP_RuntimeError.__init__(self,
+            "Trying to write to the project database without changes enabled.")
+
+class FP_WritingSystemError(FP_RuntimeError):
+    def __init__(self, writingSystemName):
+        FP_RuntimeError.__init__(self,
+            "Invalid Writing System for this project: %s" % writingSystemName)
+
+class FP_NullParameterError(FP_RuntimeError):
+    def __init__(self):
+        FP_RuntimeError.__init__(self,
+            "Null parameter.")
+
+class FP_ParameterError(FP_RuntimeError):
+    def __init__(self, msg):
+        FP_RuntimeError.__init__(self, msg)
@@ -0,0 +1,561 @@
+#
+#   FLExExport.py
+#
+#   Module: Export of a project to a normalised set of tables: as a
+#           read-only snapshot in an SQLite database, or as Apache
+#           Arrow tables or Parquet files.
+#
+#           ExportRows() walks the project and produces the rows of
+#           each table in turn, without collecting the objects or rows
+#           in lists. The rows are written in batches (SQLite inserts or
+#           Arrow record batches).
+#
+#           pyarrow is only needed for the Arrow and Parquet exports.
+#
+#           The export can be made from an FLExProject or an
+#           FWDataProject (or directly from a .fwdata file), so the
+#           snapshot can be taken while FieldWorks has the project open.
+#
+#   Platform: Python 3
+#
+#   Copyright Craig Farrow, 2025
+#
+
+import os
+import sqlite3
+import datetime
+import collections
+
+from .FLExExceptions import (
+    FP_ParameterError,
+    FP_RuntimeError,
+    )
+from .FLExCorpus import WordPattern
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+#--- Table definitions ----------------------------------------------
+
+# The columns of each table, with their SQL types. The first column of
+# the tables in PrimaryKeys is the guid of the object.
+Tables = collections.OrderedDict([
+    ("project",             [("key", "TEXT"),
+                             ("value", "TEXT")]),
+    ("entries",             [("guid", "TEXT"),
+                             ("headword", "TEXT"),
+                             ("date_modified", "TEXT")]),
+    ("senses",              [("guid", "TEXT"),
+                             ("entry_guid", "TEXT"),
+                             ("parent_guid", "TEXT"),
+                             ("position", "INTEGER"),
+                             ("gloss", "TEXT"),
+                             ("pos", "TEXT")]),
+    ("examples",            [("guid", "TEXT"),
+                             ("sense_guid", "TEXT"),
+                             ("position", "INTEGER")]),
+    ("allomorphs",          [("guid", "TEXT"),
+                             ("entry_guid", "TEXT"),
+                             ("position", "INTEGER"),
+                             ("is_lexeme_form", "INTEGER")]),
+    ("strings",             [("guid", "TEXT"),
+                             ("field", "TEXT"),
+                             ("ws", "TEXT"),
+                             ("text", "TEXT")]),
+    ("custom_fields",       [("guid", "TEXT"),
+                             ("field", "TEXT"),
+                             ("value", "TEXT")]),
+    ("reversal_entries",    [("guid", "TEXT"),
+                             ("ws", "TEXT"),
+                             ("parent_guid", "TEXT"),
+                             ("form", "TEXT")]),
+    ("reversal_senses",     [("reversal_guid", "TEXT"),
+                             ("sense_guid", "TEXT")]),
+    ("possibility_lists",   [("guid", "TEXT"),
+                             ("name", "TEXT")]),
+    ("possibilities",       [("guid", "TEXT"),
+                             ("list_guid", "TEXT"),
+                             ("parent_guid", "TEXT"),
+                             ("class", "TEXT"),
+                             ("name", "TEXT"),
+                             ("abbreviation", "TEXT")]),
+    ("texts",               [("guid", "TEXT"),
+                             ("name", "TEXT")]),
+    ("paragraphs",          [("text_guid", "TEXT"),
+                             ("position", "INTEGER"),
+                             ("contents", "TEXT")]),
+    ("words",               [("text_guid", "TEXT"),
+                             ("paragraph", "INTEGER"),
+                             ("position", "INTEGER"),
+                             ("ws", "TEXT"),
+                             ("word", "TEXT")]),
+    ])
+
+PrimaryKeys = {"entries", "senses", "examples", "allomorphs",
+               "reversal_entries", "possibility_lists", "possibilities",
+               "texts"}
+
+Indexes = [
+    ("entries",             ["headword"]),
+    ("senses",              ["entry_guid"]),
+    ("senses",              ["gloss"]),
+    ("examples",            ["sense_guid"]),
+    ("allomorphs",          ["entry_guid"]),
+    ("strings",             ["guid"]),
+    ("strings",             ["field", "text"]),
+    ("custom_fields",       ["guid"]),
+    ("reversal_entries",    ["form"]),
+    ("reversal_senses",     ["sense_guid"]),
+    ("possibilities",       ["list_guid"]),
+    ("paragraphs",          ["text_guid"]),
+    ("words",               ["word"]),
+    ]
+
+# The multi-string fields that are exported to the strings table
+EntryStrings        = ("CitationForm",)
+SenseStrings        = ("Gloss", "Definition")
+ExampleStrings      = ("Example",)
+AllomorphStrings    = ("Form",)
+
+
+#--------------------------------------------------------------------
+
+def _CustomFieldValue(project, obj, fieldID):
+    value = project.GetCustomFieldValue(obj, fieldID)
+    if isinstance(value, list):
+        return "; ".join(value)
+    value = getattr(value, "Text", value)   # ITsString in LCM
+    if value is None or value == "***":
+        return ""
+    return str(value)
+
+
+def ExportRows(project, tables=None):
+    """
+    A generator over all the rows to export from an open `FLExProject`
+    or `FWDataProject`, as (`tableName`, `row`) tuples, where `row` is a
+    tuple of the values for the columns in `Tables[tableName]`.
+    `tables` is an optional list of the table names to export; the
+    parts of the project that aren't needed for them are skipped.
+
+    The rows for each table are produced together (in the order of
+    `Tables`), except for the strings, custom_fields and reversal_senses
+    tables, which are produced along with the objects they belong to.
+
+    Each table is produced in one pass over the objects, without
+    holding them in lists. An `FWDataProject` loads all the objects of
+    each part of the project (the lexicon and reversals, the lists, and
+    the texts) while it is exported, and those that the export loaded
+    are unloaded after each part.
+    """
+
+    def Wanted(*names):
+        return not tables or any(name in tables for name in names)
+
+    loadedBefore = None
+    if getattr(project, "UnloadClasses", None):
+        loadedBefore = project.LoadedClasses()
+
+    def Release():
+        if loadedBefore is not None:
+            project.UnloadClasses(project.LoadedClasses() - loadedBefore)
+
+    if Wanted("project"):
+        yield ("project", ("ProjectName", project.ProjectName()))
+        yield ("project", ("DateLastModified", str(project.GetDateLastModified())))
+        yield ("project", ("Exported", datetime.datetime.now(
+                                            datetime.timezone.utc).isoformat()))
+
+    wantStrings = Wanted("strings")
+    wantCustomFields = Wanted("custom_fields")
+
+    def Strings(obj, fields):
+        if not wantStrings:
+            return
+        guid = str(obj.Guid)
+        for field in fields:
+            for ws, text in project.StrAlternatives(getattr(obj, field)).items():
+                yield ("strings", (guid, field, ws, text))
+
+    customFields = {}
+
+    def CustomFields(obj, table):
+        if not wantCustomFields:
+            return
+        if table not in customFields:
+            customFields[table] = list({
+                "entries"   : project.LexiconGetEntryCustomFields,
+                "senses"    : project.LexiconGetSenseCustomFields,
+                "examples"  : project.LexiconGetExampleCustomFields,
+                "allomorphs": project.LexiconGetAllomorphCustomFields,
+                }[table]())
+        guid = str(obj.Guid)
+        for fieldID, label in list(customFields[table]):
+            try:
+                value = _CustomFieldValue(project, obj, fieldID)
+            except FP_ParameterError:
+                # An unsupported field type: don't try it again.
+                logger.info("ExportRows: skipping custom field %s" % label)
+                customFields[table].remove((fieldID, label))
+                continue
+            if value:
+                yield ("custom_fields", (guid, label, value))
+
+    wantObjects = ("strings", "custom_fields")
+
+    # --- Lexicon ---
+
+    if Wanted("entries", *wantObjects):
+        wantRows = Wanted("entries")
+        for entry in project.LexiconAllEntries():
+            if wantRows:
+                dateModified = project.DateModified(entry)
+                yield ("entries", (str(entry.Guid),
+                                   project.LexiconGetHeadword(entry),
+                                   dateModified.isoformat() if dateModified else None))
+            yield from Strings(entry, EntryStrings)
+            yield from CustomFields(entry, "entries")
+
+    if Wanted("senses", *wantObjects):
+        wantRows = Wanted("senses")
+        def Senses(senses, entryGuid, parentGuid):
+            for position, sense in enumerate(senses):
+                if wantRows:
+                    yield ("senses", (str(sense.Guid),
+                                      entryGuid,
+                                      parentGuid,
+                                      position,
+                                      project.LexiconGetSenseGloss(sense),
+                                      project.LexiconGetSensePOS(sense)))
+                yield from Strings(sense, SenseStrings)
+                yield from CustomFields(sense, "senses")
+                yield from Senses(sense.SensesOS, entryGuid, str(sense.Guid))
+
+        for entry in project.LexiconAllEntries():
+            yield from Senses(entry.SensesOS, str(entry.Guid), None)
+
+    def AllSenses(senses):
+        for sense in senses:
+            yield sense
+            yield from AllSenses(sense.SensesOS)
+
+    if Wanted("examples", *wantObjects):
+        wantRows = Wanted("examples")
+        for entry in project.LexiconAllEntries():
+            for sense in AllSenses(entry.SensesOS):
+                for position, example in enumerate(sense.ExamplesOS):
+                    if wantRows:
+                        yield ("examples", (str(example.Guid), str(sense.Guid),
+                                            position))
+                    yield from Strings(example, ExampleStrings)
+                    if wantStrings:
+                        for translation in example.TranslationsOC:
+                            for ws, text in project.StrAlternatives(
+                                                translation.Translation).items():
+                                yield ("strings", (str(example.Guid),
+                                                   "Translation", ws, text))
+                    yield from CustomFields(example, "examples")
+
+    if Wanted("allomorphs", *wantObjects):
+        wantRows = Wanted("allomorphs")
+        for entry in project.LexiconAllEntries():
+            allomorphs = [(entry.LexemeFormOA, 1)] if entry.LexemeFormOA else []
+            allomorphs += [(allomorph, 0) for allomorph in entry.AlternateFormsOS]
+            for position, (allomorph, isLexemeForm) in enumerate(allomorphs):
+                if wantRows:
+                    yield ("allomorphs", (str(allomorph.Guid),
+                                          str(entry.Guid),
+                                          position,
+                                          isLexemeForm))
+                yield from Strings(allomorph, AllomorphStrings)
+                yield from CustomFields(allomorph, "allomorphs")
+
+    # --- Reversal indexes ---
+
+    if Wanted("reversal_entries", "reversal_senses"):
+        wantEntries = Wanted("reversal_entries")
+        wantSenses = Wanted("reversal_senses")
+        def ReversalEntries(reversalEntries, ws, parentGuid):
+            for reversalEntry in reversalEntries:
+                guid = str(reversalEntry.Guid)
+                if wantEntries:
+                    yield ("reversal_entries",
+                           (guid,
+                            ws,
+                            parentGuid,
+                            project.ReversalGetForm(reversalEntry, ws)))
+                if wantSenses:
+                    for sense in reversalEntry.SensesRS:
+                        yield ("reversal_senses", (guid, str(sense.Guid)))
+                yield from ReversalEntries(reversalEntry.SubentriesOS, ws, guid)
+
+        for ws in project.GetAllAnalysisWSs():
+            reversalEntries = project.ReversalEntries(ws)
+            if reversalEntries:
+                yield from ReversalEntries(reversalEntries, ws, None)
+
+    # The reversal senses refer to the lexicon, so it is released after
+    # the reversals.
+    Release()
+
+    # --- Possibility lists ---
+
+    if Wanted("possibility_lists", "possibilities"):
+        listGuids = {}          # owner guid -> list guid
+        for possibilityList in project.ObjectsIn("CmPossibilityList"):
+            guid = str(possibilityList.Guid)
+            listGuids[guid] = guid
+            if Wanted("possibility_lists"):
+                yield ("possibility_lists",
+                       (guid, project.BestStr(possibilityList.Name)))
+
+        def ListGuid(owner):
+            guid = str(owner.Guid)
+            if guid not in listGuids:
+                listGuids[guid] = ListGuid(owner.Owner) if owner.Owner else None
+            return listGuids[guid]
+
+        if Wanted("possibilities"):
+            for possibility in project.ObjectsIn("CmPossibility"):
+                owner = possibility.Owner
+                listGuid = ListGuid(owner)
+                ownerGuid = str(owner.Guid)
+                yield ("possibilities",
+                       (str(possibility.Guid),
+                        listGuid,
+                        ownerGuid if ownerGuid != listGuid else None,
+                        possibility.ClassName,
+                        project.BestStr(possibility.Name),
+                        project.BestStr(possibility.Abbreviation)))
+        del listGuids
+        Release()
+
+    # --- Texts ---
+
+    if Wanted("texts", "paragraphs", "words"):
+        wantTexts = Wanted("texts")
+        wantParagraphs = Wanted("paragraphs")
+        wantWords = Wanted("words")
+        for text in project.ObjectsIn("Text"):
+            guid = str(text.Guid)
+            if wantTexts:
+                yield ("texts", (guid, project.BestStr(text.Name)))
+            if not (wantParagraphs or wantWords):
+                continue
+            for paragraph, runs in enumerate(project.TextsGetParagraphRuns(text)):
+                if wantParagraphs:
+                    yield ("paragraphs", (guid, paragraph,
+                                          "".join(runText for ws, runText in runs)))
+                if wantWords:
+                    position = 0
+                    for ws, runText in runs:
+                        for match in WordPattern.finditer(runText):
+                            yield ("words", (guid, paragraph, position, ws,
+                                             match.group()))
+                            position += 1
+        Release()
+
+
+#--------------------------------------------------------------------
+
+def _OpenProject(project):
+    # Returns (project, opened), opening a .fwdata file if necessary.
+    if isinstance(project, str):
+        from .FLExFWData import FWDataProject
+        fwdata = FWDataProject()
+        fwdata.OpenProject(project)
+        return fwdata, True
+    return project, False
+
+
+def ExportToSQLite(project, fileName, batchSize=1000):
+    """
+    Exports a snapshot of the project to an SQLite database in
+    `fileName` (see `Tables` for the schema). `project` is an open
+    `FLExProject` or `FWDataProject`, or the path of a .fwdata file.
+
+    The database is built in a temporary file, which replaces
+    `fileName` when it is complete. Rows are inserted in batches of
+    `batchSize`. Returns a dictionary of table name to number of rows.
+
+    Usage::
+
+        ExportToSQLite(project, "snapshot.db")
+
+        db = sqlite3.connect("snapshot.db")
+        for headword, gloss in db.execute(
+                "SELECT headword, gloss FROM entries "
+                "JOIN senses ON senses.entry_guid = entries.guid "
+                "WHERE gloss LIKE ?", ("eat%",)):
+            ...
+    """
+    project, opened = _OpenProject(project)
+
+    tempName = fileName + ".tmp"
+    if os.path.exists(tempName):
+        os.remove(tempName)
+    db = sqlite3.connect(tempName)
+    try:
+        db.execute("PRAGMA journal_mode = OFF")
+        db.execute("PRAGMA synchronous = OFF")
+        inserts = {}
+        for table, columns in Tables.items():
+            columnDefs = ["%s %s" % column for column in columns]
+            if table in PrimaryKeys:
+                columnDefs[0] += " PRIMARY KEY"
+            db.execute("CREATE TABLE %s (%s)" % (table, ", ".join(columnDefs)))
+            inserts[table] = "INSERT INTO %s VALUES (%s)" \
+                             % (table, ", ".join("?" * len(columns)))
+
+        counts = collections.Counter()
+        batches = collections.defaultdict(list)
+        for table, row in ExportRows(project):
+            batch = batches[table]
+            batch.append(row)
+            if len(batch) >= batchSize:
+                db.executemany(inserts[table], batch)
+                counts[table] += len(batch)
+                batch.clear()
+        for table, batch in batches.items():
+            db.executemany(inserts[table], batch)
+            counts[table] += len(batch)
+
+        for table, columns in Indexes:
+            db.execute("CREATE INDEX %s_%s ON %s (%s)"
+                       % (table, "_".join(columns), table, ", ".join(columns)))
+        db.commit()
+    finally:
+        db.close()
+        if opened:
+            project.CloseProject()
+
+    os.replace(tempName, fileName)
+    logger.info("ExportToSQLite: %d rows written to %s"
+                % (sum(counts.values()), fileName))
+    return {table: counts[table] for table in Tables}
+
+
+#--- Arrow and Parquet ----------------------------------------------
+
+def _ImportPyArrow(function):
+    try:
+        import pyarrow
+    except ImportError:
+        raise FP_RuntimeError("%s requires pyarrow" % function) from None
+    return pyarrow
+
+
+def ArrowSchemas():
+    """
+    Returns a dictionary of table name to `pyarrow.Schema` for the
+    tables in `Tables`.
+    """
+    pa = _ImportPyArrow("ArrowSchemas")
+    types = {"TEXT": pa.string(), "INTEGER": pa.int64()}
+    return {table: pa.schema([(column, types[sqlType])
+                              for column, sqlType in columns])
+            for table, columns in Tables.items()}
+
+
+def ExportRecordBatches(project, batchSize=10000, tables=None):
+    """
+    A generator over the rows from `ExportRows()` as (`tableName`,
+    `pyarrow.RecordBatch`) tuples of up to `batchSize` rows.
+    `tables` is an optional list of the table names to export.
+    Raises `FP_RuntimeError` if pyarrow is not installed.
+    """
+    pa = _ImportPyArrow("ExportRecordBatches")
+    schemas = ArrowSchemas()
+
+    def RecordBatch(table, rows):
+        schema = schemas[table]
+        columns = zip(*rows)
+        return pa.RecordBatch.from_arrays(
+                    [pa.array(column, type=field.type)
+                     for column, field in zip(columns, schema)],
+                    schema=schema)
+
+    batches = collections.defaultdict(list)
+    for table, row in ExportRows(project, tables):
+        batch = batches[table]
+        batch.append(row)
+        if len(batch) >= batchSize:
+            yield table, RecordBatch(table, batch)
+            batch.clear()
+    for table, batch in batches.items():
+        if batch:
+            yield table, RecordBatch(table, batch)
+
+
+def ExportToArrow(project, tables=None):
+    """
+    Returns a dictionary of table name to `pyarrow.Table` for the
+    project (see `Tables` for the schema). `project` is an open
+    `FLExProject` or `FWDataProject`, or the path of a .fwdata file.
+    `tables` is an optional list of the table names to export.
+    Raises `FP_RuntimeError` if pyarrow is not installed.
+
+    Use `ExportToParquet()` for large projects, since it doesn't
+    hold the tables in memory.
+    """
+    pa = _ImportPyArrow("ExportToArrow")
+    project, opened = _OpenProject(project)
+    try:
+        batches = collections.defaultdict(list)
+        for table, batch in ExportRecordBatches(project, tables=tables):
+            batches[table].append(batch)
+    finally:
+        if opened:
+            project.CloseProject()
+
+    schemas = ArrowSchemas()
+    return {table: pa.Table.from_batches(batches[table], schemas[table])
+            for table in Tables
+            if not tables or table in tables}
+
+
+def ExportToParquet(project, directory, batchSize=10000, tables=None):
+    """
+    Exports the project to a Parquet file for each table (e.g. 
+    "senses.parquet") in `directory`. `project` is an open 
+    `FLExProject` or `FWDataProject`, or the path of a .fwdata file.
+    The rows are written in record batches of `batchSize` as they are
+    produced, so the tables aren't held in memory (but see
+    `ExportRows()` for the objects that an `FWDataProject` loads).
+    `tables` is an optional list of the table names to export.
+    Returns a dictionary of table name to number of rows.
+    Raises `FP_RuntimeError` if pyarrow is not installed.
+
+    Usage::
+
+        ExportToParquet(project, "export")
+
+        senses = pandas.read_parquet("export/senses.parquet")
+    """
+    _ImportPyArrow("ExportToParquet")
+    import pyarrow.parquet as pq
+
+    project, opened = _OpenProject(project)
+    os.makedirs(directory, exist_ok=True)
+    schemas = ArrowSchemas()
+    writers = {}
+    counts = collections.Counter()
+    try:
+        for table in Tables:
+            if not tables or table in tables:
+                writers[table] = pq.ParquetWriter(
+                                    os.path.join(directory, table + ".parquet"),
+                                    schemas[table])
+        for table, batch in ExportRecordBatches(project, batchSize, tables):
+            writers[table].write_batch(batch)
+            counts[table] += batch.num_rows
+    finally:
+        for writer in writers.values():
+            writer.close()
+        if opened:
+            project.CloseProject()
+
+    logger.info("ExportToParquet: %d rows written to %s"
+                % (sum(counts.values()), directory))
+    return {table: counts[table] for table in writers}
@@ -0,0 +1,1574 @@
+#
+#   FLExFWData.py
+#
+#   Module: Read-only access to a FieldWorks project directly from its
+#           .fwdata XML file, without using LCM.
+#
+#           The .fwdata file is streamed one <rt> record at a time, and
+#           only the classes of object needed to answer a query are
+#           kept in memory. FieldWorks and Python.NET are not needed, so
+#           this module can be used on any platform.
+#
+#   Platform: Python 3
+#
+#   Copyright Craig Farrow, 2025
+#
+
+import os
+import re
+import mmap
+import datetime
+import itertools
+import collections
+import xml.etree.ElementTree as ET
+
+from .FLExExceptions import (
+    FP_FileNotFoundError,
+    FP_NullParameterError,
+    FP_ParameterError,
+    FP_RuntimeError,
+    FP_WritingSystemError,
+    )
+from .FLExBackup import FWBackup, IsBackupFile
+from .FLExSort import SortKeyCache, SortKeyFunction
+from . import FLExSearch
+from .FLExSemanticDomains import SemanticDomainTree
+from .FLExCorpus import Corpus
+from .FLExReversals import ReversalRegistry
+from .FLExPublications import PublicationMembership
+from .FLExRelations import RelationGraph
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+#--- Globals --------------------------------------------------------
+
+FWDataFileExtension = ".fwdata"
+
+# The classes that are loaded together to serve the lexicon functions.
+LexiconClasses = {
+    "LexEntry",
+    "LexSense",
+    "LexExampleSentence",
+    "CmTranslation",
+    "LexPronunciation",
+    "MoStemAllomorph",
+    "MoAffixAllomorph",
+    "MoAffixProcess",
+    "MoStemMsa",
+    "MoInflAffMsa",
+    "MoDerivAffMsa",
+    "MoUnclassifiedAffixMsa",
+    "MoMorphType",
+    "PartOfSpeech",
+    }
+
+TextClasses = {
+    "Text",
+    "StText",
+    "StTxtPara",
+    }
+
+RelationClasses = {
+    "CmPossibilityList",
+    "LexRefType",
+    "LexReference",
+    }
+
+ReversalClasses = {
+    "ReversalIndex",
+    "ReversalIndexEntry",
+    }
+
+# Subclasses that are included with their base class by ObjectsIn()
+# and ObjectCountFor(), as they are in the LCM repositories.
+SubClasses = {
+    "CmPossibility" : {
+        "CmAnnotationDefn",
+        "CmAnthroItem",
+        "CmCustomItem",
+        "CmLocation",
+        "CmPerson",
+        "CmSemanticDomain",
+        "ChkTerm",
+        "LexEntryInflType",
+        "LexEntryType",
+        "LexRefType",
+        "MoMorphType",
+        "PartOfSpeech",
+        "PhPhonRuleFeat",
+        },
+    }
+
+# The first line of each record, e.g.:
+#   <rt class="LexSense" guid="..." ownerguid="...">
+RtHeader = re.compile(rb'<rt class="([^"]+)" guid="([^"]+)"(?: ownerguid="([^"]+)")?')
+RtClass = re.compile(rb'<rt class="([^"]+)"')
+
+
+#--- Field values ---------------------------------------------------
+
+class FWDataStr(str):
+    """
+    A string value from a `Str` or `AStr` element. This is a normal
+    `str`, with the writing system of each run recorded in `Runs`,
+    a list of (language-tag, text) tuples.
+    """
+    def __new__(cls, runs):
+        s = str.__new__(cls, "".join(text for ws, text in runs))
+        s.Runs = runs
+        return s
+
+
+def _TsString(elem):
+    return FWDataStr([(run.get("ws"), run.text or "")
+                      for run in elem.iter("Run")])
+
+
+def _ConvertVal(val):
+    if val == "True":
+        return True
+    if val == "False":
+        return False
+    try:
+        return int(val)
+    except ValueError:
+        return val
+
+
+def _FieldValue(elem):
+    """
+    Converts a field element to a Python value:
+        - `val` attributes are converted to `bool`, `int` or `str`.
+        - `Uni` is a `str` and `Str` is an `FWDataStr`.
+        - `AUni` and `AStr` alternatives are a dictionary of
+          language-tag to string.
+        - Object references (`objsur`) are a list of guids.
+    Other structures (such as `Binary` and `Prop`) are left as
+    `ElementTree` elements.
+    """
+    val = elem.get("val")
+    if val is not None:
+        return _ConvertVal(val)
+
+    children = list(elem)
+    if not children:
+        return elem.text
+
+    tag = children[0].tag
+    if tag == "objsur":
+        return [c.get("guid") for c in children]
+    if tag == "AUni":
+        return {c.get("ws"): c.text or "" for c in children}
+    if tag == "AStr":
+        return {c.get("ws"): _TsString(c) for c in children}
+    if tag == "Str":
+        return _TsString(children[0])
+    if tag == "Uni":
+        return children[0].text or ""
+    return elem
+
+
+def ParseDateTime(value):
+    """
+    Converts a date/time from a .fwdata file (e.g. "2022-6-15 0:29:5.504")
+    to a `datetime.datetime`. FieldWorks stores these times in UTC.
+    """
+    date, time = value.split(" ")
+    year, month, day = date.split("-")
+    hours, minutes, seconds = time.split(":")
+    seconds, _, fraction = seconds.partition(".")
+    return datetime.datetime(int(year), int(month), int(day),
+                             int(hours), int(minutes), int(seconds),
+                             int(fraction.ljust(6, "0")[:6]))
+
+
+def _ParseHeader(line):
+    # Returns (className, guid, ownerGuid) from the first line of a record
+    m = RtHeader.match(line)
+    ownerGuid = m.group(3).decode("ascii").lower() if m.group(3) else None
+    return (m.group(1).decode("ascii"),
+            m.group(2).decode("ascii").lower(),
+            ownerGuid)
+
+
+def _NormaliseGuid(guid):
+    return str(guid).strip("{}").lower()
+
+
+def _NormaliseLangTag(languageTag):
+    return languageTag.replace("-", "_").lower()
+
+
+#--- Objects --------------------------------------------------------
+
+class FWDataObject(object):
+    """
+    An object (`rt` record) read from a .fwdata file.
+
+    Attributes:
+        - `ClassName`   - the LCM class name, e.g. "LexEntry"
+        - `Guid`        - the guid (`str`)
+        - `OwnerGuid`   - the guid of the owning object, or `None`
+        - `Fields`      - a dictionary of field name to value. Custom
+                          fields are stored under their internal name.
+
+    Field values can also be read as attributes, and object references
+    can be followed using the LCM suffixes. E.g.::
+
+        entry.HomographNumber           # int
+        entry.CitationForm              # {language-tag: str}
+        entry.LexemeFormOA              # FWDataObject or None
+        entry.SensesOS                  # list of FWDataObject
+
+    Fields that aren't present in the record are `None`.
+    """
+
+    __slots__ = ("ClassName", "Guid", "OwnerGuid", "Fields", "_project")
+
+    def __init__(self, className, guid, ownerGuid, fields, project=None):
+        self.ClassName = className
+        self.Guid = guid
+        self.OwnerGuid = ownerGuid
+        self.Fields = fields
+        self._project = project
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        fields = self.Fields
+        try:
+            return fields[name]
+        except KeyError:
+            pass
+
+        fieldName, suffix = name[:-2], name[-2:]
+        if suffix in ("OA", "RA"):
+            guids = fields.get(fieldName)
+            return self.__Resolve(guids[0]) if guids else None
+        if suffix in ("OS", "OC", "RS", "RC"):
+            return [self.__Resolve(g) for g in fields.get(fieldName, ())]
+        return None
+
+    def __Resolve(self, guid):
+        if self._project is None:
+            raise FP_RuntimeError("FWDataObject is not attached to an FWDataProject")
+        return self._project.Object(guid)
+
+    @property
+    def Owner(self):
+        if self.OwnerGuid:
+            return self.__Resolve(self.OwnerGuid)
+        return None
+
+    def __repr__(self):
+        return "<FWDataObject %s %s>" % (self.ClassName, self.Guid)
+
+
+#--- Object counts --------------------------------------------------
+
+def FWDataClassCounts(fileName, classNames=None):
+    """
+    Returns a dictionary of class name to the number of objects of that
+    class in the .fwdata file. If `classNames` is given, then only those
+    classes are counted.
+
+    The file is memory-mapped and searched for the `<rt>` tags directly,
+    without decoding or parsing the XML, so this is much faster than
+    opening the project.
+    """
+    with open(fileName, "rb") as f:
+        try:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty file
+            return {}
+
+    with buf:
+        if classNames is None:
+            counts = collections.Counter(m.group(1) for m in RtClass.finditer(buf))
+            return {className.decode("ascii"): count
+                    for className, count in counts.items()}
+
+        counts = {}
+        for className in classNames:
+            tag = b'<rt class="%s"' % className.encode("ascii")
+            count = 0
+            pos = buf.find(tag)
+            while pos >= 0:
+                count += 1
+                pos = buf.find(tag, pos + len(tag))
+            counts[className] = count
+        return counts
+
+
+#--- Reader ---------------------------------------------------------
+
+class FWDataReader(object):
+    """
+    Streams the records from a .fwdata file.
+
+    The file is read line by line; only the records that are requested
+    are parsed, one at a time, so memory use doesn't depend on the size
+    of the project. (FieldWorks writes each `<rt>` start and end tag at
+    the start of a line.)
+    """
+
+    def __init__(self, fileName, opener=None):
+        # `opener` is an optional function that returns a binary file
+        # object for the data (e.g. to stream it from a backup file).
+        self.fileName = fileName
+        self.__opener = opener
+
+    def __Open(self):
+        if self.__opener:
+            return self.__opener()
+        return open(self.fileName, "rb")
+
+
+    def CustomFields(self):
+        """
+        Returns a list of the custom field definitions in the file. Each
+        item is a dictionary of the `CustomField` attributes: `class`,
+        `name`, `label`, `type`, etc.
+        """
+        block = []
+        with self.__Open() as f:
+            for line in f:
+                if line.startswith(b"<rt "):
+                    break
+                if block or line.startswith(b"<AdditionalFields"):
+                    block.append(line)
+                    if line.startswith(b"</AdditionalFields>"):
+                        break
+        if not block:
+            return []
+        return [dict(cf.attrib)
+                for cf in ET.fromstring(b"".join(block)).iter("CustomField")]
+
+
+    def RawRecords(self, classNames=None, guids=None):
+        """
+        Generator over the unparsed records in the file. Yields tuples of
+        (offset, className, guid, ownerGuid, data), where `data` is the
+        bytes of the whole `<rt>` element.
+
+        Only records whose class is in `classNames` and guid is in
+        `guids` are returned. `None` matches any class or guid.
+        """
+        record = None
+        offset = 0
+        with self.__Open() as f:
+            for line in f:
+                if record is not None:
+                    record.append(line)
+                    if line.startswith(b"</rt>"):
+                        yield (start, className, guid, ownerGuid,
+                               b"".join(record))
+                        record = None
+
+                elif line.startswith(b"<rt "):
+                    className, guid, ownerGuid = _ParseHeader(line)
+                    if (classNames is None or className in classNames) and \
+                       (guids is None or guid in guids):
+                        if line.rstrip().endswith(b"/>"):
+                            yield (offset, className, guid, ownerGuid, line)
+                        else:
+                            start = offset
+                            record = [line]
+
+                offset += len(line)
+
+
+    def RecordLocations(self):
+        """
+        Generator over all the records in the file without reading their
+        contents. Yields tuples of
+        (offset, length, className, guid, ownerGuid).
+        """
+        start = None
+        offset = 0
+        with self.__Open() as f:
+            for line in f:
+                if start is not None:
+                    if line.startswith(b"</rt>"):
+                        yield (start, offset + len(line) - start,
+                               className, guid, ownerGuid)
+                        start = None
+
+                elif line.startswith(b"<rt "):
+                    className, guid, ownerGuid = _ParseHeader(line)
+                    if line.rstrip().endswith(b"/>"):
+                        yield (offset, len(line), className, guid, ownerGuid)
+                    else:
+                        start = offset
+
+                offset += len(line)
+
+
+    def Records(self, classNames=None, guids=None, project=None):
+        """
+        Generator over the records in the file as `FWDataObject`s.
+        `classNames` and `guids` filter the records as for `RawRecords()`.
+        """
+        for offset, className, guid, ownerGuid, data in \
+                self.RawRecords(classNames, guids):
+            yield MakeObject(className, guid, ownerGuid, data, project)
+
+
+def MakeObject(className, guid, ownerGuid, data, project=None):
+    """
+    Parses the bytes of an `<rt>` element into an `FWDataObject`.
+    """
+    fields = {}
+    for elem in ET.fromstring(data):
+        if elem.tag == "Custom":
+            fields[elem.get("name")] = _FieldValue(elem)
+        else:
+            fields[elem.tag] = _FieldValue(elem)
+    return FWDataObject(className, guid, ownerGuid, fields, project)
+
+
+#--- Project --------------------------------------------------------
+
+class FWDataProject(object):
+    """
+    This class provides read-only access to a FieldWorks project by
+    reading the .fwdata file directly. It doesn't need FieldWorks,
+    Python.NET or `FLExInitialize()`.
+
+    The methods mirror the read functions of `FLExProject`, so that
+    reporting code can use either class. The differences are:
+
+        - Objects are `FWDataObject`s rather than LCM objects.
+        - Writing systems are specified by language tag only (there are
+          no handles), and writing system names are the language tags.
+        - Field IDs for custom fields are the internal field names.
+        - Repositories are given by class name, e.g. "LexEntry" (or
+          "ILexEntryRepository").
+
+    Objects are loaded on demand: e.g. `LexiconAllEntries()` loads
+    only the lexicon objects, and `TextsGetAll()` only the texts.
+
+    Usage::
+
+        project = FWDataProject()
+        project.OpenProject(r"C:\\ProgramData\\SIL\\FieldWorks\\Projects\\my project\\my project.fwdata")
+
+        for lexEntry in project.LexiconAllEntries():
+            headword = project.LexiconGetHeadword(lexEntry)
+            for sense in lexEntry.SensesOS:
+                gloss = project.LexiconGetSenseGloss(sense)
+
+        project.CloseProject()
+    """
+
+    def OpenProject(self,
+                    projectName,
+                    writeEnabled = False,
+                    projectsDir = None,
+                    useIndex = False):
+        """
+        Open a project for reading.
+
+        projectName:
+            - Either the full path including ".fwdata" suffix, or
+            - The full path of a backup file (".fwbackup"), which is
+              read directly from the archive, or
+            - The name only, to open from `projectsDir`.
+
+        writeEnabled:
+            Must be `False`: this class can't change the project.
+
+        useIndex:
+            Use an `FWDataIndex` (saved alongside the .fwdata file) so
+            that objects are read by seeking to their records rather
+            than by scanning the file. The index is built on first use,
+            and rebuilt whenever the .fwdata file changes. (Not 
+            supported for backup files.)
+        """
+
+        if writeEnabled:
+            raise FP_ParameterError("FWDataProject is read-only: writeEnabled must be False")
+
+        self.backup = None
+        if IsBackupFile(projectName):
+            if useIndex:
+                raise FP_ParameterError("useIndex isn't supported for backup files")
+            self.backup = FWBackup(projectName)
+            fileName = projectName
+        elif projectName.lower().endswith(FWDataFileExtension):
+            fileName = projectName
+        elif projectsDir:
+            fileName = os.path.join(projectsDir, projectName,
+                                    projectName + FWDataFileExtension)
+        else:
+            fileName = projectName + FWDataFileExtension
+
+        if not os.path.isfile(fileName):
+            raise FP_FileNotFoundError(projectName, fileName)
+
+        self.fileName = fileName
+        if self.backup:
+            self.reader = FWDataReader(fileName, self.backup.OpenData)
+        else:
+            self.reader = FWDataReader(fileName)
+        if useIndex:
+            from .FLExFWDataIndex import FWDataIndex
+            self.index = FWDataIndex(fileName)
+        else:
+            self.index = None
+
+        self.__objects = {}         # guid -> FWDataObject
+        self.__byClass = {}         # class name -> [FWDataObject]
+        self.__customFields = None
+        self.__wsTags = None
+        self.__counts = None
+        self.__sortKeyCaches = {}   # ws -> SortKeyCache
+        self.__domainTree = None
+        self.__reversals = None
+        self.__publications = None
+        self.__relationGraph = None
+
+
+    def CloseProject(self):
+        """
+        Release the loaded objects.
+        """
+        if hasattr(self, "reader"):
+            del self.reader
+            if self.index:
+                self.index.Close()
+            self.index = None
+            if self.backup:
+                self.backup.Close()
+            self.backup = None
+            self.__objects = {}
+            self.__byClass = {}
+
+
+    def LoadedClasses(self):
+        """
+        Returns the set of the class names whose objects are loaded.
+        """
+        return set(self.__byClass)
+
+
+    def UnloadClasses(self, classNames):
+        """
+        Releases the loaded objects of the given classes (they are read
+        again when they are next needed), and the tables built from 
+        them (e.g. `ReversalRegistry()`). The LangProject and LexDb 
+        are kept.
+        """
+        classNames = set(classNames) - {"LangProject", "LexDb"}
+        if not classNames:
+            return
+        logger.debug("FWDataProject: unloading %s" % ", ".join(sorted(classNames)))
+        for className in classNames:
+            self.__byClass.pop(className, None)
+        self.__objects = {guid: obj for guid, obj in self.__objects.items()
+                          if obj.ClassName not in classNames}
+        self.__sortKeyCaches = {}
+        self.__domainTree = None
+        self.__reversals = None
+        self.__publications = None
+        self.__relationGraph = None
+
+
+    #  Private loading functions
+
+    def __Load(self, classNames):
+        """
+        Loads all the objects of the given classes in one pass over the
+        file. The LangProject and LexDb are always loaded on the first
+        pass since many functions need them.
+        """
+        needed = set(classNames) - set(self.__byClass)
+        if not needed:
+            return
+        needed.update({"LangProject", "LexDb"} - set(self.__byClass))
+
+        logger.debug("FWDataProject: loading %s" % ", ".join(sorted(needed)))
+        for className in needed:
+            self.__byClass[className] = []
+        for obj in self.__Records(needed):
+            obj = self.__objects.setdefault(obj.Guid, obj)
+            self.__byClass[obj.ClassName].append(obj)
+
+    def __Records(self, classNames):
+        if not self.index:
+            return self.reader.Records(classNames=classNames, project=self)
+
+        # Seek to each record in file order
+        locations = []
+        for className in classNames:
+            for guid, offset, length, ownerGuid in \
+                    self.index.RecordsOfClass(className):
+                locations.append((offset, length, className, guid, ownerGuid))
+        locations.sort()
+        return (MakeObject(className, guid, ownerGuid,
+                           self.index.ReadAt(offset, length), self)
+                for offset, length, className, guid, ownerGuid in locations)
+
+
+    def __ClassName(self, repository):
+        # Accept the class name, or an LCM repository name
+        if not isinstance(repository, str):
+            repository = repository.__name__
+        if repository.startswith("I") and repository.endswith("Repository"):
+            return repository[1:-len("Repository")]
+        return repository
+
+    def __ClassNames(self, repository):
+        # The class and its subclasses
+        className = self.__ClassName(repository)
+        return [className] + sorted(SubClasses.get(className, ()))
+
+    @property
+    def lp(self):
+        """
+        The `LangProject` object.
+        """
+        self.__Load({"LangProject"})
+        return self.__byClass["LangProject"][0]
+
+    @property
+    def lexDB(self):
+        """
+        The `LexDb` object.
+        """
+        self.__Load({"LexDb"})
+        return self.__byClass["LexDb"][0]
+
+
+    # --- General ---
+
+    def ProjectName(self):
+        """
+        Returns the name of the current project.
+        """
+        if self.backup:
+            return self.backup.projectName
+        return os.path.splitext(os.path.basename(self.fileName))[0]
+
+
+    # --- String Utilities ---
+
+    def BestStr(self, stringObj):
+        """
+        Generic string function for MultiUnicode and MultiString
+        values (dictionaries), returning the best analysis or vernacular
+        string. A missing (`None`) value is treated as empty.
+        """
+
+        if stringObj is None:
+            return ""
+        if not isinstance(stringObj, dict):
+            raise FP_ParameterError("BestStr: stringObj must be a dictionary of alternatives")
+        return self.__BestAlternative(stringObj, self.__AnalysisVernacular())
+
+    def StrAlternatives(self, stringObj):
+        """
+        Returns a dictionary of language tag to text for all the 
+        non-empty alternatives of a MultiUnicode or MultiString value.
+        """
+        if stringObj is None:
+            return {}
+        if not isinstance(stringObj, dict):
+            raise FP_ParameterError("StrAlternatives: stringObj must be a dictionary of alternatives")
+        return {ws: str(s) for ws, s in stringObj.items() if s}
+
+    def __BestAlternative(self, stringObj, wsTags):
+        if stringObj:
+            for ws in wsTags:
+                s = stringObj.get(ws)
+                if s:
+                    return str(s)
+        return ""
+
+    def __AnalysisVernacular(self):
+        return self.lp.CurAnalysisWss.split() + self.lp.CurVernWss.split()
+
+    def __VernacularAnalysis(self):
+        return self.lp.CurVernWss.split() + self.lp.CurAnalysisWss.split()
+
+
+    # --- Global: Writing Systems ---
+
+    def GetAllVernacularWSs(self):
+        """
+        Returns a set of language tags for all vernacular writing systems used
+        in this project.
+        """
+        return set(self.lp.CurVernWss.split())
+
+
+    def GetAllAnalysisWSs(self):
+        """
+        Returns a set of language tags for all analysis writing systems used
+        in this project.
+        """
+        return set(self.lp.CurAnalysisWss.split())
+
+
+    def GetWritingSystems(self):
+        """
+        Returns the writing systems that are active in this project as a
+        list of tuples: (Name, Language-tag, Handle, IsVernacular).
+        The name is the language tag, and the handle is always `None`.
+        """
+        WSList = [(ws, ws, None, True) for ws in self.lp.CurVernWss.split()]
+        VernWSSet = self.GetAllVernacularWSs()
+        WSList += [(ws, ws, None, False) for ws in self.lp.CurAnalysisWss.split()
+                   if ws not in VernWSSet]
+        return WSList
+
+
+    def WSUIName(self, languageTag):
+        """
+        Returns the UI name of the writing system for the given language
+        tag. (This is the language tag itself.)
+        Ignores case and '-'/'_' differences.
+        Returns `None` if the language tag is not found.
+        """
+        return self.__WSTags().get(_NormaliseLangTag(languageTag))
+
+
+    def GetDefaultVernacularWS(self):
+        """
+        Returns the default vernacular writing system: (Language-tag, Name)
+        """
+        ws = self.lp.CurVernWss.split()[0]
+        return (ws, ws)
+
+
+    def GetDefaultAnalysisWS(self):
+        """
+        Returns the default analysis writing system: (Language-tag, Name)
+        """
+        ws = self.lp.CurAnalysisWss.split()[0]
+        return (ws, ws)
+
+
+    #  Private writing system utilities
+
+    def __WSTags(self):
+        if self.__wsTags is None:
+            self.__wsTags = {}
+            for field in ("AnalysisWss", "VernWss",
+                          "CurAnalysisWss", "CurVernWss"):
+                for ws in (getattr(self.lp, field) or "").split():
+                    self.__wsTags[_NormaliseLangTag(ws)] = ws
+        return self.__wsTags
+
+    def __WSTag(self, languageTag, defaultWS):
+        if languageTag is None:
+            return defaultWS
+        if isinstance(languageTag, str):
+            ws = self.__WSTags().get(_NormaliseLangTag(languageTag))
+            if ws:
+                return ws
+        raise FP_WritingSystemError(languageTag)
+
+    def __WSTagVernacular(self, languageTag):
+        return self.__WSTag(languageTag, self.GetDefaultVernacularWS()[0])
+
+    def __WSTagAnalysis(self, languageTag):
+        return self.__WSTag(languageTag, self.GetDefaultAnalysisWS()[0])
+
+    def __String(self, stringObj, ws):
+        if not stringObj:
+            return ""
+        return str(stringObj.get(ws) or "")
+
+
+    # --- Global: other information ---
+
+    def GetDateLastModified(self):
+        """
+        Returns the date/time (UTC) that the project was last modified
+        as a `datetime.datetime`.
+        """
+        return ParseDateTime(self.lp.DateModified)
+
+
+    def GetPartsOfSpeech(self):
+        """
+        Returns a list of the parts of speech defined in this project.
+        """
+        return [self.BestStr(pos.Name) for pos in self.ObjectsIn("PartOfSpeech")]
+
+
+    def SemanticDomainTree(self):
+        """
+        Returns a `SemanticDomainTree` of all the semantic domains, with
+        the senses in each domain. It is built on the first call.
+        """
+        if self.__domainTree is None:
+            self.__Load({"CmSemanticDomain", "LexSense"})
+            analWSs = self.__AnalysisVernacular()
+
+            def Domains(possibilities, parentGuid):
+                for domain in possibilities:
+                    yield (domain.Guid,
+                           parentGuid,
+                           self.__BestAlternative(domain.Abbreviation, analWSs),
+                           {ws: str(name) for ws, name 
+                                          in (domain.Name or {}).items()})
+                    yield from Domains(domain.SubPossibilitiesOS, domain.Guid)
+
+            senseDomains = ((sense.Guid, domain.Guid)
+                            for sense in self.ObjectsIn("LexSense")
+                            for domain in sense.SemanticDomainsRC)
+
+            self.__domainTree = SemanticDomainTree(
+                Domains(self.lp.SemanticDomainListOA.PossibilitiesOS, None),
+                senseDomains)
+        return self.__domainTree
+
+
+    # --- Generic Repository Access ---
+
+    def ObjectCountFor(self, repository):
+        """
+        Returns the number of objects of the given class. `repository`
+        is the class name (e.g. "LexEntry") or the LCM repository name
+        (e.g. "ILexEntryRepository").
+        As in LCM, "CmPossibility" includes all the kinds of possibility.
+        """
+        count = 0
+        for className in self.__ClassNames(repository):
+            if className in self.__byClass:
+                count += len(self.__byClass[className])
+            else:
+                count += self.ObjectCounts().get(className, 0)
+        return count
+
+
+    def ObjectCounts(self):
+        """
+        Returns a dictionary of class name to the number of objects of
+        that class in the project. The counts are found without loading
+        any objects.
+        """
+        if self.__counts is None:
+            if self.index:
+                self.__counts = self.index.ClassCounts()
+            elif self.backup:
+                self.__counts = collections.Counter(
+                    className for offset, length, className, guid, ownerGuid
+                              in self.reader.RecordLocations())
+            else:
+                self.__counts = FWDataClassCounts(self.fileName)
+        return self.__counts
+
+
+    def ObjectsIn(self, repository):
+        """
+        Returns an iterator over all the objects of the given class.
+        `repository` is the class name (e.g. "LexEntry") or the LCM
+        repository name (e.g. "ILexEntryRepository").
+        As in LCM, "CmPossibility" includes all the kinds of possibility.
+        """
+        classNames = self.__ClassNames(repository)
+        self.__Load(classNames)
+        if len(classNames) == 1:
+            return iter(self.__byClass[classNames[0]])
+        return itertools.chain.from_iterable(self.__byClass[className]
+                                             for className in classNames)
+
+
+    def Object(self, guid):
+        """
+        Returns the `FWDataObject` for the given guid (`str` or
+        `uuid.UUID`). Refer to `.ClassName` to determine the LCM class.
+        Returns `None` if there is no object with that guid.
+        """
+        guid = _NormaliseGuid(guid)
+        try:
+            return self.__objects[guid]
+        except KeyError:
+            pass
+
+        if self.index:
+            location = self.index.Find(guid)
+            if location is None:
+                return None
+            guid, offset, length, className, ownerGuid = location
+            obj = MakeObject(className, guid, ownerGuid,
+                             self.index.ReadAt(offset, length), self)
+            self.__objects[guid] = obj
+            return obj
+
+        for obj in self.reader.Records(guids={guid}, project=self):
+            self.__objects[guid] = obj
+            return obj
+        return None
+
+
+    def __LoadObjects(self, guids):
+        # Loads the objects with the given guids (in one pass over the
+        # file if there isn't an index).
+        missing = {g for g in guids if g not in self.__objects}
+        if not missing:
+            return
+        if self.index:
+            # Read the records in file order
+            locations = sorted(filter(None, map(self.index.Find, missing)),
+                               key=lambda location: location[1])
+            for guid, offset, length, className, ownerGuid in locations:
+                self.__objects[guid] = MakeObject(className, guid, ownerGuid,
+                                                  self.index.ReadAt(offset, length),
+                                                  self)
+        else:
+            for obj in self.reader.Records(guids=missing, project=self):
+                self.__objects.setdefault(obj.Guid, obj)
+
+
+    def Objects(self, guids):
+        """
+        Returns a list of the `FWDataObject`s for an iterable of guids
+        (`str` or `uuid.UUID`), in the same order. The entry is `None`
+        if there is no object with that guid.
+
+        The objects that aren't already loaded are read together: in 
+        file order from the index if the project was opened with 
+        `useIndex=True`, otherwise in one pass over the file.
+        """
+        guids = [_NormaliseGuid(guid) for guid in guids]
+        self.__LoadObjects(guids)
+        return [self.__objects.get(guid) for guid in guids]
+
+
+    def ObjectIds(self, guids):
+        """
+        A lightweight version of `Objects()` that returns a list of 
+        (className, guid) for each guid, or `None` if there is no object
+        with that guid. With an index, the objects aren't read.
+        """
+        guids = [_NormaliseGuid(guid) for guid in guids]
+        if not self.index:
+            self.__LoadObjects(guids)
+        ids = []
+        for guid in guids:
+            obj = self.__objects.get(guid)
+            if obj is not None:
+                ids.append((obj.ClassName, guid))
+            elif self.index:
+                location = self.index.Find(guid)
+                ids.append((location[3], guid) if location else None)
+            else:
+                ids.append(None)
+        return ids
+
+
+    # --- Change tracking ---
+
+    def DateModified(self, obj):
+        """
+        Returns the date/time (UTC) that `obj` was last modified as a
+        `datetime.datetime`. Objects that don't have a DateModified 
+        field (e.g. senses) use that of their nearest owner that does
+        (e.g. the entry). Returns `None` if there isn't one.
+        """
+        while obj is not None:
+            dateModified = obj.Fields.get("DateModified")
+            if dateModified:
+                return ParseDateTime(dateModified)
+            obj = obj.Owner
+        return None
+
+
+    def ObjectsModifiedSince(self, repository, since=None):
+        """
+        Returns a list of the objects of the given class (e.g. 
+        "LexSense") that have been modified after `since`, a 
+        `datetime.datetime` in UTC. All the objects are returned if
+        `since` is `None`. See `DateModified()` for how the modification
+        date is found.
+
+        See `ChangeTracker` for keeping track of `since` 
+        between runs.
+        """
+        objects = list(self.ObjectsIn(repository))
+
+        # Load the owner chains a level at a time
+        pending = objects
+        while pending:
+            ownerGuids = {obj.OwnerGuid for obj in pending
+                          if obj.OwnerGuid and "DateModified" not in obj.Fields}
+            self.__LoadObjects(ownerGuids)
+            pending = [self.__objects[g] for g in ownerGuids
+                       if g in self.__objects]
+
+        if since is None:
+            return objects
+        modified = []
+        for obj in objects:
+            dateModified = self.DateModified(obj)
+            if dateModified and dateModified > since:
+                modified.append(obj)
+        return modified
+
+
+    # --- Lexicon ---
+
+    def LexiconNumberOfEntries(self):
+        return self.ObjectCountFor("LexEntry")
+
+
+    def LexiconAllEntries(self):
+        """
+        Returns an iterator over all entries in the lexicon.
+        """
+        self.__Load(LexiconClasses)
+        return self.ObjectsIn("LexEntry")
+
+
+    def LexiconAllEntriesSorted(self, languageTagOrHandle=None):
+        """
+        Returns an iterator over all entries in the lexicon sorted by
+        the headword in the default vernacular WS or other WS as 
+        specified by `languageTagOrHandle`.
+
+        The entries are sorted with ICU collation if PyICU is installed,
+        otherwise with a simplified Unicode ordering (see `FLExSort`).
+        The headwords and their sort keys are cached, so subsequent
+        calls only read the headwords of entries that have been 
+        modified.
+        """
+        ws = self.__WSTagVernacular(languageTagOrHandle)
+        if ws not in self.__sortKeyCaches:
+            self.__sortKeyCaches[ws] = SortKeyCache(SortKeyFunction(ws))
+
+        def Headword(entry):
+            return lambda: self.__Headword(entry, ws)
+
+        entries = ((e.Guid,
+                    e.DateModified,
+                    Headword(e),
+                    e) for e in self.LexiconAllEntries())
+
+        for e in self.__sortKeyCaches[ws].Sorted(entries):
+            yield e
+
+
+    def LexiconSearchIndex(self, fileName=None):
+        """
+        Returns a `LexiconIndex` of the lexeme forms, citation forms,
+        headwords, glosses and reversal forms in all writing systems, 
+        for fast lookup of entries and senses by form. E.g.::
+
+            index = project.LexiconSearchIndex()
+            for hit in index.Folded("cafe", "fr"):
+                sense = project.Object(hit.guid)
+
+        If `fileName` is given, the index is saved to it, and reused by
+        later calls until the project file is modified. See 
+        `FLExSearch.py` for the lookup functions.
+        """
+        # The file's modification time and size identify the lexicon
+        # without loading it.
+        stamp = None
+        if fileName:
+            stat = os.stat(self.fileName)
+            stamp = [os.path.basename(self.fileName),
+                     stat.st_mtime_ns, stat.st_size]
+        return FLExSearch.LexiconSearchIndex(self, fileName, stamp)
+
+
+    #  Vernacular WS fields
+
+    def LexiconGetHeadword(self, entry):
+        """
+        Returns the headword for `entry`: the citation form, or the
+        lexeme form, with the affix markers and homograph number.
+        """
+        return self.__Headword(entry, self.GetDefaultVernacularWS()[0])
+
+
+    def __Headword(self, entry, ws):
+        form = self.__String(entry.CitationForm, ws)
+        lexemeForm = entry.LexemeFormOA
+        if not form and lexemeForm:
+            form = self.__String(lexemeForm.Form, ws)
+        if not form:
+            form = "???"
+        elif lexemeForm and lexemeForm.MorphTypeRA:
+            morphType = lexemeForm.MorphTypeRA
+            form = "".join((morphType.Prefix or "",
+                            form,
+                            morphType.Postfix or ""))
+        if entry.HomographNumber:
+            form += str(entry.HomographNumber)
+        return form
+
+
+    def LexiconGetLexemeForm(self, entry, languageTagOrHandle=None):
+        """
+        Returns the lexeme form for `entry` in the default vernacular WS
+        or other WS as specified by `languageTagOrHandle`.
+        """
+        ws = self.__WSTagVernacular(languageTagOrHandle)
+
+        if not entry.LexemeFormOA:
+            return ""
+        return self.__String(entry.LexemeFormOA.Form, ws)
+
+
+    def LexiconGetCitationForm(self, entry, languageTagOrHandle=None):
+        """
+        Returns the citation form for `entry` in the default vernacular WS
+        or other WS as specified by `languageTagOrHandle`.
+        """
+        ws = self.__WSTagVernacular(languageTagOrHandle)
+        return self.__String(entry.CitationForm, ws)
+
+
+    def LexiconGetPronunciation(self, pronunciation, languageTagOrHandle=None):
+        """
+        Returns the form for `pronunciation` in the default vernacular WS
+        or other WS as specified by `languageTagOrHandle`.
+        """
+        ws = self.__WSTagVernacular(languageTagOrHandle)
+        return self.__String(pronunciation.Form, ws)
+
+
+    def LexiconGetExample(self, example, languageTagOrHandle=None):
+        """
+        Returns the example text in the default vernacular WS or
+        other WS as specified by `languageTagOrHandle`.
+        """
+        ws = self.__WSTagVernacular(languageTagOrHandle)
+        return self.__String(example.Example, ws)
+
+
+    def LexiconGetExampleTranslation(self, translation, languageTagOrHandle=None):
+        """
+        Returns the translation of an example in the default analysis WS or
+        other WS as specified by `languageTagOrHandle`.
+        """
+        ws = self.__WSTagAnalysis(languageTagOrHandle)
+        return self.__String(translation.Translation, ws)
+
+
+    #  Analysis WS fields
+
+    def LexiconGetSenseGloss(self, sense, languageTagOrHandle=None):
+        """
+        Returns the gloss for the sense in the default analysis WS or
+        other WS as specified by `languageTagOrHandle`.
+        """
+        ws = self.__WSTagAnalysis(languageTagOrHandle)
+        return self.__String(sense.Gloss, ws)
+
+
+    def LexiconGetSenseDefinition(self, sense, languageTagOrHandle=None):
+        """
+        Returns the definition for the sense in the default analysis WS or
+        other WS as specified by `languageTagOrHandle`.
+        """
+        ws = self.__WSTagAnalysis(languageTagOrHandle)
+        return self.__String(sense.Definition, ws)
+
+
+    #  Non-string types
+
+    def LexiconGetSensePOS(self, sense):
+        """
+        Returns the part of speech abbreviation for the sense.
+        """
+        msa = sense.MorphoSyntaxAnalysisRA
+        if not msa:
+            return ""
+        if msa.ClassName == "MoDerivAffMsa":
+            return ">".join((self.__POSAbbr(msa.FromPartOfSpeechRA),
+                             self.__POSAbbr(msa.ToPartOfSpeechRA)))
+        return self.__POSAbbr(msa.PartOfSpeechRA)
+
+    def __POSAbbr(self, pos):
+        if not pos:
+            return ""
+        return self.__BestAlternative(pos.Abbreviation,
+                                      self.__AnalysisVernacular())
+
+
+    def LexiconGetSenseSemanticDomains(self, sense):
+        """
+        Returns a list of semantic domain objects belonging to the sense.
+        """
+        self.__Load({"CmSemanticDomain"})
+        return sense.SemanticDomainsRC
+
+
+    # --- Lexicon: field functions ---
+
+    def GetCustomFieldValue(self, senseOrEntry, fieldID,
+                            languageTagOrHandle=None):
+        """
+        Returns the field value for String, MultiString, Integer
+        and List (both single and multiple) fields.
+
+        `languageTagOrHandle` only applies to MultiStrings; if `None` the
+        best analysis or venacular string is returned.
+        """
+        if not senseOrEntry: raise FP_NullParameterError()
+        if not fieldID: raise FP_NullParameterError()
+
+        value = senseOrEntry.Fields.get(fieldID)
+
+        if isinstance(value, dict):
+            if languageTagOrHandle:
+                return self.__String(value, self.__WSTag(languageTagOrHandle, None))
+            return self.BestStr(value)
+
+        elif isinstance(value, list):
+            names = [self.BestStr(self.Object(guid).Name) for guid in value]
+            if self.__CustomFieldType(fieldID) == "ReferenceAtom":
+                return names[0] if names else ""
+            return names
+
+        return value
+
+
+    def LexiconGetFieldText(self, senseOrEntry, fieldID,
+                            languageTagOrHandle=None):
+        """
+        Return the text value for the given entry/sense and field ID.
+        Provided for use with custom fields.
+        Returns the empty string if the value is null.
+        `languageTagOrHandle` only applies to MultiStrings; if `None` the
+        best analysis or vernacular string is returned.
+        """
+        value = self.GetCustomFieldValue(senseOrEntry,
+                                         fieldID,
+                                         languageTagOrHandle)
+        if value and value != "***":
+            return str(value)
+        return ""
+
+
+    # --- Lexicon: Custom fields ---
+
+    def __CustomFields(self):
+        if self.__customFields is None:
+            self.__customFields = self.reader.CustomFields()
+        return self.__customFields
+
+    def __CustomFieldType(self, fieldID):
+        for cf in self.__CustomFields():
+            if cf["name"] == fieldID:
+                return cf.get("type")
+        return None
+
+    def __GetCustomFieldsOfType(self, className):
+        return [(cf["name"], cf["label"])
+                for cf in self.__CustomFields()
+                if cf["class"] == className]
+
+    def __FindCustomField(self, className, fieldName):
+        for flid, name in self.__GetCustomFieldsOfType(className):
+            if name == fieldName:
+                return flid
+        return None
+
+
+    def LexiconGetEntryCustomFields(self):
+        """
+        Returns a list of the custom fields defined at entry level.
+        Each item in the list is a tuple of (fieldID, label)
+        """
+        return self.__GetCustomFieldsOfType("LexEntry")
+
+
+    def LexiconGetSenseCustomFields(self):
+        """
+        Returns a list of the custom fields defined at sense level.
+        Each item in the list is a tuple of (fieldID, label)
+        """
+        return self.__GetCustomFieldsOfType("LexSense")
+
+
+    def LexiconGetExampleCustomFields(self):
+        """
+        Returns a list of the custom fields defined at example level.
+        Each item in the list is a tuple of (fieldID, label)
+        """
+        return self.__GetCustomFieldsOfType("LexExampleSentence")
+
+
+    def LexiconGetAllomorphCustomFields(self):
+        """
+        Returns a list of the custom fields defined at allomorph level.
+        Each item in the list is a tuple of (fieldID, label)
+        """
+        return self.__GetCustomFieldsOfType("MoForm")
+
+
+    def LexiconGetEntryCustomFieldNamed(self, fieldName):
+        """
+        Return the entry-level field ID given its name.
+
+        NOTE: `fieldName` is case-sensitive.
+        """
+        return self.__FindCustomField("LexEntry", fieldName)
+
+
+    def LexiconGetSenseCustomFieldNamed(self, fieldName):
+        """
+        Return the sense-level field ID given its name.
+
+        NOTE: `fieldName` is case-sensitive.
+        """
+        return self.__FindCustomField("LexSense", fieldName)
+
+
+    # --- Lexical Relations ---
+
+    def GetLexicalRelationTypes(self):
+        """
+        Returns an iterator over `LexRefType` objects, which define a
+        type of lexical relation, such as Part-Whole. (See 
+        `FLExProject.GetLexicalRelationTypes()`.)
+        """
+        self.__Load(RelationClasses)
+        return self.ObjectsIn("LexRefType")
+
+
+    def LexicalRelationGraph(self, refresh=False):
+        """
+        Returns a `RelationGraph` of the lexical relations between
+        entries and senses, with edges that follow the `MappingType` of
+        each relation type, for neighbour, closure, shortest path and
+        connected component queries (see FLExRelations.py). It is built
+        on the first call, and rebuilt if `refresh` is `True`. E.g.::
+
+            graph = project.LexicalRelationGraph()
+            node = graph.Node(sense.Guid)
+            parts = graph.Closure(node, "Part", graph.Forward)
+        """
+        if self.__relationGraph is None or refresh:
+            self.__Load(LexiconClasses | RelationClasses)
+            relationTypes = ((lrt.Guid,
+                              self.BestStr(lrt.Name),
+                              self.BestStr(lrt.ReverseName),
+                              lrt.MappingType,
+                              ([(target.Guid, target.ClassName)
+                                for target in ref.TargetsRS]
+                               for ref in lrt.MembersOC))
+                             for lrt in self.GetLexicalRelationTypes())
+            self.__relationGraph = RelationGraph(relationTypes)
+        return self.__relationGraph
+
+
+    # --- Publications ---
+
+    def GetPublications(self):
+        """
+        Returns a list of the names of the publications defined in the
+        project.
+        """
+        pubList = self.lexDB.PublicationTypesOA
+        if not pubList:
+            return []
+        return [self.BestStr(pub.Name)
+                for pub in pubList.PossibilitiesOS]
+
+
+    def PublicationType(self, publicationName):
+        """
+        Returns the publication type object (a `CmPossibility`) for the
+        given publication name, or `None` if there isn't one.
+        """
+        pubList = self.lexDB.PublicationTypesOA
+        if pubList:
+            for pub in pubList.PossibilitiesOS:
+                if self.BestStr(pub.Name) == publicationName:
+                    return pub
+        return None
+
+
+    def PublicationMembership(self, refresh=False):
+        """
+        Returns a `PublicationMembership` with bitmaps of the entries and
+        senses in each publication, built in one pass over the lexicon
+        (see FLExPublications.py). It is built on the first call, and
+        rebuilt if the number of entries or senses, or the publications,
+        change, or if `refresh` is `True`. E.g.::
+
+            pubs = project.PublicationMembership()
+            webOnly = pubs.Entries("Web") & ~pubs.Entries("Main Dictionary")
+            for guid in pubs.EntryGuids(webOnly):
+                ...
+        """
+        self.__Load(LexiconClasses | {"CmPossibilityList", "CmPossibility"})
+        pubList = self.lexDB.PublicationTypesOA
+        publicationTypes = list(pubList.PossibilitiesOS) if pubList else []
+        stamp = (self.LexiconNumberOfEntries(),
+                 self.ObjectCountFor("LexSense"),
+                 tuple((pub.Guid, self.BestStr(pub.Name))
+                       for pub in publicationTypes))
+        if self.__publications is None or refresh \
+           or self.__publications.stamp != stamp:
+            def Senses(senses):
+                for sense in senses:
+                    yield (sense.Guid,
+                           [pub.Guid for pub in sense.DoNotPublishInRC],
+                           Senses(sense.SensesOS))
+
+            publications = ((pub.Guid, self.BestStr(pub.Name))
+                            for pub in publicationTypes)
+            entries = ((entry.Guid,
+                        [pub.Guid for pub in entry.DoNotPublishInRC],
+                        Senses(entry.SensesOS))
+                       for entry in self.LexiconAllEntries())
+
+            self.__publications = PublicationMembership(publications, entries,
+                                                        stamp)
+        return self.__publications
+
+
+    def PublicationEntries(self, publication, excluding=None):
+        """
+        Returns an iterator over the entries in `publication` (a name or
+        guid), in lexicon order. If `excluding` is given, then the 
+        entries that are also in that publication are skipped.
+        """
+        pubs = self.PublicationMembership()
+        bitmap = pubs.Entries(publication)
+        if excluding is not None:
+            bitmap &= ~pubs.Entries(excluding)
+        return (self.Object(guid) for guid in pubs.EntryGuids(bitmap))
+
+
+    # --- Reversal Indices ---
+
+    def ReversalRegistry(self):
+        """
+        Returns the `ReversalRegistry` of the project's reversal indexes,
+        with a table of all the entries (including subentries) and their
+        forms for each index (see FLExReversals.py). The tables are 
+        built when first used and rebuilt when their index is modified.
+        """
+        if self.__reversals is None:
+            self.__Load(ReversalClasses)
+            self.__reversals = ReversalRegistry(self)
+        return self.__reversals
+
+
+    def ReversalIndex(self, languageTag):
+        """
+        Returns the reversal index for `languageTag` (eg 'en'). 
+        Returns `None` if there is no reversal index for
+        that writing system.
+        """
+        return self.ReversalRegistry().Index(languageTag)
+
+
+    def ReversalEntries(self, languageTag, includeSubentries=False):
+        """
+        Returns an iterator for the reversal entries for `languageTag` 
+        (eg 'en'). Returns `None` if there is no reversal index for
+        that writing system.
+        If `includeSubentries` is `True`, then the subentries are included,
+        each following its parent entry.
+        """
+        if includeSubentries:
+            entries = self.ReversalRegistry().Entries(languageTag)
+            return iter(entries) if entries is not None else None
+        ri = self.ReversalIndex(languageTag)
+        if ri:
+            return iter(ri.EntriesOC)
+        else:
+            return None
+
+
+    def ReversalFind(self, form, languageTag, ignoreCase=False):
+        """
+        Returns a list of the reversal entries and subentries for 
+        `languageTag` with the reversal form `form`.
+        """
+        return self.ReversalRegistry().Find(form, languageTag, ignoreCase)
+
+
+    def ReversalGetForm(self, entry, languageTagOrHandle=None):
+        """
+        Returns the form for the reversal entry in the default
+        analysis WS or other WS as specified by `languageTagOrHandle`.
+        """
+        ws = self.__WSTagAnalysis(languageTagOrHandle)
+        return self.__String(entry.ReversalForm, ws)
+
+
+    # --- Texts ---
+
+    def TextsNumberOfTexts(self):
+        """
+        Returns the total number of texts in the project.
+        """
+        return self.ObjectCountFor("Text")
+
+
+    def TextsGetAll(self, supplyName=True, supplyText=True):
+        """
+        A generator that returns all the texts in the project as
+        tuples of (`name`, `text`) where:
+
+            - `name` is the best vernacular or analysis name.
+            - `text` is a string with newlines separating paragraphs.
+
+        Passing `supplyName`/`Text` = `False` returns only the texts or names.
+        """
+        self.__Load(TextClasses)
+
+        for t in self.ObjectsIn("Text"):
+            name = self.__BestAlternative(t.Name, self.__VernacularAnalysis())
+            if not supplyText:
+                yield name
+                continue
+
+            content = []
+            if t.ContentsOA:
+                for p in t.ContentsOA.ParagraphsOS:
+                    if p.Contents:
+                        content.append(str(p.Contents))
+
+            if supplyName:
+                yield name, "\n".join(content)
+            else:
+                yield "\n".join(content)
+
+
+    def TextsCorpus(self, corpus=None):
+        """
+        Returns a `Corpus` of the words in all the texts, for frequency,
+        n-gram and concordance queries (see `FLExCorpus.py`).
+        If an existing `corpus` is given, it is updated: only the texts
+        that have been modified since are re-indexed.
+        """
+        self.__Load(TextClasses)
+        if corpus is None:
+            corpus = Corpus()
+
+        corpus.Update((t.Guid,
+                       (t.DateModified, 
+                        t.ContentsOA.DateModified if t.ContentsOA else None),
+                       self.__BestAlternative(t.Name, self.__VernacularAnalysis()),
+                       lambda t=t: self.TextsGetParagraphRuns(t))
+                      for t in self.ObjectsIn("Text"))
+        return corpus
+
+
+    def TextsGetParagraphRuns(self, text):
+        """
+        Returns the paragraphs of `text` as a list, where each paragraph
+        is a list of (`languageTag`, `text`) runs.
+        """
+        self.__Load(TextClasses)
+        if not text.ContentsOA:
+            return []
+        return [list(p.Contents.Runs) if p.Contents else []
+                for p in text.ContentsOA.ParagraphsOS]
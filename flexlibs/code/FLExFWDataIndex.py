@@ -0,0 +1,259 @@
+#
+#   FLExFWDataIndex.py
+#
+#   Module: A persistent index of the objects in a .fwdata file.
+#
+#           The index maps each guid to the byte offset and length of
+#           its <rt> record, its class and its owner. It is built in one
+#           pass over the .fwdata file and saved alongside it, then
+#           reused until the .fwdata file's size or modification time
+#           changes. Objects can then be read by seeking directly to
+#           their record.
+#
+#   Platform: Python 3
+#
+#   Copyright Craig Farrow, 2025
+#
+
+import os
+import json
+import mmap
+import struct
+import uuid
+
+from .FLExFWData import FWDataReader
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+#--- Globals --------------------------------------------------------
+
+FWDataIndexExtension = ".fwidx"
+
+# File layout:
+#   Header:  magic, .fwdata size, .fwdata mtime (ns), number of
+#            records, length of the class-name table
+#   Class-name table (JSON list)
+#   Records, sorted by guid:
+#            guid, offset, length, class number, owner guid
+#            (The owner guid is all zeros if there isn't an owner.)
+
+IndexMagic = b"FWDATIX1"
+IndexHeader = struct.Struct("<8sQqII")
+IndexRecord = struct.Struct("<16sQIH16s")
+
+NoOwner = bytes(16)
+
+
+#--------------------------------------------------------------------
+
+class FWDataIndex(object):
+    """
+    An index of the records in a .fwdata file, stored in a sidecar
+    file (by default the .fwdata file name plus ".fwidx").
+
+    The index is rebuilt automatically if the .fwdata file has changed
+    since the index was saved. If the sidecar file can't be written,
+    the index is kept in memory only.
+
+    Usage::
+
+        index = FWDataIndex(fwdataFileName)
+        className, ownerGuid = index.Find(guid)[2:]
+        data = index.ReadRecord(guid)           # bytes of the <rt> element
+        for guid, offset, length, ownerGuid in index.RecordsOfClass("LexEntry"):
+            ...
+        index.Close()
+    """
+
+    def __init__(self, fileName, indexFileName=None):
+        self.fileName = fileName
+        self.indexFileName = indexFileName or fileName + FWDataIndexExtension
+
+        self.__file = None
+        self.__map = None
+        self.__byClass = None
+
+        stat = os.stat(fileName)
+        if not self.__Open(stat):
+            self.__Build(stat)
+
+
+    def Close(self):
+        """
+        Close the index and the .fwdata file.
+        """
+        if self.__map is not None and not isinstance(self.__map, bytes):
+            self.__map.close()
+        self.__map = None
+        if self.__file:
+            self.__file.close()
+            self.__file = None
+
+
+    def __len__(self):
+        return self.__count
+
+
+    #  Private functions for loading and building the index
+
+    def __Open(self, stat):
+        """
+        Opens the saved index if it is up to date.
+        Returns False if it needs to be (re)built.
+        """
+        try:
+            with open(self.indexFileName, "rb") as f:
+                buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return False
+
+        if len(buf) < IndexHeader.size:
+            buf.close()
+            return False
+        magic, size, mtime, count, classTableLength = \
+            IndexHeader.unpack_from(buf, 0)
+        if magic != IndexMagic or size != stat.st_size or \
+           mtime != stat.st_mtime_ns:
+            logger.info("FWDataIndex: %s is out of date" % self.indexFileName)
+            buf.close()
+            return False
+
+        self.__SetData(buf, count, classTableLength)
+        return True
+
+
+    def __Build(self, stat):
+        logger.info("FWDataIndex: indexing %s" % self.fileName)
+
+        classNumbers = {}
+        records = []
+        reader = FWDataReader(self.fileName)
+        for offset, length, className, guid, ownerGuid in \
+                reader.RecordLocations():
+            classNumber = classNumbers.setdefault(className, len(classNumbers))
+            records.append((uuid.UUID(guid).bytes,
+                            offset,
+                            length,
+                            classNumber,
+                            uuid.UUID(ownerGuid).bytes if ownerGuid else NoOwner))
+        records.sort()
+
+        classTable = json.dumps(list(classNumbers)).encode("utf-8")
+        data = bytearray(IndexHeader.pack(IndexMagic,
+                                          stat.st_size,
+                                          stat.st_mtime_ns,
+                                          len(records),
+                                          len(classTable)))
+        data += classTable
+        for record in records:
+            data += IndexRecord.pack(*record)
+
+        try:
+            with open(self.indexFileName, "wb") as f:
+                f.write(data)
+        except OSError as e:
+            logger.warning("FWDataIndex: couldn't save %s: %s"
+                           % (self.indexFileName, e))
+        self.__SetData(bytes(data), len(records), len(classTable))
+
+
+    def __SetData(self, buf, count, classTableLength):
+        self.__map = buf
+        self.__count = count
+        self.__classNames = json.loads(
+            bytes(buf[IndexHeader.size:IndexHeader.size + classTableLength]))
+        self.__recordsStart = IndexHeader.size + classTableLength
+
+
+    def __Record(self, i):
+        guid, offset, length, classNumber, owner = IndexRecord.unpack_from(
+            self.__map, self.__recordsStart + i * IndexRecord.size)
+        return (str(uuid.UUID(bytes=guid)),
+                offset,
+                length,
+                self.__classNames[classNumber],
+                str(uuid.UUID(bytes=owner)) if owner != NoOwner else None)
+
+
+    # --- Lookups ---
+
+    def Find(self, guid):
+        """
+        Returns a tuple of (guid, offset, length, className, ownerGuid)
+        for the given guid (`str` or `uuid.UUID`), or `None` if it isn't
+        in the index.
+        """
+        try:
+            key = uuid.UUID(str(guid)).bytes
+        except ValueError:
+            return None
+
+        # Binary search of the sorted records
+        buf = self.__map
+        lo, hi = 0, self.__count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            pos = self.__recordsStart + mid * IndexRecord.size
+            midKey = buf[pos:pos + 16]
+            if midKey < key:
+                lo = mid + 1
+            elif midKey > key:
+                hi = mid
+            else:
+                return self.__Record(mid)
+        return None
+
+
+    def ClassCounts(self):
+        """
+        Returns a dictionary of class name to the number of objects of
+        that class.
+        """
+        return {className: len(records)
+                for className, records in self.__ByClass().items()}
+
+
+    def RecordsOfClass(self, className):
+        """
+        Returns a list of (guid, offset, length, ownerGuid) tuples for
+        all the objects of the given class, in file order.
+        """
+        return self.__ByClass().get(className, [])
+
+
+    def __ByClass(self):
+        if self.__byClass is None:
+            self.__byClass = {}
+            for i in range(self.__count):
+                guid, offset, length, className, ownerGuid = self.__Record(i)
+                self.__byClass.setdefault(className, []).append(
+                    (guid, offset, length, ownerGuid))
+            for records in self.__byClass.values():
+                records.sort(key=lambda r: r[1])
+        return self.__byClass
+
+
+    # --- Reading records ---
+
+    def ReadAt(self, offset, length):
+        """
+        Returns the bytes of the record at the given location in the
+        .fwdata file.
+        """
+        if not self.__file:
+            self.__file = open(self.fileName, "rb")
+        self.__file.seek(offset)
+        return self.__file.read(length)
+
+
+    def ReadRecord(self, guid):
+        """
+        Returns the bytes of the `<rt>` element for the given guid, or
+        `None` if it isn't in the index.
+        """
+        location = self.Find(guid)
+        if location is None:
+            return None
+        return self.ReadAt(location[1], location[2])
@@ -6,6 +6,10 @@
 #           This module sets up the path for import of the 
 #           FieldWorks Assemblies.
 #
+#           The paths and version found are cached on disk, keyed by
+#           the FieldWorks registry values, and the time taken by each
+#           phase of the start-up is recorded (see StartupProfile()).
+#
 #   Platform: Python.NET & IRONPython
 #             FieldWorks Version 9.0, 9.1
 #
@@ -17,7 +21,12 @@ import os
 import platform
 import glob
 import shutil
+import json
+import time
+import contextlib
 
+# Importing clr starts the .NET runtime, so we time it.
+_startTime = time.perf_counter()
 import clr
 import System
 
@@ -31,6 +40,37 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+# ----------------------------------------------------------------
+# Start-up timing
+
+StartupTimings = {
+    "pythonnet" : time.perf_counter() - _startTime,
+    }
+
+@contextlib.contextmanager
+def StartupPhase(phase):
+    """
+    Context manager that adds the time taken by the enclosed code to 
+    the timing for `phase`.
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        StartupTimings[phase] = StartupTimings.get(phase, 0.0) \
+                                + time.perf_counter() - start
+
+
+def StartupProfile():
+    """
+    Returns a list of (phase, seconds) for each phase of the FieldWorks
+    start-up that has run so far, in the order that they ran. Phases 
+    include "pythonnet", "registry", "version", "assemblies", "ICU" 
+    and "SLDR".
+    """
+    return list(StartupTimings.items())
+
+
 # ----------------------------------------------------------------
 # Public globals
 
@@ -55,6 +95,48 @@ FWRegKeys = {
                 "9" : r"SOFTWARE\SIL\FieldWorks\9",
             }
 
+# ----------------------------------------------------------------
+# The cache of paths and version information
+
+if platform.system() == "Windows":
+    _cacheDir = os.environ.get("LOCALAPPDATA", os.path.expanduser("~"))
+else:
+    _cacheDir = os.environ.get("XDG_CACHE_HOME", 
+                               os.path.expanduser(os.path.join("~", ".cache")))
+FWGlobalsCacheFile = os.path.join(_cacheDir, "flexlibs", "FWGlobals.json")
+
+
+def _ReadCache(cacheKey):
+    # Returns the cached values if they are for the same registry 
+    # values and the same FieldWorks.exe; otherwise None.
+    try:
+        with open(FWGlobalsCacheFile, encoding="utf-8") as f:
+            cache = json.load(f)
+        if cache["key"] != cacheKey:
+            return None
+        exe = os.path.join(cache["FWCodeDir"], "FieldWorks.exe")
+        if os.stat(exe).st_mtime != cache["exeModified"]:
+            return None
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    return cache
+
+
+def _WriteCache(cacheKey):
+    cache = {
+        "key"            : cacheKey,
+        "FWCodeDir"      : FWCodeDir,
+        "exeModified"    : os.stat(FWExecutable).st_mtime,
+        "FWShortVersion" : str(FWShortVersion),
+        "FWLongVersion"  : FWLongVersion,
+        }
+    try:
+        os.makedirs(os.path.dirname(FWGlobalsCacheFile), exist_ok=True)
+        with open(FWGlobalsCacheFile, "w", encoding="utf-8") as f:
+            json.dump(cache, f, indent=1)
+    except OSError as e:
+        logger.warning("Couldn't write %s: %s" % (FWGlobalsCacheFile, e))
+
 
 # ----------------------------------------------------------------
 def GetFWRegKey():
@@ -87,18 +169,8 @@ def GetFWRegKey():
 
 # -------------------------------------------------------------------
 
-def InitialiseFWGlobals():
-    global FWCodeDir
-    global FWProjectsDir
-    global FWExecutable
-    global FWShortVersion
-    global FWLongVersion
-
-    try:
-        rKey = GetFWRegKey()
-    except Exception as e:
-        logging.exception("Couldn't find FieldWorks registry entry")
-        raise
+def _FindCodeDir(rKey):
+    # Returns the directory containing FieldWorks.exe
 
     if platform.system() == "Linux":
         # **********************************************************
@@ -116,15 +188,12 @@ def InitialiseFWGlobals():
         # which in turn calls /usr/lib/fieldworks/run-app FieldWorks.exe etc.
         #
         # The following is based on the logic in /usr/lib/fieldworks/environ
-        FWCodeDir = os.path.join(rKey.GetValue(FWREG_CODEDIR), "../../lib/fieldworks")
+        codeDir = os.path.join(rKey.GetValue(FWREG_CODEDIR), "../../lib/fieldworks")
     else:
         # On windows, FWREG_CODEDIR is correct.
-        FWCodeDir = rKey.GetValue(FWREG_CODEDIR)
-
-    # FWREG_PROJECTSDIR is correct on Windows and Linux.
-    FWProjectsDir = rKey.GetValue(FWREG_PROJECTSDIR)
+        codeDir = rKey.GetValue(FWREG_CODEDIR)
 
-    if not os.access(os.path.join(FWCodeDir, "FieldWorks.exe"), os.F_OK):
+    if not os.access(os.path.join(codeDir, "FieldWorks.exe"), os.F_OK):
         # On developer's machines we also check the build directories 
         # for FieldWorks.exe
         if platform.system() == "Linux":
@@ -134,37 +203,87 @@ def InitialiseFWGlobals():
         else:
             # Windows
             devPaths = [
-                os.path.join(FWCodeDir, r"..\Output\Release\\"),
-                os.path.join(FWCodeDir, r"..\Output\Debug\\"),
+                os.path.join(codeDir, r"..\Output\Release\\"),
+                os.path.join(codeDir, r"..\Output\Debug\\"),
                 ]
 
         for p in devPaths:
             if os.access(os.path.join(p, "FieldWorks.exe"), os.F_OK):
-                FWCodeDir = p
+                codeDir = p
                 break
         else:
             # This can happen if there is a ghost registry entry for 
             # an uninstalled FLEx
             msg = "FieldWorks.exe not found in %s" \
-                            % FWCodeDir
+                            % codeDir
             logger.error(msg)
             raise Exception(msg)
 
-    FWExecutable = os.path.join(FWCodeDir, "FieldWorks.exe")
+    return codeDir
+
+
+def InitialiseFWGlobals():
+    """
+    Find the FieldWorks installation and set up the path for importing
+    the FieldWorks assemblies. This only does the work on the first 
+    call, so it is safe to call before any use of the assemblies.
+    """
+    global FWCodeDir
+    global FWProjectsDir
+    global FWExecutable
+    global FWShortVersion
+    global FWLongVersion
+
+    if FWCodeDir:
+        return
+
+    with StartupPhase("registry"):
+        try:
+            rKey = GetFWRegKey()
+        except Exception as e:
+            logging.exception("Couldn't find FieldWorks registry entry")
+            raise
+
+        # FWREG_PROJECTSDIR is correct on Windows and Linux.
+        FWProjectsDir = rKey.GetValue(FWREG_PROJECTSDIR)
+
+    cacheKey = [rKey.GetValue(FWREG_CODEDIR), 
+                FWProjectsDir,
+                platform.architecture()[0]]
+    cache = _ReadCache(cacheKey)
+
+    if cache:
+        logger.info("Using cached FieldWorks information from %s" 
+                    % FWGlobalsCacheFile)
+        codeDir = cache["FWCodeDir"]
+    else:
+        codeDir = _FindCodeDir(rKey)
+
+    FWExecutable = os.path.join(codeDir, "FieldWorks.exe")
     
     # Add the FW code directory to the search path for importing FW libs.
-    sys.path.append(FWCodeDir)
+    sys.path.append(codeDir)
 
     logger.info("sys.path = \n\t%s" % "\n\t".join(sys.path))
 
-    # These can't be imported until the path is set:
-    clr.AddReference("FwUtils")
-    from SIL.FieldWorks.Common.FwUtils import VersionInfoProvider
-
-    # Get the full version information out of FW itself
-    vip = VersionInfoProvider(Assembly.GetAssembly(VersionInfoProvider), False)
-    FWShortVersion = System.Version(vip.ShortNumericAppVersion)  # e.g. 8.1.3
-    FWLongVersion = vip.ApplicationVersion
+    if cache:
+        FWShortVersion = System.Version(cache["FWShortVersion"])
+        FWLongVersion = cache["FWLongVersion"]
+    else:
+        with StartupPhase("version"):
+            # These can't be imported until the path is set:
+            clr.AddReference("FwUtils")
+            from SIL.FieldWorks.Common.FwUtils import VersionInfoProvider
+
+            # Get the full version information out of FW itself
+            vip = VersionInfoProvider(Assembly.GetAssembly(VersionInfoProvider), False)
+            FWShortVersion = System.Version(vip.ShortNumericAppVersion)  # e.g. 8.1.3
+            FWLongVersion = vip.ApplicationVersion
+
+    # Set last, since it marks the initialisation as complete.
+    FWCodeDir = codeDir
+    if not cache:
+        _WriteCache(cacheKey)
 
     logger.info("Found FieldWorks installation")
     logger.info("FWCodeDir = %s" % FWCodeDir)
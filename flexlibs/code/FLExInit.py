@@ -3,9 +3,10 @@
 #
 #   Module: Fieldworks Language Explorer initialisation.
 #
-#   Note:   This module needs to be imported before importing or
-#           using any Fieldworks Assemblies as it sets up the
-#           path, and other low-level things.
+#   Note:   FLExInitialize() needs to be called before using any 
+#           Fieldworks Assemblies as it sets up the path, and other
+#           low-level things. Importing this module does not load
+#           the assemblies.
 #
 #   Usage:  Call FLExInitialize() and FLExCleanup() as the first and 
 #           last actions from the main application.
@@ -31,37 +32,55 @@ logger.info("flexlibs version: %s" % version)
 logger.info("Python version: %s" % sys.version)
 
 
-import clr
-
-# Configure the path for accessing the FW DLLs
+# Configure the path for accessing the FW DLLs.
+# This is deferred until FLExInitialize() (or the first use of the
+# FieldWorks assemblies), so importing this module is cheap.
 from . import FLExGlobals
-FLExGlobals.InitialiseFWGlobals() 
-
-
-clr.AddReference("FwUtils")
-from SIL.FieldWorks.Common.FwUtils import FwRegistryHelper, FwUtils
-clr.AddReference("SIL.WritingSystems")
-from SIL.WritingSystems import Sldr
+from .FLExGlobals import StartupPhase, StartupProfile
 
+_initialised = False
 
 # -------------------------------------------------------------------
 
 def FLExInitialize ():
     """
     Initialize the Fieldworks libraries. An application should call
-    this as the first thing it does.
+    this as the first thing it does. Calling it again has no effect
+    until FLExCleanup() is called.
+
+    The time taken by each phase of the initialisation is available
+    from StartupProfile().
     """
+    global _initialised
+    if _initialised:
+        return
+
+    FLExGlobals.InitialiseFWGlobals()
+
+    with StartupPhase("assemblies"):
+        import clr
+        clr.AddReference("FwUtils")
+        from SIL.FieldWorks.Common.FwUtils import FwRegistryHelper, FwUtils
+        clr.AddReference("SIL.WritingSystems")
+        from SIL.WritingSystems import Sldr
+
     # [FW9] These 3 inits copied from LCMBrowser::Main()
     logger.debug("Calling RegistryHelper.Initialize()")
-    FwRegistryHelper.Initialize()
+    with StartupPhase("registry"):
+        FwRegistryHelper.Initialize()
     logger.debug("Calling InitializeIcu()")
-    FwUtils.InitializeIcu()
+    with StartupPhase("ICU"):
+        FwUtils.InitializeIcu()
     # No need to access the online SLDR: Offline mode = True
     logger.debug("Calling Sldr.Initialize()")
-    Sldr.Initialize(True)
+    with StartupPhase("SLDR"):
+        Sldr.Initialize(True)
     # Sldr.Initialize() can fail silently. If it doesn't return, 
     # then it is likely a dll issue.
+    _initialised = True
     logger.debug("FLExInit.Initialize complete")
+    logger.info("Start-up times: %s" % 
+                ", ".join("%s=%.3fs" % t for t in StartupProfile()))
 
 
 def FLExCleanup():
@@ -69,4 +88,9 @@ def FLExCleanup():
     Close up the Fieldworks libraries. An application should call this
     before exiting.
     """
+    global _initialised
+    if not _initialised:
+        return
+    from SIL.WritingSystems import Sldr
     Sldr.Cleanup();
+    _initialised = False
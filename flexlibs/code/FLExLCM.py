@@ -15,19 +15,26 @@
 
 import os
 
+from .FLExBackup import FWBackup, IsBackupFile
+
+# Configure the path for accessing the FW DLLs (if not already done)
+from . import FLExGlobals
+FLExGlobals.InitialiseFWGlobals()
+
 import clr
-clr.AddReference("System")
-import System
+with FLExGlobals.StartupPhase("assemblies"):
+    clr.AddReference("System")
+    import System
 
-clr.AddReference("FwUtils")
-clr.AddReference("FieldWorks")
-clr.AddReference("FwCoreDlgs")
-clr.AddReference("FwControls")
-clr.AddReference("FdoUi")
-clr.AddReference("SIL.Core")
-clr.AddReference("SIL.Core.Desktop")
-clr.AddReference("SIL.LCModel")
-clr.AddReference("SIL.LCModel.Core")
+    clr.AddReference("FwUtils")
+    clr.AddReference("FieldWorks")
+    clr.AddReference("FwCoreDlgs")
+    clr.AddReference("FwControls")
+    clr.AddReference("FdoUi")
+    clr.AddReference("SIL.Core")
+    clr.AddReference("SIL.Core.Desktop")
+    clr.AddReference("SIL.LCModel")
+    clr.AddReference("SIL.LCModel.Core")
 
 
 # Classes needed for loading the Cache
@@ -75,9 +82,19 @@ def OpenProject(projectName):
 
     projectName:
         - Either the full path including ".fwdata" suffix, or
+        - The full path of a backup file (".fwbackup"), which is 
+          extracted to a cache folder (see `FLExBackup.FWBackup`). The
+          cached copy must only be opened read-only, or
         - The name only, opened from the default project location.
     """
 
+    if IsBackupFile(projectName):
+        backup = FWBackup(projectName)
+        try:
+            projectName = backup.Extract()
+        finally:
+            backup.Close()
+
     projectFileName = LcmFileHelper.GetXmlDataFileName(projectName)
 
     # print "FLExLCM.OpenProject:", projectFileName
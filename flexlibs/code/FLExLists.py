@@ -0,0 +1,112 @@
+#
+#   FLExLists.py
+#
+#   Module: Cached name lookup in possibility lists (CmPossibilityList).
+#
+#           The names and abbreviations of all the possibilities in a
+#           list (including sub-possibilities) are indexed in each
+#           analysis writing system, so looking up a value doesn't
+#           walk the possibility tree. The index is rebuilt if the
+#           list has been modified, or possibilities have been added or
+#           deleted. LCM records changes to a possibility (e.g. a new
+#           name) on the possibility, not the list, so those need an
+#           explicit refresh.
+#
+#   Platform: Python.NET
+#             FieldWorks Version 9
+#
+#   Copyright Craig Farrow, 2025
+#
+
+from SIL.LCModel import ICmPossibility
+from SIL.LCModel.Core.KernelInterfaces import ITsString
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+#--------------------------------------------------------------------
+
+class PossibilityListIndex(object):
+    """
+    An index of the names and abbreviations of the possibilities in a
+    `CmPossibilityList`.
+
+    wsHandles:
+        The writing systems to index, in order of preference. If the
+        same name is used for more than one possibility, the first found
+        (in this order of writing system, then names before
+        abbreviations, then top-down through the list) is returned.
+
+    countFunction:
+        An optional function that returns the number of possibilities
+        in the project (e.g. the `ICmPossibilityRepository` count), so
+        that the index is rebuilt when possibilities are added or 
+        deleted anywhere in the list.
+
+    Renamed possibilities are only seen after `Refresh()`, or a lookup
+    with `refresh=True`.
+
+    Usage::
+
+        index = PossibilityListIndex(pList, [project.project.DefaultAnalWs])
+        possibility = index.Lookup("Noun")
+        possibility = index.Lookup("noun", ignoreCase=True)
+    """
+
+    def __init__(self, possibilityList, wsHandles, countFunction=None):
+        self.possibilityList = possibilityList
+        self.wsHandles = list(wsHandles)
+        self.countFunction = countFunction
+        self.__stamp = None
+
+
+    def Refresh(self):
+        """
+        Rebuilds the index on the next lookup.
+        """
+        self.__stamp = None
+
+
+    def __Refresh(self):
+        stamp = (self.possibilityList.DateModified.Ticks,
+                 self.countFunction() if self.countFunction else None)
+        if stamp == self.__stamp:
+            return
+
+        possibilities = []
+        def Walk(items):
+            for item in items:
+                possibilities.append(ICmPossibility(item))
+                Walk(item.SubPossibilitiesOS)
+        Walk(self.possibilityList.PossibilitiesOS)
+
+        self.__names = {}
+        self.__foldedNames = {}
+        for ws in self.wsHandles:
+            for field in ("Name", "Abbreviation"):
+                for possibility in possibilities:
+                    text = ITsString(getattr(possibility, field).\
+                                     get_String(ws)).Text
+                    if text:
+                        self.__names.setdefault(text, possibility)
+                        self.__foldedNames.setdefault(text.casefold(),
+                                                      possibility)
+
+        logger.debug("PossibilityListIndex: indexed %d possibilities"
+                     % len(possibilities))
+        self.__stamp = stamp
+
+
+    def Lookup(self, value, ignoreCase=False, refresh=False):
+        """
+        Returns the `CmPossibility` with the name or abbreviation `value`,
+        or `None` if it isn't in the list. Set `refresh` to `True` to 
+        rebuild the index first (e.g. after possibilities are renamed).
+        """
+        if refresh:
+            self.Refresh()
+        self.__Refresh()
+        if ignoreCase:
+            return self.__foldedNames.get(value.casefold())
+        return self.__names.get(value)
@@ -19,7 +19,23 @@ logger = logging.getLogger(__name__)
 # Initialise low-level FLEx data access
 from . import FLExInit
 from . import FLExLCM
-
+from . import FLExSort
+from . import FLExSearch
+from .FLExSchema import FLExSchema
+from .FLExLists import PossibilityListIndex
+from .FLExSemanticDomains import SemanticDomainTree
+from .FLExCorpus import Corpus
+from .FLExReversals import ReversalRegistry
+from .FLExPublications import PublicationMembership
+from .FLExRelations import RelationGraph
+from .FLExCache import ObjectCache
+from .FLExBackup import IsBackupFile
+from .FLExReaders import StringReader
+from .FLExWritingSystems import WritingSystemRegistry
+
+import uuid
+import datetime
+import collections
 from subprocess import Popen, DETACHED_PROCESS
 from .. import FWExecutable
 
@@ -27,14 +43,15 @@ import clr
 clr.AddReference("System")
 import System
 
+import SIL.LCModel
 from SIL.LCModel import (
-    ICmObjectRepository,
+    ICmObjectRepository, CmObjectTags,
     ILexEntryRepository, ILexEntry, LexEntryTags,
-                         ILexSense, LexSenseTags,
+    ILexSenseRepository, ILexSense, LexSenseTags,
     IWfiWordformRepository, WfiWordformTags,
                             WfiGlossTags,
     IWfiAnalysisRepository, IWfiAnalysis, WfiAnalysisTags,
-                            WfiMorphBundleTags,
+    IWfiMorphBundleRepository, WfiMorphBundleTags,
     LexExampleSentenceTags,
     MoFormTags,
     ILexRefTypeRepository,
@@ -65,6 +82,8 @@ from SIL.LCModel.Infrastructure import (
     IFwMetaDataCacheManaged,
     )
 
+from SIL.LCModel.DomainServices import WritingSystemServices
+
 from SIL.LCModel.Core.KernelInterfaces import ITsString, ITsStrBldr
 from SIL.LCModel.Core.Text import TsStringUtils
 from SIL.LCModel.Utils import WorkerThreadException, ReflectionHelper
@@ -76,68 +95,18 @@ from SIL.FieldWorks.Common.FwUtils import (
 
 #--- Exceptions ------------------------------------------------------
 
-class FP_ProjectError(Exception):
-    """Exception raised for any problems opening the project.
-
-    Attributes:
-        - message -- explanation of the error
-    """
-
-    def __init__(self, message):
-        self.message = message
-
-class FP_FileNotFoundError(FP_ProjectError):
-    def __init__(self, projectName, e):
-        # Normally this will be a mispelled/wrong project name...
-        if projectName in str(e):
-            FP_ProjectError.__init__(self,
-                "Project file not found: %s" % projectName)
-        # ...however, it could be an internal FLEx error.
-        else:
-            FP_ProjectError.__init__(self,
-                "File not found error: %s" % e)
-
-class FP_FileLockedError(FP_ProjectError):
-    def __init__(self):
-        FP_ProjectError.__init__(self,
-            "This project is in use by another program. To allow shared access to this project, turn on the sharing option in the Sharing tab of the Fieldworks Project Properties dialog.")
-            
-class FP_MigrationRequired(FP_ProjectError):
-    def __init__(self):
-        FP_ProjectError.__init__(self,
-            "This project needs to be opened in FieldWorks in order for it to be migrated to the latest format.")
-
-#-----------------------------------------------------            
-
-class FP_RuntimeError(Exception):
-    """Exception raised for any problems running the module.
-
-    Attributes:
-        - message -- explanation of the error
-    """
-
-    def __init__(self, message):
-        self.message = message
-
-class FP_ReadOnlyError(FP_RuntimeError):
-    def __init__(self):
-        FP_RuntimeError.__init__(self,
-            "Trying to write to the project database without changes enabled.")
-            
-class FP_WritingSystemError(FP_RuntimeError):
-    def __init__(self, writingSystemName):
-        FP_RuntimeError.__init__(self,
-            "Invalid Writing System for this project: %s" % writingSystemName)
-
-class FP_NullParameterError(FP_RuntimeError):
-    def __init__(self):
-        FP_RuntimeError.__init__(self,
-            "Null parameter.")
+from .FLExExceptions import (
+    FP_ProjectError,
+    FP_FileNotFoundError,
+    FP_FileLockedError,
+    FP_MigrationRequired,
+    FP_RuntimeError,
+    FP_ReadOnlyError,
+    FP_WritingSystemError,
+    FP_NullParameterError,
+    FP_ParameterError,
+    )
 
-class FP_ParameterError(FP_RuntimeError):
-    def __init__(self, msg):
-        FP_RuntimeError.__init__(self, msg)
-        
 #-----------------------------------------------------------
 
 def AllProjectNames():
@@ -203,6 +172,11 @@ class FLExProject (object):
 
         projectName:
             - Either the full path including ".fwdata" suffix, or
+            - The full path of a backup file (".fwbackup"). The backup is
+              extracted to a cache folder, keyed by the archive's hash,
+              and opened from there. Backups can only be opened 
+              read-only, since the cached copy is shared by all later
+              opens of the same backup.
             - The name only, to open from the default project location.
             
         writeEnabled: 
@@ -210,6 +184,7 @@ class FLExProject (object):
             saved on a call to `CloseProject()`. 
             LCM will raise an exception if changes are attempted without 
             opening the project in this mode.
+            `FP_ReadOnlyError` is raised if `projectName` is a backup.
             
         Note: 
             A call to `OpenProject()` may fail with a `FP_FileLockedError`
@@ -222,6 +197,9 @@ class FLExProject (object):
 
         """
         
+        if writeEnabled and IsBackupFile(projectName):
+            raise FP_ReadOnlyError()
+
         try:
             self.project = FLExLCM.OpenProject(projectName)
             
@@ -248,6 +226,29 @@ class FLExProject (object):
 
         self.lp    = self.project.LangProject
         self.lexDB = self.lp.LexDbOA
+
+        # The writing systems (see FLExWritingSystems.py)
+        self.writingSystems = self.__BuildWritingSystemRegistry()
+
+        # The classes and fields (including custom fields)
+        self.schema = FLExSchema(self.project)
+
+        # Recently resolved objects (see Object() and Objects())
+        self.objectCache = ObjectCache(isValid=lambda obj: obj.IsValidObject)
+
+        # Sort key caches for each writing system
+        self.__sortKeyCaches = {}
+        # Name indexes for possibility lists
+        self.__listIndexes = {}
+        self.__domainTree = None
+        self.__reversals = None
+        self.__publications = None
+        self.__relationGraph = None
+        # Occurrence counts of entries and senses in the texts
+        self.__analysesCounts = None
+        self.__analysesCountsStamp = None
+        # DateModified field IDs by class ID (None if there isn't one)
+        self.__dateModifiedFlids = {}
         
         # Set up FieldWorks for making changes to the project.
         # All changes will be automatically saved when this object is
@@ -315,6 +316,26 @@ class FLExProject (object):
         return "" if s == "***" else s
 
 
+    def StrAlternatives(self, stringObj):
+        """
+        Returns a dictionary of language tag to text for all the 
+        non-empty alternatives of a `MultiUnicode` or `MultiString` 
+        object.
+        """
+        if not isinstance(stringObj, (IMultiUnicode, IMultiString)):
+            raise FP_ParameterError("StrAlternatives: stringObj must be IMultiUnicode or IMultiString")
+
+        wsf = self.project.WritingSystemFactory
+        alternatives = {}
+        for WSHandle in stringObj.AvailableWritingSystemIds:
+            text = ITsString(stringObj.get_String(WSHandle)).Text
+            if text:
+                languageTag = self.writingSystems.Tag(WSHandle) \
+                              or wsf.GetStrFromWs(WSHandle)
+                alternatives[languageTag] = text
+        return alternatives
+
+
     # --- LCM Utilities ---
     
     def UnpackNestedPossibilityList(self, possibilityList, objClass, flat=False):
@@ -338,12 +359,24 @@ class FLExProject (object):
     
     # --- Global: Writing Systems ---
 
+    def __BuildWritingSystemRegistry(self):
+        defaultVern = self.lp.DefaultVernacularWritingSystem
+        defaultAnal = self.lp.DefaultAnalysisWritingSystem
+        return WritingSystemRegistry(
+                    ((x.Id, x.Handle, x.DisplayLabel) for x in
+                     self.project.ServiceLocator.WritingSystems.AllWritingSystems),
+                    self.lp.CurVernWss.split(),
+                    self.lp.CurAnalysisWss.split(),
+                    defaultVern.Id if defaultVern else "",
+                    defaultAnal.Id if defaultAnal else "")
+
+
     def GetAllVernacularWSs(self):
         """
         Returns a set of language tags for all vernacular writing systems used
         in this project.
         """
-        return set(self.lp.CurVernWss.split())
+        return set(self.writingSystems.vernacularTags)
            
            
     def GetAllAnalysisWSs(self):
@@ -351,7 +384,7 @@ class FLExProject (object):
         Returns a set of language tags for all analysis writing systems used
         in this project.
         """
-        return set(self.lp.CurAnalysisWss.split())
+        return set(self.writingSystems.analysisTags)
 
         
     def GetWritingSystems(self):
@@ -362,21 +395,8 @@ class FLExProject (object):
         functions.
         """
 
-        VernWSSet = self.GetAllVernacularWSs()
-        AnalWSSet = self.GetAllAnalysisWSs()
-        
-        WSList = []
-        # The names of WS associated with this project.
-        # Sorted and with no duplicates.
-        for x in self.project.ServiceLocator.WritingSystems.AllWritingSystems:
-            if x.Id in VernWSSet:
-                isVern = True
-            elif x.Id in AnalWSSet:
-                isVern = False
-            else:
-                continue        # Skip non-active WSs
-            WSList.append( (x.DisplayLabel, x.Id, x.Handle, isVern) )
-        return WSList
+        return [(ws.name, ws.languageTag, ws.handle, ws.isVernacular)
+                for ws in self.writingSystems.Active()]
 
         
     def WSUIName(self, languageTagOrHandle):
@@ -387,22 +407,7 @@ class FLExProject (object):
         Returns `None` if the language tag is not found.
         """
 
-        if isinstance(languageTagOrHandle, str):
-            languageTagOrHandle = self.__NormaliseLangTag(languageTagOrHandle)
-        
-        try:
-            return self.__WSNameCache[languageTagOrHandle]
-        except AttributeError:
-            # Create a lookup table on-demand.
-            self.__WSNameCache = {}
-            for x in self.project.ServiceLocator.WritingSystems.AllWritingSystems:
-                langTag = self.__NormaliseLangTag(x.Id)
-                self.__WSNameCache[langTag] = x.DisplayLabel
-                self.__WSNameCache[x.Handle] = x.DisplayLabel
-            # Recursive:
-            return self.WSUIName(languageTagOrHandle)
-        except KeyError:
-            return None
+        return self.writingSystems.Name(languageTagOrHandle)
 
             
     def WSHandle(self, languageTag):
@@ -412,36 +417,23 @@ class FLExProject (object):
         Returns `None` if the language tag is not found.
         """
         
-        languageTag = self.__NormaliseLangTag(languageTag)
-        
-        try:
-            return self.__WSLCIDCache[languageTag]
-        except AttributeError:
-            # Create a lookup table on-demand.
-            self.__WSLCIDCache = {}
-            for x in self.project.ServiceLocator.WritingSystems.AllWritingSystems:
-                langTag = self.__NormaliseLangTag(x.Id)
-                self.__WSLCIDCache[langTag] = x.Handle
-            # Recursive:
-            return self.WSHandle(languageTag)
-        except KeyError:
-            return None
+        return self.writingSystems.Handle(languageTag)
             
             
     def GetDefaultVernacularWS(self):
         """
         Returns the default vernacular writing system: (Language-tag, Name)
         """
-        return (self.lp.DefaultVernacularWritingSystem.Id,
-                self.lp.DefaultVernacularWritingSystem.DisplayLabel)
+        ws = self.writingSystems.defaultVernacular
+        return (ws.languageTag, ws.name)
     
     
     def GetDefaultAnalysisWS(self):
         """
         Returns the default analysis writing system: (Language-tag, Name)
         """
-        return (self.lp.DefaultAnalysisWritingSystem.Id,
-                self.lp.DefaultAnalysisWritingSystem.DisplayLabel)
+        ws = self.writingSystems.defaultAnalysis
+        return (ws.languageTag, ws.name)
 
     # --- Global: other information ---
     
@@ -473,6 +465,42 @@ class FLExProject (object):
                         flat))
 
 
+    def SemanticDomainTree(self, refresh=False):
+        """
+        Returns a `SemanticDomainTree` of all the semantic domains, with
+        the senses in each domain, for fast hierarchy queries and lookup
+        by abbreviation. It is built on the first call, and rebuilt if 
+        `refresh` is `True`.
+        """
+        if self.__domainTree is None or refresh:
+            wsHandles = {languageTag: self.WSHandle(languageTag)
+                         for languageTag in self.GetAllAnalysisWSs()}
+
+            def Domains(possibilities, parentGuid):
+                for domain in possibilities:
+                    names = {}
+                    for languageTag, handle in wsHandles.items():
+                        name = ITsString(domain.Name.get_String(handle)).Text
+                        if name:
+                            names[languageTag] = name
+                    yield (str(domain.Guid),
+                           parentGuid,
+                           ITsString(domain.Abbreviation.\
+                                     BestAnalysisAlternative).Text,
+                           names)
+                    yield from Domains(domain.SubPossibilitiesOS, 
+                                       str(domain.Guid))
+
+            senseDomains = ((str(sense.Guid), str(domain.Guid))
+                            for sense in self.ObjectsIn(ILexSenseRepository)
+                            for domain in sense.SemanticDomainsRC)
+
+            self.__domainTree = SemanticDomainTree(
+                Domains(self.lp.SemanticDomainListOA.PossibilitiesOS, None),
+                senseDomains)
+        return self.__domainTree
+
+
     # --- Global utility functions ---
     
     def BuildGotoURL(self, objectOrGuid):
@@ -527,8 +555,15 @@ class FLExProject (object):
         
             - `ITextRepository`
             - `ILexEntryRepository`
+
+        or by the class name (e.g. "Text"), as for `FWDataProject`.
         """
 
+        if isinstance(repository, str):
+            try:
+                repository = getattr(SIL.LCModel, "I%sRepository" % repository)
+            except AttributeError:
+                raise FP_ParameterError("Unknown class name: %s" % repository) from None
         return self.project.ServiceLocator.GetService(repository)
 
 
@@ -566,21 +601,151 @@ class FLExProject (object):
         return iter(repo.AllInstances())
 
 
+    def __ObjectKey(self, hvoOrGuid):
+        # The object cache key: the hvo, or the guid as a lower-case str
+        if isinstance(hvoOrGuid, int):
+            return hvoOrGuid
+        if isinstance(hvoOrGuid, (str, uuid.UUID, System.Guid)):
+            try:
+                return str(uuid.UUID(str(hvoOrGuid)))
+            except ValueError:
+                raise FP_ParameterError("Invalid parameter, hvoOrGuid")
+        raise FP_ParameterError("hvoOrGuid must be an Hvo (int), System.Guid or str")
+
+    def __LCMObjectId(self, key):
+        return key if isinstance(key, int) else System.Guid(key)
+
+    def __CacheObject(self, obj):
+        self.objectCache.Put(obj.Hvo, obj)
+        self.objectCache.Put(str(obj.Guid).lower(), obj)
+
+
     def Object(self, hvoOrGuid):
         """
-        Returns the `CmObject` for the given Hvo or guid (`str` or `System.Guid`).
+        Returns the `CmObject` for the given Hvo or guid (`str`, 
+        `System.Guid` or `uuid.UUID`).
         Refer to `.ClassName` to determine the LCM class.
+
+        Recently used objects are kept in `FLExProject.objectCache`.
+        """
+        key = self.__ObjectKey(hvoOrGuid)
+        obj = self.objectCache.Get(key)
+        if obj is None:
+            obj = self.project.ServiceLocator.GetObject(self.__LCMObjectId(key))
+            self.__CacheObject(obj)
+        return obj
+
+
+    def Objects(self, hvosOrGuids):
+        """
+        Returns a list of the `CmObject`s for an iterable of Hvos and 
+        guids (`str`, `System.Guid` or `uuid.UUID`, which can be mixed),
+        in the same order. The entry is `None` if the object doesn't
+        exist.
+
+        Each distinct object is only looked up once, and recently used
+        objects are kept in `FLExProject.objectCache`, so this is much
+        faster than calling `Object()` for long lists with repeats.
+        """
+        keys = [self.__ObjectKey(x) for x in hvosOrGuids]
+        resolved = {}
+        repo = None
+        for key in keys:
+            if key in resolved:
+                continue
+            obj = self.objectCache.Get(key)
+            if obj is None:
+                if repo is None:
+                    repo = self.ObjectRepository(ICmObjectRepository)
+                found, obj = repo.TryGetObject(self.__LCMObjectId(key), None)
+                if found:
+                    self.__CacheObject(obj)
+                else:
+                    obj = None
+            resolved[key] = obj
+        return [resolved[key] for key in keys]
+
+
+    def ObjectIds(self, hvosOrGuids):
         """
-        if isinstance(hvoOrGuid, str):
-            try:
-                hvoOrGuid = System.Guid(hvoOrGuid)
-            except System.FormatException:
-                raise FP_ParameterError("Invalid parameter, hvoOrGuid")
-                
-        if isinstance(hvoOrGuid, (System.Guid, int)):
-            return self.project.ServiceLocator.GetObject(hvoOrGuid)
-        else:
-            raise FP_ParameterError("hvoOrGuid must be an Hvo (int), System.Guid or str")
+        A lightweight version of `Objects()` that returns a list of 
+        (className, hvo) for each Hvo or guid, or `None` if the object
+        doesn't exist. The LCM objects aren't created.
+        """
+        keys = [self.__ObjectKey(x) for x in hvosOrGuids]
+        ddbf = self.project.DomainDataByFlid
+        repo = self.ObjectRepository(ICmObjectRepository)
+        resolved = {}
+        for key in keys:
+            if key in resolved:
+                continue
+            if key in self.objectCache:
+                obj = self.objectCache.Get(key)
+                if obj is not None:
+                    resolved[key] = (obj.ClassName, obj.Hvo)
+                    continue
+            objectId = self.__LCMObjectId(key)
+            if not repo.IsValidObjectId(objectId):
+                resolved[key] = None
+                continue
+            hvo = key if isinstance(key, int) else ddbf.get_ObjFromGuid(objectId)
+            classID = ddbf.get_IntProp(hvo, CmObjectTags.kflidClass)
+            resolved[key] = (self.schema.ClassName(classID), hvo)
+        return [resolved[key] for key in keys]
+
+
+    # --- Change tracking ---
+
+    def __DateModifiedFlid(self, obj):
+        # The DateModified field of the object's class, or None
+        try:
+            return self.__dateModifiedFlids[obj.ClassID]
+        except KeyError:
+            pass
+        try:
+            flid = self.schema.FieldID(obj.ClassName, "DateModified")
+        except FP_ParameterError:
+            flid = None
+        self.__dateModifiedFlids[obj.ClassID] = flid
+        return flid
+
+
+    def DateModified(self, obj):
+        """
+        Returns the date/time (UTC) that `obj` was last modified as a
+        `datetime.datetime`. Objects that don't have a DateModified 
+        field (e.g. senses) use that of their nearest owner that does
+        (e.g. the entry). Returns `None` if there isn't one.
+        """
+        while obj is not None:
+            flid = self.__DateModifiedFlid(obj)
+            if flid:
+                ticks = self.project.DomainDataByFlid.get_TimeProp(obj.Hvo, flid)
+                utc = System.DateTime(ticks, System.DateTimeKind.Local)\
+                            .ToUniversalTime()
+                return datetime.datetime(1, 1, 1) + \
+                       datetime.timedelta(microseconds=utc.Ticks // 10)
+            obj = obj.Owner
+        return None
+
+
+    def ObjectsModifiedSince(self, repository, since=None):
+        """
+        Returns a list of the objects in `repository` (e.g. 
+        `ILexSenseRepository`) that have been modified after `since`, a
+        `datetime.datetime` in UTC. All the objects are returned if
+        `since` is `None`. See `DateModified()` for how the modification
+        date is found.
+
+        See `ChangeTracker` for keeping track of `since` 
+        between runs.
+        """
+        objects = []
+        for obj in self.ObjectsIn(repository):
+            dateModified = self.DateModified(obj)
+            if since is None or (dateModified and dateModified > since):
+                objects.append(obj)
+        return objects
 
 
     # --- Lexicon ---
@@ -612,17 +777,69 @@ class FLExProject (object):
         return self.ObjectsIn(ILexEntryRepository)
 
 
-    def LexiconAllEntriesSorted(self):
+    def LexiconAllEntriesSorted(self, languageTagOrHandle=None):
         """
         Returns an iterator over all entries in the lexicon sorted by
-        the (lower-case) headword.
+        the headword in the default vernacular WS or other WS as 
+        specified by `languageTagOrHandle`. The sort order is that 
+        defined by the writing system's collation.
+
+        The headwords and their sort keys are cached, so subsequent
+        calls only read the headwords of entries that have been 
+        modified.
         """
-        entries = [(str(e.HeadWord), e) for e in self.LexiconAllEntries()]
+        WSHandle = self.__WSHandleVernacular(languageTagOrHandle)
+        cache = self.__SortKeyCache(WSHandle)
 
-        for h, e in sorted(entries, key=lambda x: x[0].lower()):
+        def Headword(entry):
+            return lambda: ITsString(entry.HeadWordForWs(WSHandle)).Text or ""
+
+        entries = ((e.Guid, 
+                    e.DateModified.Ticks,
+                    Headword(e),
+                    e) for e in self.LexiconAllEntries())
+
+        for e in cache.Sorted(entries):
             yield e
         
 
+    def __SortKeyCache(self, WSHandle):
+        """
+        Returns the `SortKeyCache` for the writing system, using the 
+        writing system's ICU collator if it has one.
+        """
+        if WSHandle not in self.__sortKeyCaches:
+            ws = self.project.ServiceLocator.WritingSystemManager.Get(WSHandle)
+            try:
+                collator = ws.DefaultCollator
+                keyFunction = lambda text: \
+                                bytes(collator.GetSortKey(text).KeyData)
+            except Exception as e:
+                logger.warning("No collator for %s (%s); using default sort"
+                               % (ws.Id, e))
+                keyFunction = FLExSort.SortKeyFunction(ws.Id)
+            self.__sortKeyCaches[WSHandle] = FLExSort.SortKeyCache(keyFunction)
+        return self.__sortKeyCaches[WSHandle]
+
+
+    def LexiconSearchIndex(self, fileName=None):
+        """
+        Returns a `LexiconIndex` of the lexeme forms, citation forms,
+        headwords, glosses and reversal forms in all writing systems, 
+        for fast lookup of entries and senses by form. E.g.::
+
+            index = project.LexiconSearchIndex()
+            for hit in index.Folded("cafe", "fr"):
+                sense = project.Object(hit.guid)
+
+        If `fileName` is given, the index is saved to it, and reused by
+        later calls until the lexicon is modified (see
+        `FLExSearch.LexiconStamp()`). See `FLExSearch.py` for the lookup
+        functions.
+        """
+        return FLExSearch.LexiconSearchIndex(self, fileName)
+
+
     #  Private writing system utilities
     
     def __WSHandle(self, languageTagOrHandle, defaultWS):
@@ -631,7 +848,7 @@ class FLExProject (object):
         else:
             #print "Specified ws =", languageTagOrHandle
             if isinstance(languageTagOrHandle, str):
-                handle = self.WSHandle(languageTagOrHandle)
+                handle = self.writingSystems.Handle(languageTagOrHandle)
             else:
                 handle = languageTagOrHandle
         if not handle:
@@ -646,9 +863,6 @@ class FLExProject (object):
         return self.__WSHandle(languageTagOrHandle,
                                self.project.DefaultAnalWs)
     
-    def __NormaliseLangTag(self, languageTag):
-        return languageTag.replace("-", "_").lower()
-    
     #  Vernacular WS fields
     
     def LexiconGetHeadword(self, entry):
@@ -893,6 +1107,72 @@ class FLExProject (object):
         return count
 
 
+    def LexiconAnalysesCounts(self, refresh=False):
+        """
+        Returns a `collections.Counter` of entry and sense guid (`str`) 
+        to the number of occurrences in the text corpus. Entries and
+        senses that don't occur have a count of zero.
+
+        This gives the same counts as `LexiconEntryAnalysesCount()` and
+        `LexiconSenseAnalysesCount()` for the whole lexicon, but is 
+        calculated in one pass over the text segments and analyses.
+        The result is cached, and recalculated if the numbers of 
+        segments, analyses or morph bundles, or the texts' modification
+        dates, have changed. Use `refresh=True` after other changes, 
+        such as a morph bundle's sense (SenseRA), morph or MSA being 
+        changed, or a text segment being pointed at a different 
+        existing analysis.
+
+        Usage::
+
+            counts = project.LexiconAnalysesCounts()
+            for entry in project.LexiconAllEntries():
+                print(project.LexiconGetHeadword(entry), 
+                      counts[str(entry.Guid)])
+        """
+
+        stamp = (self.ObjectCountFor(ISegmentRepository),
+                 self.ObjectCountFor(IWfiAnalysisRepository),
+                 self.ObjectCountFor(IWfiMorphBundleRepository),
+                 max((t.DateModified.Ticks 
+                      for t in self.ObjectsIn(ITextRepository)), default=0))
+        if self.__analysesCounts is not None and not refresh \
+           and stamp == self.__analysesCountsStamp:
+            return self.__analysesCounts
+
+        # Occurrences of each analysis (directly, or via one of its 
+        # glosses) in the text segments, by Hvo.
+        occurrences = collections.Counter()
+        for segment in self.ObjectsIn(ISegmentRepository):
+            for analysis in segment.AnalysesRS:
+                if analysis.ClassID == WfiAnalysisTags.kClassId:
+                    occurrences[analysis.Hvo] += 1
+                elif analysis.ClassID == WfiGlossTags.kClassId:
+                    occurrences[analysis.Owner.Hvo] += 1
+
+        # Each analysis is counted once for each entry and sense that
+        # its morph bundles refer to.
+        counts = collections.Counter()
+        for analysis in self.ObjectsIn(IWfiAnalysisRepository):
+            count = occurrences.get(analysis.Hvo)
+            if not count:
+                continue
+            guids = set()
+            for bundle in analysis.MorphBundlesOS:
+                if bundle.SenseRA:
+                    guids.add(str(bundle.SenseRA.Guid))
+                    guids.add(str(bundle.SenseRA.Entry.Guid))
+                for target in (bundle.MorphRA, bundle.MsaRA):
+                    if target and target.Owner.ClassID == LexEntryTags.kClassId:
+                        guids.add(str(target.Owner.Guid))
+            for guid in guids:
+                counts[guid] += count
+
+        self.__analysesCounts = counts
+        self.__analysesCountsStamp = stamp
+        return counts
+
+
     # --- Lexicon: field functions ---
 
     def GetFieldID(self, className, fieldName):
@@ -905,19 +1185,56 @@ class FLExProject (object):
             GetFieldID("LexSense", "DomainTypes")
         """
 
-        mdc = self.project.MetaDataCacheAccessor
+        return self.schema.FieldID(className, fieldName)
 
-        if fieldName[-2:] in ("OA", "OS", "OC", "RA", "RS", "RC"):
-            fieldName = fieldName[:-2]
 
-        try:
-            # True=include base classes if needed.
-            flid = mdc.GetFieldId(className, fieldName, True) 
-        except (LcmInvalidFieldException, 
-                LcmInvalidClassException) as e:
-            # "from None" avoids confusion of both exceptions being reported.
-            raise FP_ParameterError(e.Message) from None
-        return flid
+    def StringReader(self, className, fieldPath, languageTagOrHandle=None):
+        """
+        Returns a `StringReader` for a string or multi-string field,
+        with the field and writing system resolved once, for fast reading
+        of the field from many objects. E.g.::
+
+            glossReader = project.StringReader("LexSense", "Gloss", "en")
+            glosses = glossReader.Many(senses)
+
+            lexemeReader = project.StringReader("LexEntry", "LexemeForm.Form")
+            lexemeForm = lexemeReader(entry)
+
+        `fieldPath` is a field name, or a dotted path of atomic object
+        fields ending in a string field. The reader returns the empty
+        string if an object along the path is missing.
+
+        If `languageTagOrHandle` is `None`, the default vernacular WS is
+        used for vernacular fields, and otherwise the default analysis WS.
+        """
+        path = []
+        fieldNames = fieldPath.split(".")
+        for fieldName in fieldNames[:-1]:
+            flid = self.schema.FieldID(className, fieldName)
+            info = self.schema.Field(flid)
+            if info.fieldType not in (CellarPropertyType.OwningAtomic,
+                                      CellarPropertyType.ReferenceAtomic):
+                raise FP_ParameterError("StringReader: '%s' is not an atomic field"
+                                        % fieldName)
+            path.append(flid)
+            className = self.schema.ClassName(info.destClassID)
+
+        flid = self.schema.FieldID(className, fieldNames[-1])
+        info = self.schema.Field(flid)
+        if info.fieldType not in FLExLCM.CellarAllStringTypes:
+            raise FP_ParameterError("StringReader: '%s' is not a string field"
+                                    % fieldNames[-1])
+        path.append(flid)
+
+        if info.wsSelector in (WritingSystemServices.kwsVern,
+                               WritingSystemServices.kwsVerns,
+                               WritingSystemServices.kwsFirstVern,
+                               WritingSystemServices.kwsVernAnals):
+            WSHandle = self.__WSHandleVernacular(languageTagOrHandle)
+        else:
+            WSHandle = self.__WSHandleAnalysis(languageTagOrHandle)
+
+        return StringReader(self.project, path, info.fieldType, WSHandle)
  
  
     def __ValidatedHvo(self, senseOrEntryOrHvo, fieldID):
@@ -952,8 +1269,7 @@ class FLExProject (object):
         hvo = self.__ValidatedHvo(senseOrEntryOrHvo, fieldID)
 
         # Adapted from XDumper.cs::GetCustomFieldValue
-        mdc = IFwMetaDataCacheManaged(self.project.MetaDataCacheAccessor)
-        fieldType = CellarPropertyType(mdc.GetFieldType(fieldID))
+        fieldType = self.schema.FieldType(fieldID)
 
         if fieldType in FLExLCM.CellarStringTypes:
             return ITsString(self.project.DomainDataByFlid.\
@@ -998,8 +1314,7 @@ class FLExProject (object):
         """
         if not fieldID: raise FP_NullParameterError()
         
-        mdc = IFwMetaDataCacheManaged(self.project.MetaDataCacheAccessor)
-        fieldType = CellarPropertyType(mdc.GetFieldType(fieldID))
+        fieldType = self.schema.FieldType(fieldID)
         return fieldType in FLExLCM.CellarStringTypes
 
 
@@ -1010,8 +1325,7 @@ class FLExProject (object):
         """
         if not fieldID: raise FP_NullParameterError()
         
-        mdc = IFwMetaDataCacheManaged(self.project.MetaDataCacheAccessor)
-        fieldType = CellarPropertyType(mdc.GetFieldType(fieldID))
+        fieldType = self.schema.FieldType(fieldID)
         return fieldType in FLExLCM.CellarMultiTypes
 
         
@@ -1021,8 +1335,7 @@ class FLExProject (object):
         """
         if not fieldID: raise FP_NullParameterError()
         
-        mdc = IFwMetaDataCacheManaged(self.project.MetaDataCacheAccessor)
-        fieldType = CellarPropertyType(mdc.GetFieldType(fieldID))
+        fieldType = self.schema.FieldType(fieldID)
         return fieldType in FLExLCM.CellarAllStringTypes
 
         
@@ -1080,8 +1393,7 @@ class FLExProject (object):
         
         WSHandle = self.__WSHandleAnalysis(languageTagOrHandle)
 
-        mdc = IFwMetaDataCacheManaged(self.project.MetaDataCacheAccessor)
-        fieldType = CellarPropertyType(mdc.GetFieldType(fieldID))
+        fieldType = self.schema.FieldType(fieldID)
 
         tss = TsStringUtils.MakeString(text, WSHandle)
         
@@ -1113,8 +1425,7 @@ class FLExProject (object):
 
         hvo = self.__ValidatedHvo(senseOrEntryOrHvo, fieldID)
 
-        mdc = IFwMetaDataCacheManaged(self.project.MetaDataCacheAccessor)
-        fieldType = CellarPropertyType(mdc.GetFieldType(fieldID))
+        fieldType = self.schema.FieldType(fieldID)
         
         if fieldType in FLExLCM.CellarStringTypes:
             try:
@@ -1126,8 +1437,8 @@ class FLExProject (object):
             # MultiUnicodeAccessor
             mua = self.project.DomainDataByFlid.get_MultiStringProp(hvo, fieldID)
             try:
-                for ws in (self.GetAllAnalysisWSs() | self.GetAllVernacularWSs()):
-                    mua.set_String(self.WSHandle(ws), None)
+                for ws in self.writingSystems.Active():
+                    mua.set_String(ws.handle, None)
             except LcmInvalidFieldException as msg:
                 raise FP_ReadOnlyError()        
         else:
@@ -1144,8 +1455,7 @@ class FLExProject (object):
 
         hvo = self.__ValidatedHvo(senseOrEntryOrHvo, fieldID)
 
-        mdc = IFwMetaDataCacheManaged(self.project.MetaDataCacheAccessor)
-        if CellarPropertyType(mdc.GetFieldType(fieldID)) != CellarPropertyType.Integer:
+        if self.schema.FieldType(fieldID) != CellarPropertyType.Integer:
             raise FP_ParameterError("LexiconSetFieldInteger: field is not Integer type")
 
         if self.project.DomainDataByFlid.get_IntProp(hvo, fieldID) != integer:
@@ -1190,8 +1500,7 @@ class FLExProject (object):
         if not senseOrEntry: raise FP_NullParameterError()
         if not fieldID: raise FP_NullParameterError()
 
-        mdc = IFwMetaDataCacheManaged(self.project.MetaDataCacheAccessor)
-        fieldType = CellarPropertyType(mdc.GetFieldType(fieldID))
+        fieldType = self.schema.FieldType(fieldID)
         if fieldType not in (CellarPropertyType.ReferenceAtom, 
                              CellarPropertyType.ReferenceCollection):
             raise FP_ParameterError("ListFieldPossibilityList: field must be a List type")
@@ -1218,18 +1527,46 @@ class FLExProject (object):
         return pList.PossibilitiesOS
 
 
-    def ListFieldLookup(self, senseOrEntry, fieldID, value):
+    def __PossibilityListIndex(self, pList):
+        """
+        Returns the (cached) `PossibilityListIndex` for the list, 
+        indexing all the analysis writing systems, with the default 
+        analysis WS first.
+        """
+        try:
+            return self.__listIndexes[pList.Hvo]
+        except KeyError:
+            pass
+        wsHandles = [self.project.DefaultAnalWs]
+        for languageTag in self.writingSystems.analysisTags:
+            handle = self.writingSystems.Handle(languageTag)
+            if handle and handle not in wsHandles:
+                wsHandles.append(handle)
+        index = PossibilityListIndex(pList, wsHandles,
+                    lambda: self.ObjectCountFor(ICmPossibilityRepository))
+        self.__listIndexes[pList.Hvo] = index
+        return index
+
+
+    def ListFieldLookup(self, senseOrEntry, fieldID, value, 
+                        ignoreCase=False, refresh=False):
         """
         Looks up the value (a string) in the `CmPossibilityList` for the
-        given field.
+        given field. The value can be the name or abbreviation in any 
+        analysis writing system, and includes sub-possibilities. Set 
+        `ignoreCase` to `True` for a case-insensitive match.
         Returns the `CmPossibility` object, or `None` if it can't be found.
+
+        The names are indexed on the first lookup in each list, so 
+        subsequent lookups are fast. The index is rebuilt when the list
+        is modified or possibilities are added or deleted, but not when
+        a possibility is renamed: set `refresh` to `True` after renaming
+        possibilities.
         """
         
         pList = self.ListFieldPossibilityList(senseOrEntry, fieldID)
-        wsa = self.lp.DefaultAnalysisWritingSystem.Handle
-        return pList.FindPossibilityByName(pList.PossibilitiesOS,
-                                           value,
-                                           wsa)
+        return self.__PossibilityListIndex(pList).Lookup(value, ignoreCase,
+                                                         refresh)
 
 
     def LexiconSetListFieldSingle(self, 
@@ -1322,10 +1659,9 @@ class FLExProject (object):
             hvoList = listOfValues
         else:
             if type(listOfValues[0]) is str:
-                possibilities = [self.ListFieldLookup(senseOrEntry,
-                                                      fieldID, 
-                                                      s)
-                                 for s in listOfValues]
+                index = self.__PossibilityListIndex(
+                            self.ListFieldPossibilityList(senseOrEntry, fieldID))
+                possibilities = [index.Lookup(s) for s in listOfValues]
                 if not all(possibilities):
                     raise FP_ParameterError("LexiconSetListFieldMultiple: one or more values not valid.")
             else:
@@ -1350,24 +1686,13 @@ class FLExProject (object):
     
     def __GetCustomFieldsOfType(self, classID):
         """
-        Generator for finding all the custom fields belonging to the
-        given class.
-        Returns tuples of (flid, label)
+        Returns a list of all the custom fields belonging to the
+        given class, as tuples of (flid, label)
         """
-
-        # The MetaDataCache defines the project structure: we can
-        # find the custom fields in here.
-        mdc = IFwMetaDataCacheManaged(self.project.MetaDataCacheAccessor)
-        
-        for flid in mdc.GetFields(classID, False, int(CellarPropertyTypeFilter.All)):
-            if self.project.GetIsCustomField(flid):
-                yield ((flid, mdc.GetFieldLabel(flid)))
+        return self.schema.CustomFields(classID)
 
     def __FindCustomField(self, classID, fieldName):
-        for flid, name in self.__GetCustomFieldsOfType(classID):
-            if name == fieldName:
-                return flid
-        return None
+        return self.schema.CustomFieldNamed(classID, fieldName)
 
 
     def LexiconGetEntryCustomFields(self):
@@ -1375,7 +1700,7 @@ class FLExProject (object):
         Returns a list of the custom fields defined at entry level.
         Each item in the list is a tuple of (flid, label)
         """
-        return list(self.__GetCustomFieldsOfType(LexEntryTags.kClassId))
+        return self.__GetCustomFieldsOfType(LexEntryTags.kClassId)
 
 
     def LexiconGetSenseCustomFields(self):
@@ -1383,7 +1708,7 @@ class FLExProject (object):
         Returns a list of the custom fields defined at sense level.
         Each item in the list is a tuple of (flid, label)
         """
-        return list(self.__GetCustomFieldsOfType(LexSenseTags.kClassId))
+        return self.__GetCustomFieldsOfType(LexSenseTags.kClassId)
 
 
     def LexiconGetExampleCustomFields(self):
@@ -1391,7 +1716,7 @@ class FLExProject (object):
         Returns a list of the custom fields defined at example level.
         Each item in the list is a tuple of (flid, label)
         """
-        return list(self.__GetCustomFieldsOfType(LexExampleSentenceTags.kClassId))
+        return self.__GetCustomFieldsOfType(LexExampleSentenceTags.kClassId)
         
         
     def LexiconGetAllomorphCustomFields(self):
@@ -1399,7 +1724,7 @@ class FLExProject (object):
         Returns a list of the custom fields defined at allomorph level.
         Each item in the list is a tuple of (flid, label)
         """
-        return list(self.__GetCustomFieldsOfType(MoFormTags.kClassId))
+        return self.__GetCustomFieldsOfType(MoFormTags.kClassId)
         
         
     def LexiconGetEntryCustomFieldNamed(self, fieldName):
@@ -1419,7 +1744,363 @@ class FLExProject (object):
         """
         return self.__FindCustomField(LexSenseTags.kClassId, fieldName)
 
+
+    # --- Lexicon: bulk export ---
+
+    def __ExportFieldID(self, className, classID, field):
+        """
+        Resolves a field name (standard field name or custom field label)
+        or flid for `LexiconExportColumns()`. Returns `None` if it isn't
+        a field of the class.
+        """
+        if isinstance(field, int):
+            # (Includes base class fields)
+            if field in self.schema.Fields(classID):
+                return field
+            return None
+        try:
+            return self.GetFieldID(className, field)
+        except FP_ParameterError:
+            return self.__FindCustomField(classID, field)
+
+
+    def __ExportReader(self, flid, WSHandle):
+        """
+        Returns a function that reads the given field from an hvo, with
+        the field type and writing system resolved once, up front.
+        """
+        fieldType = self.schema.FieldType(flid)
+        ddbf = self.project.DomainDataByFlid
+        getObject = self.project.ServiceLocator.GetObject
+
+        if fieldType in FLExLCM.CellarStringTypes:
+            def reader(hvo):
+                return ITsString(ddbf.get_StringProp(hvo, flid)).Text or ""
+
+        elif fieldType in FLExLCM.CellarMultiStringTypes:
+            if WSHandle:
+                def reader(hvo):
+                    return ITsString(ddbf.get_MultiStringAlt(hvo, flid, 
+                                                             WSHandle)).Text or ""
+            else:
+                def reader(hvo):
+                    mua = ddbf.get_MultiStringProp(hvo, flid)
+                    text = ITsString(mua.BestAnalysisVernacularAlternative).Text
+                    return text if text and text != "***" else ""
+
+        elif fieldType == CellarPropertyType.Integer:
+            def reader(hvo):
+                return ddbf.get_IntProp(hvo, flid)
+
+        elif fieldType == CellarPropertyType.Boolean:
+            def reader(hvo):
+                return ddbf.get_BooleanProp(hvo, flid)
+
+        elif fieldType in (CellarPropertyType.ReferenceAtom,
+                           CellarPropertyType.OwningAtom):
+            def reader(hvo):
+                item = ddbf.get_ObjectProp(hvo, flid)
+                return getObject(item).ShortName if item else ""
+
+        elif fieldType in (CellarPropertyType.ReferenceCollection,
+                           CellarPropertyType.ReferenceSequence,
+                           CellarPropertyType.OwningCollection,
+                           CellarPropertyType.OwningSequence):
+            def reader(hvo):
+                return [getObject(item).ShortName 
+                        for item in ddbf.VecProp(hvo, flid)]
+        else:
+            raise FP_ParameterError("LexiconExportColumns: field %s is not a supported type"
+                                    % self.schema.Field(flid).name)
+        return reader
+
+
+    def LexiconExportColumns(self, fieldSpecs, senses=False, asDataFrame=False):
+        """
+        Extracts fields from all the entries (or senses) in the lexicon in 
+        a single pass, and returns them as columns. This is much faster 
+        than calling the `LexiconGet...()` functions for each entry, since 
+        each field and writing system is only looked up once.
+
+        fieldSpecs:
+            A list of fields, each of which is a field name, a flid, or 
+            a tuple of (field name or flid, `languageTagOrHandle`).
+            Field names are LCM field names (e.g. "CitationForm", 
+            "Gloss"), custom field names, or one of the special names:
+
+                - "Headword"
+                - "LexemeForm" (default vernacular WS)
+                - "POS" (senses only)
+
+            Multi-string fields without a writing system return the 
+            best analysis or vernacular string.
+
+        senses:
+            If `True`, there is a row for each sense (including subsenses), 
+            otherwise a row for each entry. Entry-level fields can be 
+            included with senses, in which case the entry value is 
+            repeated for each sense.
+
+        asDataFrame:
+            Return a `pandas.DataFrame` indexed by guid. Raises 
+            `FP_RuntimeError` if pandas is not installed.
+
+        Returns a dictionary of column name to list of values. The "guid"
+        column has the entry or sense guid for each row, and if `senses` 
+        is `True`, the "entryGuid" column has the owning entry's guid. 
+        Fields with a writing system are named "field:languageTag". E.g.::
+
+            columns = project.LexiconExportColumns(["Headword",
+                                                    ("Gloss", "en"),
+                                                    ("Gloss", "fr"),
+                                                    "POS"],
+                                                   senses=True)
+            for guid, gloss in zip(columns["guid"], columns["Gloss:en"]):
+                ...
+        """
+
+        if asDataFrame:
+            try:
+                import pandas
+            except ImportError:
+                raise FP_RuntimeError("LexiconExportColumns: asDataFrame requires pandas") from None
+
+        wsf = self.project.WritingSystemFactory
+        
+        # Resolve each field spec to a column name and a reader function
+        # that takes the row object.
+        readers = []
+        for spec in fieldSpecs:
+            if isinstance(spec, tuple):
+                field, languageTagOrHandle = spec
+            else:
+                field, languageTagOrHandle = spec, None
+            
+            if languageTagOrHandle is None:
+                WSHandle = None
+                columnName = str(field)
+            else:
+                WSHandle = self.__WSHandle(languageTagOrHandle, None)
+                columnName = "%s:%s" % (field, 
+                                        self.writingSystems.Tag(WSHandle)
+                                        or wsf.GetStrFromWs(WSHandle))
+
+            onEntry = False
+            if field == "Headword":
+                onEntry = True
+                if WSHandle:
+                    reader = lambda e, ws=WSHandle: \
+                                ITsString(e.HeadWordForWs(ws)).Text or ""
+                else:
+                    reader = lambda e: e.HeadWord.Text or ""
+            elif field == "LexemeForm":
+                onEntry = True
+                formReader = self.__ExportReader(MoFormTags.kflidForm,
+                                    WSHandle or self.project.DefaultVernWs)
+                reader = lambda e, r=formReader: r(e.LexemeFormOA.Hvo) \
+                                   if e.LexemeFormOA else ""
+            elif field == "POS" and senses:
+                reader = self.LexiconGetSensePOS
+            else:
+                flid = None
+                if senses:
+                    flid = self.__ExportFieldID("LexSense", 
+                                                LexSenseTags.kClassId, field)
+                if not flid:
+                    onEntry = True
+                    flid = self.__ExportFieldID("LexEntry", 
+                                                LexEntryTags.kClassId, field)
+                if not flid:
+                    raise FP_ParameterError("LexiconExportColumns: unknown field: %s" 
+                                            % field)
+                if isinstance(field, int):
+                    columnName = columnName.replace(str(field), 
+                                                    self.schema.Field(field).name, 1)
+                hvoReader = self.__ExportReader(flid, WSHandle)
+                reader = lambda obj, r=hvoReader: r(obj.Hvo)
+
+            if senses and onEntry:
+                reader = lambda sense, r=reader: r(sense.Entry)
+            readers.append((columnName, reader))
+
+        # Walk the lexicon once
+        columns = {"guid" : []}
+        if senses:
+            columns["entryGuid"] = []
+        for columnName, reader in readers:
+            columns[columnName] = []
+        
+        for entry in self.LexiconAllEntries():
+            if senses:
+                entryGuid = str(entry.Guid)
+                rows = entry.AllSenses
+            else:
+                rows = (entry,)
+            for obj in rows:
+                columns["guid"].append(str(obj.Guid))
+                if senses:
+                    columns["entryGuid"].append(entryGuid)
+                for columnName, reader in readers:
+                    columns[columnName].append(reader(obj))
+
+        if asDataFrame:
+            return pandas.DataFrame(columns).set_index("guid")
+        return columns
+
         
+    # --- Lexicon: bulk update ---
+
+    def __FieldPossibilityListIndex(self, flid, obj):
+        """
+        Returns the `PossibilityListIndex` for the given list field.
+        """
+        listRoot = self.schema.Field(flid).listRoot
+        if listRoot:
+            pList = ICmPossibilityList(self.Object(listRoot))
+        else:
+            if isinstance(obj, int):
+                obj = self.Object(obj)
+            pList = self.ListFieldPossibilityList(obj, flid)
+        return self.__PossibilityListIndex(pList)
+
+
+    def __FieldWriter(self, flid, WSHandle):
+        """
+        Returns a function that writes a value to the given field of an 
+        object. The field type is resolved once, up front.
+        """
+        fieldType = self.schema.FieldType(flid)
+        ddbf = self.project.DomainDataByFlid
+
+        if fieldType in FLExLCM.CellarStringTypes:
+            def writer(obj, hvo, value):
+                tss = TsStringUtils.MakeString(value, WSHandle) if value else None
+                ddbf.SetString(hvo, flid, tss)
+
+        elif fieldType in FLExLCM.CellarMultiStringTypes:
+            def writer(obj, hvo, value):
+                tss = TsStringUtils.MakeString(value, WSHandle) if value else None
+                ddbf.SetMultiStringAlt(hvo, flid, WSHandle, tss)
+
+        elif fieldType == CellarPropertyType.Integer:
+            def writer(obj, hvo, value):
+                if ddbf.get_IntProp(hvo, flid) != value:
+                    ddbf.SetInt(hvo, flid, value)
+
+        elif fieldType == CellarPropertyType.Boolean:
+            def writer(obj, hvo, value):
+                ddbf.SetBoolean(hvo, flid, bool(value))
+
+        elif fieldType in (CellarPropertyType.ReferenceAtom,
+                           CellarPropertyType.ReferenceCollection,
+                           CellarPropertyType.ReferenceSequence):
+            # The possibility list is found once, on first use.
+            lists = []
+            def ToHvo(obj, value):
+                if isinstance(value, int):
+                    return value
+                if isinstance(value, str):
+                    if not lists:
+                        lists.append(self.__FieldPossibilityListIndex(flid, obj))
+                    possibility = lists[0].Lookup(value)
+                    if not possibility:
+                        raise FP_ParameterError(f"'{value}' not found in the Possibility list")
+                    return possibility.Hvo
+                try:
+                    return value.Hvo
+                except AttributeError:
+                    raise FP_ParameterError("List values must be a string, "
+                                            "CmPossibility or hvo") from None
+
+            if fieldType == CellarPropertyType.ReferenceAtom:
+                def writer(obj, hvo, value):
+                    ddbf.SetObjProp(hvo, flid, ToHvo(obj, value) if value else 0)
+            else:
+                def writer(obj, hvo, value):
+                    if value is None or isinstance(value, (str, int)):
+                        values = [value] if value else []
+                    else:
+                        values = value
+                    hvoList = [ToHvo(obj, v) for v in values]
+                    ddbf.Replace(hvo, flid, 
+                                 0, ddbf.get_VecSize(hvo, flid),
+                                 hvoList, len(hvoList))
+        else:
+            raise FP_ParameterError("LexiconSetFieldValues: field %s is not a supported type"
+                                    % self.schema.Field(flid).name)
+        return writer
+
+
+    def LexiconSetFieldValues(self, rows, languageTagOrHandle=None):
+        """
+        Writes values to many fields in one call. This is much faster 
+        than the individual `LexiconSet...()` functions, since each
+        field's type, writing system and possibility list is only 
+        looked up once.
+
+        rows:
+            An iterable of (object or hvo, fieldID, value) tuples. 
+            The value can be:
+
+                - a string for String and MultiString fields (the
+                  empty string or `None` clears the field);
+                - an integer for Integer fields;
+                - a boolean for Boolean fields;
+                - a `CmPossibility` object, hvo or string (the full 
+                  name or the abbreviation; case-sensitive) for 'single'
+                  (Atomic) list fields, or `None` to clear the field;
+                - a list of these for 'multiple' (Collection) list 
+                  fields, which replaces the current values.
+
+            A row can have a fourth item, `languageTagOrHandle`, to 
+            override the writing system for that row.
+
+        languageTagOrHandle:
+            The writing system for string fields. Defaults to the 
+            default analysis WS.
+            
+        Errors in a row don't stop the remaining rows being written.
+        Returns a list of (row number, exception) for the rows that 
+        failed. The row number counts from zero.
+        """
+
+        if not self.writeEnabled: raise FP_ReadOnlyError()
+
+        defaultWSHandle = self.__WSHandleAnalysis(languageTagOrHandle)
+        writers = {}
+        failures = []
+
+        for rowNumber, row in enumerate(rows):
+            try:
+                if len(row) == 4:
+                    obj, fieldID, value, rowWS = row
+                    WSHandle = self.__WSHandleAnalysis(rowWS)
+                else:
+                    obj, fieldID, value = row
+                    WSHandle = defaultWSHandle
+
+                hvo = self.__ValidatedHvo(obj, fieldID)
+
+                try:
+                    writer = writers[(fieldID, WSHandle)]
+                except KeyError:
+                    writer = writers[(fieldID, WSHandle)] = \
+                        self.__FieldWriter(fieldID, WSHandle)
+
+                try:
+                    writer(obj, hvo, value)
+                except LcmInvalidFieldException:
+                    # This exception indicates that the project is not in write mode
+                    raise FP_ReadOnlyError()
+
+            except Exception as e:
+                logger.debug("LexiconSetFieldValues: row %d failed: %s" 
+                             % (rowNumber, e))
+                failures.append((rowNumber, e))
+
+        return failures
+
+
     # --- Lexical Relations ---
     
     def GetLexicalRelationTypes(self):
@@ -1446,6 +2127,31 @@ class FLExProject (object):
                                 # LexSense
         """
         return self.ObjectsIn(ILexRefTypeRepository)
+
+
+    def LexicalRelationGraph(self, refresh=False):
+        """
+        Returns a `RelationGraph` of the lexical relations between
+        entries and senses, with edges that follow the `MappingType` of
+        each relation type, for neighbour, closure, shortest path and
+        connected component queries (see FLExRelations.py). It is built
+        on the first call, and rebuilt if `refresh` is `True`. E.g.::
+
+            graph = project.LexicalRelationGraph()
+            node = graph.Node(sense.Guid)
+            parts = graph.Closure(node, "Part", graph.Forward)
+        """
+        if self.__relationGraph is None or refresh:
+            relationTypes = ((str(lrt.Guid),
+                              self.BestStr(lrt.Name),
+                              self.BestStr(lrt.ReverseName),
+                              lrt.MappingType,
+                              ([(str(target.Guid), target.ClassName)
+                                        for target in ref.TargetsRS]
+                               for ref in lrt.MembersOC))
+                             for lrt in self.GetLexicalRelationTypes())
+            self.__relationGraph = RelationGraph(relationTypes)
+        return self.__relationGraph
         
     
     # --- Publications ---
@@ -1456,8 +2162,11 @@ class FLExProject (object):
         project.
         """
 
+        pubList = self.lexDB.PublicationTypesOA
+        if not pubList:
+            return []
         return [self.BestStr(pub.Name) 
-                for pub in self.lexDB.PublicationTypesOA.PossibilitiesOS]
+                for pub in pubList.PossibilitiesOS]
 
 
     def PublicationType(self, publicationName):
@@ -1467,35 +2176,103 @@ class FLExProject (object):
         found using `GetPublications()`.)
         """
 
-        for pub in self.lexDB.PublicationTypesOA.PossibilitiesOS:
+        pubList = self.lexDB.PublicationTypesOA
+        if not pubList:
+            return None
+        for pub in pubList.PossibilitiesOS:
             if self.BestStr(pub.Name) == publicationName:
                 return pub
         else:
             return None
 
 
+    def PublicationMembership(self, refresh=False):
+        """
+        Returns a `PublicationMembership` with bitmaps of the entries and
+        senses in each publication, built in one pass over the lexicon
+        (see FLExPublications.py). It is built on the first call, and
+        rebuilt if the number of entries or senses, or the publications,
+        change. Use `refresh=True` after other changes, such as to an
+        entry's or sense's DoNotPublishIn field. E.g.::
+
+            pubs = project.PublicationMembership()
+            webOnly = pubs.Entries("Web") & ~pubs.Entries("Main Dictionary")
+            for guid in pubs.EntryGuids(webOnly):
+                ...
+        """
+        pubList = self.lexDB.PublicationTypesOA
+        publicationTypes = list(pubList.PossibilitiesOS) if pubList else []
+        stamp = (self.LexiconNumberOfEntries(),
+                 self.ObjectCountFor(ILexSenseRepository),
+                 tuple((str(pub.Guid), self.BestStr(pub.Name))
+                       for pub in publicationTypes))
+        if self.__publications is None or refresh \
+           or self.__publications.stamp != stamp:
+            def Senses(senses):
+                for sense in senses:
+                    yield (str(sense.Guid),
+                           [str(pub.Guid) for pub in sense.DoNotPublishInRC],
+                           Senses(sense.SensesOS))
+
+            publications = ((str(pub.Guid), self.BestStr(pub.Name))
+                            for pub in publicationTypes)
+            entries = ((str(entry.Guid),
+                        [str(pub.Guid) for pub in entry.DoNotPublishInRC],
+                        Senses(entry.SensesOS))
+                       for entry in self.LexiconAllEntries())
+
+            self.__publications = PublicationMembership(publications, entries,
+                                                        stamp)
+        return self.__publications
+
+
+    def PublicationEntries(self, publication, excluding=None):
+        """
+        Returns an iterator over the entries in `publication` (a name or
+        guid), in lexicon order. If `excluding` is given, then the 
+        entries that are also in that publication are skipped.
+        """
+        pubs = self.PublicationMembership()
+        bitmap = pubs.Entries(publication)
+        if excluding is not None:
+            bitmap &= ~pubs.Entries(excluding)
+        return (self.Object(guid) for guid in pubs.EntryGuids(bitmap))
+
+
     # --- Reversal Indices ---
 
+    def ReversalRegistry(self):
+        """
+        Returns the `ReversalRegistry` of the project's reversal indexes,
+        with a table of all the entries (including subentries) and their
+        forms for each index (see FLExReversals.py). The tables are 
+        built when first used and rebuilt when their index is modified.
+        """
+        if self.__reversals is None:
+            self.__reversals = ReversalRegistry(self)
+        return self.__reversals
+
+
     def ReversalIndex(self, languageTag):
         """
         Returns the reversal index for `languageTag` (eg 'en'). 
         Returns `None` if there is no reversal index for
         that writing system.
         """
-        languageTag = self.__NormaliseLangTag(languageTag)
-        
-        for ri in self.lexDB.ReversalIndexesOC:
-            if self.__NormaliseLangTag(ri.WritingSystem) == languageTag:
-                return ri
-
-        return None
+        return self.ReversalRegistry().Index(languageTag)
 
 
-    def ReversalEntries(self, languageTag):
+    def ReversalEntries(self, languageTag, includeSubentries=False):
         """
-        Returns an iterator for the reversal entries for `languageTag` (eg 'en'). Returns `None` if there is no reversal index for
+        Returns an iterator for the reversal entries for `languageTag` 
+        (eg 'en'). Returns `None` if there is no reversal index for
         that writing system.
+        If `includeSubentries` is `True`, then the subentries are included,
+        each following its parent entry.
         """
+        if includeSubentries:
+            entries = self.ReversalRegistry().Entries(languageTag)
+            return iter(entries) if entries is not None else None
         ri = self.ReversalIndex(languageTag)
         if ri:
             return iter(ri.EntriesOC)
@@ -1503,6 +2280,14 @@ class FLExProject (object):
             return None
 
 
+    def ReversalFind(self, form, languageTag, ignoreCase=False):
+        """
+        Returns a list of the reversal entries and subentries for 
+        `languageTag` with the reversal form `form`.
+        """
+        return self.ReversalRegistry().Find(form, languageTag, ignoreCase)
+
+
     def ReversalGetForm(self, entry, languageTagOrHandle=None):
         """
         Returns the citation form for the reversal entry in the default
@@ -1570,3 +2355,41 @@ class FLExProject (object):
                 else:                
                     yield "\n".join(content)        
 
+
+    def TextsCorpus(self, corpus=None):
+        """
+        Returns a `Corpus` of the words in all the texts, for frequency,
+        n-gram and concordance queries (see `FLExCorpus.py`). The 
+        paragraphs are split into words by writing system.
+        If an existing `corpus` is given, it is updated: only the texts
+        that have been modified since are re-indexed.
+        """
+        if corpus is None:
+            corpus = Corpus()
+
+        corpus.Update((str(t.Guid),
+                       (t.DateModified.Ticks, 
+                        t.ContentsOA.DateModified.Ticks if t.ContentsOA else None),
+                       ITsString(t.Name.BestVernacularAnalysisAlternative).Text,
+                       lambda t=t: self.TextsGetParagraphRuns(t))
+                      for t in self.ObjectsIn(ITextRepository))
+        return corpus
+
+
+    def TextsGetParagraphRuns(self, text):
+        """
+        Returns the paragraphs of `text` as a list, where each paragraph
+        is a list of (`languageTag`, `text`) runs.
+        """
+        wsf = self.project.WritingSystemFactory
+        def LanguageTag(WSHandle):
+            return self.writingSystems.Tag(WSHandle) or wsf.GetStrFromWs(WSHandle)
+
+        paragraphs = []
+        if text.ContentsOA:
+            for p in text.ContentsOA.ParagraphsOS:
+                tss = ITsString(IStTxtPara(p).Contents)
+                paragraphs.append([(LanguageTag(tss.get_WritingSystem(i)),
+                                    tss.get_RunText(i) or "")
+                                   for i in range(tss.RunCount)])
+        return paragraphs
@@ -0,0 +1,226 @@
+#
+#   FLExPublications.py
+#
+#   Module: Publication membership bitmaps.
+#
+#           Entries and senses are given dense indexes (in lexicon
+#           order), and each publication has a bitmap (a Python int) of
+#           the entries and of the senses that are published in it. So
+#           one pass over the lexicon gives the contents of all the
+#           publications, and queries such as "in publication X but not
+#           in Y" are bitwise operations on the bitmaps.
+#
+#           An entry is in a publication unless the publication is in
+#           its DoNotPublishIn field. A sense is in a publication if
+#           its owning entry (and sense, for subsenses) is, and the
+#           publication isn't in the sense's DoNotPublishIn field.
+#
+#           The bitmaps are built by FLExProject.PublicationMembership()
+#           or FWDataProject.PublicationMembership().
+#
+#   Platform: Python 3
+#
+#   Copyright Craig Farrow, 2025
+#
+
+from .FLExExceptions import FP_ParameterError
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+#--------------------------------------------------------------------
+
+def BitCount(bitmap):
+    """
+    Returns the number of members of `bitmap`.
+    """
+    return bin(bitmap).count("1")
+
+
+def BitIndexes(bitmap):
+    """
+    Yields the indexes of the members of `bitmap`, in order.
+    """
+    data = bitmap.to_bytes((bitmap.bit_length() + 7) // 8, "little")
+    for byteIndex, byte in enumerate(data):
+        if byte:
+            base = byteIndex * 8
+            for bit in range(8):
+                if byte & (1 << bit):
+                    yield base + bit
+
+
+#--------------------------------------------------------------------
+
+class PublicationMembership(object):
+    """
+    Bitmaps of the entries and senses in each publication.
+
+    publications:
+        An iterable of (guid, name) for the publications.
+
+    entries:
+        An iterable of (entryGuid, doNotPublishIn, senses) where
+        `doNotPublishIn` is an iterable of publication guids, and
+        `senses` is an iterable of (senseGuid, doNotPublishIn, senses)
+        for the senses and their subsenses.
+
+    stamp:
+        An optional value identifying the state of the project, so that
+        the project can tell when to rebuild the bitmaps.
+
+    Usage::
+
+        pubs = project.PublicationMembership()
+        onlyMain = pubs.Entries("Main Dictionary") & ~pubs.Entries("Web")
+        for guid in pubs.EntryGuids(onlyMain):
+            entry = project.Object(guid)
+            ...
+    """
+
+    def __init__(self, publications, entries, stamp=None):
+        # `stamp` identifies the state of the project that the bitmaps
+        # were built from.
+        self.stamp = stamp
+        self.names = []
+        self.guids = []
+        self.entryGuids = []
+        self.senseGuids = []
+
+        self.__indexes = {}                     # guid or name -> index
+        self.__entryBitmaps = []
+        self.__senseBitmaps = []
+
+        for guid, name in publications:
+            i = len(self.guids)
+            guid = str(guid).lower()
+            self.guids.append(guid)
+            self.names.append(name)
+            self.__indexes[guid] = i
+            self.__indexes.setdefault(name, i)
+
+        # Build each bitmap as a list of bytes, since setting bits in an
+        # int one at a time is quadratic.
+        nPubs = len(self.guids)
+        allPubs = frozenset(range(nPubs))
+        entryBits = [bytearray() for p in range(nPubs)]
+        senseBits = [bytearray() for p in range(nPubs)]
+
+        def SetBit(bits, index, pubs):
+            byteIndex, bit = divmod(index, 8)
+            for p in pubs:
+                b = bits[p]
+                if len(b) <= byteIndex:
+                    b.extend(bytes(byteIndex + 1 - len(b)))
+                b[byteIndex] |= 1 << bit
+
+        def Published(doNotPublishIn, inherited):
+            excluded = {self.__indexes.get(str(g).lower())
+                        for g in doNotPublishIn}
+            return inherited - excluded if excluded else inherited
+
+        def AddSenses(senses, inherited):
+            for senseGuid, doNotPublishIn, subsenses in senses:
+                pubs = Published(doNotPublishIn, inherited)
+                SetBit(senseBits, len(self.senseGuids), pubs)
+                self.senseGuids.append(str(senseGuid).lower())
+                AddSenses(subsenses, pubs)
+
+        for entryGuid, doNotPublishIn, senses in entries:
+            pubs = Published(doNotPublishIn, allPubs)
+            SetBit(entryBits, len(self.entryGuids), pubs)
+            self.entryGuids.append(str(entryGuid).lower())
+            AddSenses(senses, pubs)
+
+        self.__entryBitmaps = [int.from_bytes(b, "little") for b in entryBits]
+        self.__senseBitmaps = [int.from_bytes(b, "little") for b in senseBits]
+
+        logger.debug("PublicationMembership: %d publications, %d entries, %d senses"
+                     % (nPubs, len(self.entryGuids), len(self.senseGuids)))
+
+
+    def __len__(self):
+        return len(self.guids)
+
+
+    def Index(self, publication):
+        """
+        Returns the index of a publication given its name or guid, or
+        `None` if it isn't found.
+        """
+        i = self.__indexes.get(publication)
+        if i is None and isinstance(publication, str):
+            i = self.__indexes.get(publication.lower())
+        return i
+
+
+    def __Index(self, publication):
+        i = self.Index(publication) if not isinstance(publication, int) \
+                                    else publication
+        if i is None:
+            raise FP_ParameterError("Publication not found: %s" % publication)
+        return i
+
+
+    # --- Bitmaps ---
+
+    @property
+    def allEntries(self):
+        """
+        A bitmap of all the entries.
+        """
+        return (1 << len(self.entryGuids)) - 1
+
+    @property
+    def allSenses(self):
+        """
+        A bitmap of all the senses.
+        """
+        return (1 << len(self.senseGuids)) - 1
+
+
+    def Entries(self, publication):
+        """
+        Returns the bitmap of the entries in `publication` (a name, guid
+        or index).
+        """
+        return self.__entryBitmaps[self.__Index(publication)]
+
+
+    def Senses(self, publication):
+        """
+        Returns the bitmap of the senses in `publication` (a name, guid
+        or index).
+        """
+        return self.__senseBitmaps[self.__Index(publication)]
+
+
+    # --- Members ---
+
+    def EntryGuids(self, bitmap):
+        """
+        Yields the guids of the entries in `bitmap`, in lexicon order.
+        """
+        guids = self.entryGuids
+        for i in BitIndexes(bitmap):
+            yield guids[i]
+
+
+    def SenseGuids(self, bitmap):
+        """
+        Yields the guids of the senses in `bitmap`, in lexicon order.
+        """
+        guids = self.senseGuids
+        for i in BitIndexes(bitmap):
+            yield guids[i]
+
+
+    def EntryPublications(self, entryIndex):
+        """
+        Returns a list of the indexes of the publications that contain
+        the entry.
+        """
+        bit = 1 << entryIndex
+        return [p for p, bitmap in enumerate(self.__entryBitmaps)
+                if bitmap & bit]
@@ -0,0 +1,98 @@
+#
+#   FLExReaders.py
+#
+#   Module: Pre-bound readers for string fields.
+#
+#           A StringReader reads one string field in one writing system,
+#           through DomainDataByFlid, with the field ID, field type and
+#           writing system handle resolved when it is created. This
+#           avoids the per-call writing system resolution and casting of
+#           the LexiconGet*() functions in loops over many objects.
+#
+#           Readers are created by FLExProject.StringReader().
+#
+#   Platform: Python.NET
+#             FieldWorks Version 9
+#
+#   Copyright Craig Farrow, 2025
+#
+
+from . import FLExLCM
+from .FLExExceptions import FP_ParameterError
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+#--------------------------------------------------------------------
+
+class StringReader(object):
+    """
+    Reads a string or multi-string field in a single writing system.
+
+    lcmCache:
+        The `LcmCache` (`FLExProject.project`).
+
+    path:
+        A list of flids: any atomic object fields to follow (e.g.
+        `LexEntry.LexemeForm`), followed by the string field.
+
+    fieldType:
+        The `CellarPropertyType` of the string field.
+
+    WSHandle:
+        The writing system handle for multi-string fields.
+
+    Usage::
+
+        glossReader = project.StringReader("LexSense", "Gloss", "en")
+        gloss = glossReader(sense)
+        glosses = glossReader.Many(senses)
+    """
+
+    def __init__(self, lcmCache, path, fieldType, WSHandle):
+        self.path = list(path)
+        self.WSHandle = WSHandle
+
+        ddbf = lcmCache.DomainDataByFlid
+        objectFlids, flid = self.path[:-1], self.path[-1]
+
+        if fieldType in FLExLCM.CellarStringTypes:
+            def ReadString(hvo):
+                return ddbf.get_StringProp(hvo, flid).Text or ""
+        elif fieldType in FLExLCM.CellarMultiStringTypes:
+            def ReadString(hvo):
+                return ddbf.get_MultiStringAlt(hvo, flid, WSHandle).Text or ""
+        else:
+            raise FP_ParameterError("StringReader: not a string field (%s)" % flid)
+
+        if not objectFlids:
+            self.__read = ReadString
+        else:
+            getObjectProp = ddbf.get_ObjectProp
+            def ReadPath(hvo):
+                for objectFlid in objectFlids:
+                    hvo = getObjectProp(hvo, objectFlid)
+                    if not hvo:
+                        return ""
+                return ReadString(hvo)
+            self.__read = ReadPath
+
+
+    def __call__(self, objOrHvo):
+        """
+        Returns the text of the field for the object (or hvo), or the
+        empty string.
+        """
+        return self.__read(objOrHvo if isinstance(objOrHvo, int)
+                           else objOrHvo.Hvo)
+
+
+    def Many(self, objectsOrHvos):
+        """
+        Returns a list of the texts of the field for each of the objects
+        (or hvos).
+        """
+        read = self.__read
+        return [read(obj if isinstance(obj, int) else obj.Hvo)
+                for obj in objectsOrHvos]
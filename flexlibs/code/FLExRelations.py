@@ -0,0 +1,375 @@
+#
+#   FLExRelations.py
+#
+#   Module: A graph of the lexical relations in a project.
+#
+#           The entries and senses in lexical relations are the nodes,
+#           numbered 0 to n-1, and each relation between two of them is
+#           an edge, with the relation type and direction. The edges
+#           follow the MappingType of the relation type:
+#
+#               Collection, Pair        - symmetric edges between all
+#                                         the targets
+#               Asymmetric pair, Tree   - forward edges from the first
+#                                         target (e.g. the whole) to the
+#                                         others, and reverse edges back
+#               Sequence                - forward edges from each target
+#                                         to the next, and reverse edges
+#               Unidirectional          - forward edges from the first
+#                                         target only
+#
+#           The graph is built by FLExProject.LexicalRelationGraph() or
+#           FWDataProject.LexicalRelationGraph().
+#
+#   Platform: Python 3
+#
+#   Copyright Craig Farrow, 2025
+#
+
+import array
+import collections
+
+from .FLExExceptions import FP_ParameterError
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+#--- Globals --------------------------------------------------------
+
+# The edge directions
+Symmetric = 0
+Forward   = 1
+Reverse   = 2
+
+# The shapes of the LexRefType MappingTypes (LexRefTypeTags.MappingTypes)
+ShapeCollection     = "Collection"
+ShapePair           = "Pair"
+ShapeAsymmetricPair = "AsymmetricPair"
+ShapeTree           = "Tree"
+ShapeSequence       = "Sequence"
+ShapeUnidirectional = "Unidirectional"
+
+_Shapes = (ShapeCollection, ShapePair, ShapeAsymmetricPair,
+           ShapeTree, ShapeSequence)
+
+
+def MappingTypeShape(mappingType):
+    """
+    Returns the shape (e.g. `ShapeTree`) of a LexRefType `MappingType`.
+    The sense, entry and entry-or-sense versions of each mapping type
+    have the same shape.
+    """
+    mappingType = int(mappingType)
+    if mappingType >= 15:
+        return ShapeUnidirectional
+    return _Shapes[mappingType % 5]
+
+
+Edge = collections.namedtuple("Edge",
+                              ["source",
+                               "target",
+                               "relationType",
+                               "direction"])
+Edge.__doc__ = """
+An edge in a `RelationGraph`:
+    - `source`        - the node the edge is from
+    - `target`        - the node the edge is to
+    - `relationType`  - the index of the relation type
+    - `direction`     - `Symmetric`, `Forward` or `Reverse`
+"""
+
+
+#--------------------------------------------------------------------
+
+class RelationGraph(object):
+    """
+    The lexical relations as a graph of entries and senses.
+
+    relationTypes:
+        An iterable of (guid, name, reverseName, mappingType, references)
+        for each relation type, where `references` is an iterable of the
+        lists of targets of each relation. A target is a (guid, className)
+        pair.
+
+    Nodes and relation types are referred to by their indexes. Use
+    `Node()` and `RelationType()` to find the index from a guid (or a
+    name for relation types). The edge directions are also available
+    as `graph.Forward`, etc.
+
+    Usage::
+
+        graph = project.LexicalRelationGraph()
+        synonyms = graph.RelationType("Synonyms")
+        for component in graph.Components(synonyms):
+            print([graph.guids[n] for n in component])
+
+        node = graph.Node(sense.Guid)
+        for edge in graph.Neighbours(node):
+            print(graph.guids[edge.target], graph.EdgeName(edge))
+    """
+
+    Symmetric = Symmetric
+    Forward   = Forward
+    Reverse   = Reverse
+
+    def __init__(self, relationTypes):
+        self.guids = []                         # node -> guid
+        self.classNames = []                    # node -> class name
+        self.typeGuids = []
+        self.typeNames = []
+        self.typeReverseNames = []
+        self.typeShapes = []
+
+        self.__nodes = {}                       # guid -> node
+        self.__types = {}                       # guid or name -> type
+        self.__adjacency = []                   # node -> array of edge ids
+        self.__sources = array.array("i")
+        self.__targets = array.array("i")
+        self.__edgeTypes = array.array("i")
+        self.__directions = array.array("b")
+
+        for guid, name, reverseName, mappingType, references in relationTypes:
+            t = len(self.typeGuids)
+            guid = str(guid).lower()
+            shape = MappingTypeShape(mappingType)
+            self.typeGuids.append(guid)
+            self.typeNames.append(name)
+            self.typeReverseNames.append(reverseName)
+            self.typeShapes.append(shape)
+            self.__types[guid] = t
+            if name:
+                self.__types.setdefault(name, t)
+
+            for targets in references:
+                nodes = [self.__AddNode(g, c) for g, c in targets]
+                self.__AddReference(t, shape, nodes)
+
+        logger.debug("RelationGraph: %d relation types, %d nodes, %d edges"
+                     % (len(self.typeGuids), len(self.guids),
+                        len(self.__sources)))
+
+
+    def __AddNode(self, guid, className):
+        guid = str(guid).lower()
+        node = self.__nodes.get(guid)
+        if node is None:
+            node = len(self.guids)
+            self.guids.append(guid)
+            self.classNames.append(className)
+            self.__nodes[guid] = node
+            self.__adjacency.append(array.array("i"))
+        return node
+
+
+    def __AddEdge(self, source, target, relationType, direction):
+        e = len(self.__sources)
+        self.__sources.append(source)
+        self.__targets.append(target)
+        self.__edgeTypes.append(relationType)
+        self.__directions.append(direction)
+        self.__adjacency[source].append(e)
+
+
+    def __AddPair(self, source, target, relationType, reverse=True):
+        self.__AddEdge(source, target, relationType, Forward)
+        if reverse:
+            self.__AddEdge(target, source, relationType, Reverse)
+
+
+    def __AddReference(self, t, shape, nodes):
+        if shape in (ShapeCollection, ShapePair):
+            for i, a in enumerate(nodes):
+                for b in nodes[i+1:]:
+                    if a != b:
+                        self.__AddEdge(a, b, t, Symmetric)
+                        self.__AddEdge(b, a, t, Symmetric)
+        elif shape == ShapeSequence:
+            for a, b in zip(nodes, nodes[1:]):
+                self.__AddPair(a, b, t)
+        elif nodes:
+            # Asymmetric pair, tree, unidirectional: from the first target
+            head = nodes[0]
+            for b in nodes[1:]:
+                self.__AddPair(head, b, t,
+                               reverse=(shape != ShapeUnidirectional))
+
+
+    def __len__(self):
+        return len(self.guids)
+
+
+    # --- Lookups ---
+
+    def Node(self, guid):
+        """
+        Returns the node for an entry or sense guid, or `None` if it
+        isn't in any relation.
+        """
+        return self.__nodes.get(str(guid).lower())
+
+
+    def RelationType(self, relationType):
+        """
+        Returns the index of a relation type given its name or guid.
+        Raises `FP_ParameterError` if it isn't found.
+        """
+        if isinstance(relationType, int):
+            return relationType
+        t = self.__types.get(relationType)
+        if t is None:
+            t = self.__types.get(str(relationType).lower())
+        if t is None:
+            raise FP_ParameterError("Relation type not found: %s"
+                                    % relationType)
+        return t
+
+
+    def Edge(self, e):
+        """
+        Returns the `Edge` for edge id `e`.
+        """
+        return Edge(self.__sources[e], self.__targets[e],
+                    self.__edgeTypes[e], self.__directions[e])
+
+
+    def EdgeName(self, edge):
+        """
+        Returns the name of the relation as seen from the source of
+        `edge` (e.g. 'Part' or 'Whole').
+        """
+        if edge.direction == Reverse:
+            return self.typeReverseNames[edge.relationType] \
+                   or self.typeNames[edge.relationType]
+        return self.typeNames[edge.relationType]
+
+
+    # --- Queries ---
+
+    def __EdgeIds(self, node, relationType, direction):
+        edgeTypes = self.__edgeTypes
+        directions = self.__directions
+        for e in self.__adjacency[node]:
+            if relationType is not None and edgeTypes[e] != relationType:
+                continue
+            if direction is not None and directions[e] != direction:
+                continue
+            yield e
+
+
+    def Neighbours(self, node, relationType=None, direction=None):
+        """
+        Returns a list of the `Edge`s from `node`, optionally only those
+        of `relationType` (index, name or guid) and `direction`.
+        """
+        if relationType is not None:
+            relationType = self.RelationType(relationType)
+        return [self.Edge(e)
+                for e in self.__EdgeIds(node, relationType, direction)]
+
+
+    def __Reachable(self, node, relationType, direction):
+        # Breadth-first search, returning {node: previous node}
+        targets = self.__targets
+        previous = {node: None}
+        queue = collections.deque([node])
+        while queue:
+            n = queue.popleft()
+            for e in self.__EdgeIds(n, relationType, direction):
+                t = targets[e]
+                if t not in previous:
+                    previous[t] = n
+                    queue.append(t)
+        return previous
+
+
+    def Closure(self, node, relationType=None, direction=None):
+        """
+        Returns the set of nodes reachable from `node` (not including
+        `node` itself), optionally only following edges of
+        `relationType` and `direction`. E.g. all the parts of a whole,
+        at all levels::
+
+            graph.Closure(node, "Part", graph.Forward)
+        """
+        if relationType is not None:
+            relationType = self.RelationType(relationType)
+        reachable = set(self.__Reachable(node, relationType, direction))
+        reachable.discard(node)
+        return reachable
+
+
+    def ShortestPath(self, source, target, relationType=None, direction=None):
+        """
+        Returns the list of nodes on a shortest path from `source` to
+        `target` (inclusive), or `None` if there isn't a path.
+        """
+        if relationType is not None:
+            relationType = self.RelationType(relationType)
+        previous = self.__Reachable(source, relationType, direction)
+        if target not in previous:
+            return None
+        path = [target]
+        while path[-1] != source:
+            path.append(previous[path[-1]])
+        path.reverse()
+        return path
+
+
+    def Components(self, relationType=None):
+        """
+        Returns a list of the connected components (ignoring edge
+        direction), each a sorted list of nodes, largest first.
+        Only nodes with edges of `relationType` are included if it is
+        given.
+        """
+        if relationType is not None:
+            relationType = self.RelationType(relationType)
+        # Union-find over the edges, so that unidirectional edges join
+        # components too.
+        parents = list(range(len(self.guids)))
+        def Root(n):
+            while parents[n] != n:
+                parents[n] = parents[parents[n]]
+                n = parents[n]
+            return n
+
+        inGraph = set()
+        for e in range(len(self.__sources)):
+            if relationType is not None and self.__edgeTypes[e] != relationType:
+                continue
+            a, b = self.__sources[e], self.__targets[e]
+            inGraph.update((a, b))
+            rootA, rootB = Root(a), Root(b)
+            if rootA != rootB:
+                parents[max(rootA, rootB)] = min(rootA, rootB)
+
+        components = collections.defaultdict(list)
+        for node in range(len(self.guids)):
+            if relationType is None or node in inGraph:
+                components[Root(node)].append(node)
+        return sorted(components.values(), key=len, reverse=True)
+
+
+    def EdgeList(self, relationType=None):
+        """
+        Returns a list of (sourceGuid, targetGuid, relationName) for each
+        relation, optionally only of `relationType`. Symmetric relations
+        are listed once, and asymmetric relations only in the forward
+        direction.
+        """
+        if relationType is not None:
+            relationType = self.RelationType(relationType)
+        edges = []
+        for e in range(len(self.__sources)):
+            edge = self.Edge(e)
+            if relationType is not None and edge.relationType != relationType:
+                continue
+            if edge.direction == Reverse:
+                continue
+            if edge.direction == Symmetric and edge.source > edge.target:
+                continue
+            edges.append((self.guids[edge.source],
+                          self.guids[edge.target],
+                          self.typeNames[edge.relationType]))
+        return edges
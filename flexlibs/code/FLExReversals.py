@@ -0,0 +1,238 @@
+#
+#   FLExReversals.py
+#
+#   Module: A registry of the reversal indexes in a project.
+#
+#           The registry maps each writing system to its reversal
+#           index, and keeps a table for each index of all the entries,
+#           including subentries, in pre-order with the parent and depth
+#           of each, and a hash of the reversal forms for fast lookup.
+#
+#           A table is built when first used and rebuilt only when its
+#           reversal index has been modified, so the tables for other
+#           indexes are kept.
+#
+#           The registry is created by FLExProject.ReversalRegistry() or
+#           FWDataProject.ReversalRegistry().
+#
+#   Platform: Python 3
+#
+#   Copyright Craig Farrow, 2025
+#
+
+import array
+
+from .FLExWritingSystems import NormaliseLanguageTag
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+#--------------------------------------------------------------------
+
+class ReversalTable(object):
+    """
+    All the entries of one reversal index.
+
+    Entries are referred to by their index in the table (0 to
+    `len(table) - 1`), which is in pre-order: each entry is followed
+    by its subentries.
+
+    Attributes:
+        - `languageTag` - the writing system of the index
+        - `index`       - the reversal index object
+        - `entries`     - the reversal entry objects
+        - `guids`       - the entry guids (lower-case strings)
+        - `forms`       - the reversal forms in `languageTag`
+        - `parents`     - the index of each entry's parent, or -1 for
+                          top-level entries
+        - `depths`      - 0 for top-level entries, 1 for subentries, etc.
+    """
+
+    def __init__(self, project, reversalIndex, stamp=None):
+        self.languageTag = reversalIndex.WritingSystem
+        self.index = reversalIndex
+        self.stamp = stamp
+        self.entries = []
+        self.guids = []
+        self.forms = []
+        self.parents = array.array("i")
+        self.depths = array.array("i")
+
+        self.__indexes = {}                 # guid -> index
+        self.__byForm = {}                  # form -> [index]
+        self.__byFoldedForm = {}            # casefolded form -> [index]
+
+        # Iterative pre-order walk, to handle deeply nested subentries.
+        stack = [(entry, -1) for entry in reversed(list(reversalIndex.EntriesOC))]
+        while stack:
+            entry, parent = stack.pop()
+            i = len(self.entries)
+            guid = str(entry.Guid).lower()
+            form = project.ReversalGetForm(entry, self.languageTag)
+            self.entries.append(entry)
+            self.guids.append(guid)
+            self.forms.append(form)
+            self.parents.append(parent)
+            self.depths.append(self.depths[parent] + 1 if parent >= 0 else 0)
+            self.__indexes[guid] = i
+            if form:
+                self.__byForm.setdefault(form, []).append(i)
+                self.__byFoldedForm.setdefault(form.casefold(), []).append(i)
+            stack.extend((sub, i) for sub in reversed(list(entry.SubentriesOS)))
+
+        logger.debug("ReversalTable: %d entries in %s"
+                     % (len(self.entries), self.languageTag))
+
+
+    def __len__(self):
+        return len(self.entries)
+
+
+    def Index(self, entryOrGuid):
+        """
+        Returns the table index of a reversal entry (or its guid), or
+        `None` if it isn't in the table.
+        """
+        guid = entryOrGuid if isinstance(entryOrGuid, str) \
+                           else entryOrGuid.Guid
+        return self.__indexes.get(str(guid).lower())
+
+
+    def Find(self, form, ignoreCase=False):
+        """
+        Returns a list of the table indexes of the entries with the
+        reversal form `form`.
+        """
+        if ignoreCase:
+            return list(self.__byFoldedForm.get(form.casefold(), ()))
+        return list(self.__byForm.get(form, ()))
+
+
+    def TopLevel(self):
+        """
+        Returns a list of the table indexes of the top-level entries.
+        """
+        return [i for i, parent in enumerate(self.parents) if parent < 0]
+
+
+    def Subentries(self, i):
+        """
+        Returns a list of the table indexes of the direct subentries of
+        entry `i`.
+        """
+        depth = self.depths[i] + 1
+        subentries = []
+        for j in range(i + 1, len(self.entries)):
+            if self.depths[j] < depth:
+                break
+            if self.depths[j] == depth:
+                subentries.append(j)
+        return subentries
+
+
+    def Ancestors(self, i):
+        """
+        Returns a list of the table indexes of the entries that
+        entry `i` is a subentry of, from its parent up.
+        """
+        ancestors = []
+        i = self.parents[i]
+        while i >= 0:
+            ancestors.append(i)
+            i = self.parents[i]
+        return ancestors
+
+
+#--------------------------------------------------------------------
+
+class ReversalRegistry(object):
+    """
+    The reversal indexes of a project, by writing system, with a
+    `ReversalTable` for each.
+
+    Usage::
+
+        reversals = project.ReversalRegistry()
+        table = reversals.Table("en")
+        for i in table.Find("dog", ignoreCase=True):
+            entry = table.entries[i]
+            print(table.depths[i], table.forms[i], entry.Guid)
+    """
+
+    def __init__(self, project):
+        self.project = project
+        self.__indexes = {}                 # normalised tag -> index
+        self.__indexCount = None
+        self.__tables = {}                  # normalised tag -> ReversalTable
+
+
+    def __ReversalIndexes(self):
+        # New indexes are rare, so only re-read them if the number of
+        # indexes changes.
+        reversalIndexes = self.project.lexDB.ReversalIndexesOC
+        if len(reversalIndexes) != self.__indexCount:
+            self.__indexes = {NormaliseLanguageTag(ri.WritingSystem): ri
+                              for ri in reversalIndexes}
+            self.__indexCount = len(reversalIndexes)
+            for tag in set(self.__tables) - set(self.__indexes):
+                del self.__tables[tag]
+        return self.__indexes
+
+
+    @property
+    def languageTags(self):
+        """
+        The writing systems of the reversal indexes.
+        """
+        return [ri.WritingSystem for ri in self.__ReversalIndexes().values()]
+
+
+    def Index(self, languageTag):
+        """
+        Returns the reversal index for `languageTag`, or `None`.
+        """
+        return self.__ReversalIndexes().get(NormaliseLanguageTag(languageTag))
+
+
+    def Table(self, languageTag):
+        """
+        Returns the `ReversalTable` for `languageTag`, or `None` if there
+        isn't a reversal index for it. The table is rebuilt if the index
+        has been modified since it was built.
+        """
+        tag = NormaliseLanguageTag(languageTag)
+        ri = self.__ReversalIndexes().get(tag)
+        if ri is None:
+            return None
+        stamp = (self.project.DateModified(ri), len(ri.EntriesOC))
+        table = self.__tables.get(tag)
+        if table is None or table.stamp != stamp:
+            table = ReversalTable(self.project, ri, stamp)
+            self.__tables[tag] = table
+        return table
+
+
+    def Entries(self, languageTag, includeSubentries=True):
+        """
+        Returns a list of the reversal entries for `languageTag`, in
+        pre-order if `includeSubentries` is `True`. Returns `None` if
+        there isn't a reversal index for it.
+        """
+        table = self.Table(languageTag)
+        if table is None:
+            return None
+        if includeSubentries:
+            return list(table.entries)
+        return [table.entries[i] for i in table.TopLevel()]
+
+
+    def Find(self, form, languageTag, ignoreCase=False):
+        """
+        Returns a list of the reversal entries for `languageTag` with the
+        reversal form `form`.
+        """
+        table = self.Table(languageTag)
+        if table is None:
+            return []
+        return [table.entries[i] for i in table.Find(form, ignoreCase)]
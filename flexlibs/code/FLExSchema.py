@@ -0,0 +1,253 @@
+#
+#   FLExSchema.py
+#
+#   Module: A cache of the LCM meta-data (the project's classes and
+#           fields, including custom fields).
+#
+#           The meta-data is read once, when the project is opened, so
+#           field lookups don't need to call into the MetaDataCache.
+#           The cache is refreshed if a field can't be found, since
+#           that happens when a custom field has been added.
+#
+#   Platform: Python.NET
+#             FieldWorks Version 9
+#
+#   Copyright Craig Farrow, 2025
+#
+
+import collections
+
+from SIL.LCModel.Core.Cellar import (
+    CellarPropertyType,
+    CellarPropertyTypeFilter,
+    )
+
+from SIL.LCModel.Infrastructure import (
+    IFwMetaDataCacheManaged,
+    )
+
+from .FLExExceptions import (
+    FP_ParameterError,
+    )
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+#--------------------------------------------------------------------
+
+FieldInfo = collections.namedtuple("FieldInfo",
+                                   ["flid",
+                                    "name",
+                                    "label",
+                                    "fieldType",
+                                    "classID",
+                                    "className",
+                                    "wsSelector",
+                                    "destClassID",
+                                    "listRoot",
+                                    "isCustom"])
+FieldInfo.__doc__ = """
+The meta-data for a field:
+    - `flid`         - the field ID
+    - `name`         - the field name (without the type suffix)
+    - `label`        - the user label (used for custom fields)
+    - `fieldType`    - a `CellarPropertyType`
+    - `classID`      - the class that defines the field
+    - `className`    - the name of that class
+    - `wsSelector`   - the writing system selector (e.g. vernacular or
+                       analysis) for string fields
+    - `destClassID`  - the class of the target objects for object fields
+    - `listRoot`     - the guid of the possibility list for list
+                       fields, or `None`
+    - `isCustom`     - `True` for a custom field
+"""
+
+
+#--------------------------------------------------------------------
+
+class FLExSchema(object):
+    """
+    The classes and fields of an LCM project, read from the project's
+    MetaDataCache.
+
+    Usage::
+
+        schema = FLExSchema(project.project)    # an LcmCache
+        info = schema.Field(flid)
+        if info.fieldType == CellarPropertyType.MultiUnicode:
+            ...
+        flid = schema.CustomFieldNamed(LexEntryTags.kClassId, "Notes")
+    """
+
+    def __init__(self, lcmCache):
+        self.mdc = IFwMetaDataCacheManaged(lcmCache.MetaDataCacheAccessor)
+        self.Refresh()
+
+
+    def Refresh(self):
+        """
+        Re-read the meta-data. This is done automatically when a field
+        isn't found and fields have been added to the project.
+        """
+        mdc = self.mdc
+        allTypes = int(CellarPropertyTypeFilter.All)
+
+        self.__fields = {}              # flid -> FieldInfo
+        self.__classIDs = {}            # class name -> classID
+        self.__classNames = {}          # classID -> class name
+        self.__classFields = {}         # classID -> [flid]
+        self.__baseClass = {}           # classID -> base classID
+        self.__fieldIDs = {}            # (classID, name) -> flid
+        self.__customLabels = {}        # (classID, label) -> flid
+
+        for classID in mdc.GetClassIds():
+            className = mdc.GetClassName(classID)
+            self.__classIDs[className] = classID
+            self.__classNames[classID] = className
+            self.__baseClass[classID] = mdc.GetBaseClsId(classID)
+            flids = list(mdc.GetFields(classID, False, allTypes))
+            self.__classFields[classID] = flids
+
+            for flid in flids:
+                listRoot = mdc.GetFieldListRoot(flid)
+                isCustom = mdc.IsCustom(flid)
+                info = FieldInfo(flid,
+                                 mdc.GetFieldName(flid),
+                                 mdc.GetFieldLabel(flid),
+                                 CellarPropertyType(mdc.GetFieldType(flid)),
+                                 classID,
+                                 className,
+                                 mdc.GetFieldWs(flid),
+                                 mdc.GetDstClsId(flid),
+                                 str(listRoot) if listRoot != listRoot.Empty
+                                               else None,
+                                 isCustom)
+                self.__fields[flid] = info
+                self.__fieldIDs[(classID, info.name)] = flid
+                if isCustom:
+                    self.__customLabels[(classID, info.label)] = flid
+
+        logger.debug("FLExSchema: %d classes, %d fields"
+                     % (len(self.__classIDs), len(self.__fields)))
+
+
+    def __RefreshIfChanged(self):
+        # Fields are only added (custom fields), so a change in the
+        # number of fields means the cache is out of date.
+        if self.mdc.FieldCount == len(self.__fields):
+            return False
+        logger.info("FLExSchema: fields have changed; refreshing")
+        self.Refresh()
+        return True
+
+
+    # --- Lookups ---
+
+    def Field(self, flid):
+        """
+        Returns the `FieldInfo` for `flid`.
+        Raises `FP_ParameterError` if it isn't a valid field ID.
+        """
+        try:
+            return self.__fields[flid]
+        except KeyError:
+            pass
+        # It might be a new custom field.
+        self.__RefreshIfChanged()
+        try:
+            return self.__fields[flid]
+        except KeyError:
+            raise FP_ParameterError("Invalid field ID: %s" % flid) from None
+
+
+    def FieldType(self, flid):
+        """
+        Returns the `CellarPropertyType` of the field.
+        """
+        return self.Field(flid).fieldType
+
+
+    def ClassID(self, className):
+        """
+        Returns the class ID for `className`.
+        Raises `FP_ParameterError` if it isn't a valid class name.
+        """
+        try:
+            return self.__classIDs[className]
+        except KeyError:
+            raise FP_ParameterError("Invalid class name: %s" % className) from None
+
+
+    def ClassName(self, classID):
+        """
+        Returns the class name for `classID`.
+        Raises `FP_ParameterError` if it isn't a valid class ID.
+        """
+        try:
+            return self.__classNames[classID]
+        except KeyError:
+            raise FP_ParameterError("Invalid class ID: %s" % classID) from None
+
+
+    def FieldID(self, className, fieldName):
+        """
+        Returns the flid for the field named `fieldName` in `className`
+        or its base classes. Both names are case-sensitive, and the type
+        suffix (e.g. 'OS') may be omitted from `fieldName`.
+        Raises `FP_ParameterError` if the field isn't found.
+        """
+        if fieldName[-2:] in ("OA", "OS", "OC", "RA", "RS", "RC"):
+            fieldName = fieldName[:-2]
+
+        classID = self.ClassID(className)
+        for retry in (False, True):
+            if retry and not self.__RefreshIfChanged():
+                break
+            c = classID
+            while c in self.__classFields:
+                flid = self.__fieldIDs.get((c, fieldName))
+                if flid:
+                    return flid
+                if self.__baseClass[c] == c:
+                    break
+                c = self.__baseClass[c]
+        raise FP_ParameterError("Field '%s' not found in class %s"
+                                % (fieldName, className))
+
+
+    def Fields(self, classID, includeBaseClasses=True):
+        """
+        Returns a list of the flids for the class.
+        """
+        self.__RefreshIfChanged()
+        flids = []
+        c = classID
+        while c in self.__classFields:
+            flids = self.__classFields[c] + flids
+            if not includeBaseClasses or self.__baseClass[c] == c:
+                break
+            c = self.__baseClass[c]
+        return flids
+
+
+    def CustomFields(self, classID):
+        """
+        Returns a list of (flid, label) for the custom fields defined
+        in the class.
+        """
+        self.__RefreshIfChanged()
+        return [(flid, self.__fields[flid].label)
+                for flid in self.__classFields.get(classID, [])
+                if self.__fields[flid].isCustom]
+
+
+    def CustomFieldNamed(self, classID, label):
+        """
+        Returns the flid of the custom field with the given label
+        (case-sensitive) in the class, or `None` if there isn't one.
+        """
+        flid = self.__customLabels.get((classID, label))
+        if not flid and self.__RefreshIfChanged():
+            flid = self.__customLabels.get((classID, label))
+        return flid
@@ -0,0 +1,369 @@
+#
+#   FLExSearch.py
+#
+#   Module: An inverted index of the lexicon for finding entries and
+#           senses by form.
+#
+#           The index maps the lexeme forms, citation forms, headwords,
+#           glosses and reversal forms in each writing system to the
+#           guids of the entries and senses that have them. It supports
+#           exact, prefix, diacritic-insensitive and edit-distance
+#           (fuzzy) lookups, and can be saved to a file for reuse.
+#
+#           The index can be built from an FLExProject or an
+#           FWDataProject.
+#
+#   Platform: Python 3
+#
+#   Copyright Craig Farrow, 2025
+#
+
+import json
+import bisect
+import collections
+import unicodedata
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+#--- Globals --------------------------------------------------------
+
+# The fields that are indexed
+FieldLexemeForm     = "LexemeForm"
+FieldCitationForm   = "CitationForm"
+FieldHeadword       = "Headword"
+FieldGloss          = "Gloss"
+FieldReversal       = "Reversal"
+
+SearchHit = collections.namedtuple("SearchHit",
+                                   ["guid", "field", "ws", "form"])
+SearchHit.__doc__ = """
+A match from a `LexiconIndex` lookup:
+    - `guid`     - the entry guid (forms and headwords) or sense guid
+                   (glosses and reversal forms) as a lower-case string
+    - `field`    - the field that matched (e.g. "Gloss")
+    - `ws`       - the writing system (language tag)
+    - `form`     - the form that matched
+"""
+
+
+#--------------------------------------------------------------------
+
+def FoldForm(form):
+    """
+    Returns `form` without diacritics and in lower case, for
+    diacritic-insensitive matching.
+    """
+    decomposed = unicodedata.normalize("NFD", form)
+    return unicodedata.normalize("NFC",
+                "".join(c for c in decomposed
+                        if not unicodedata.combining(c)).casefold())
+
+
+def EditDistance(a, b, maxDistance):
+    """
+    Returns the Levenshtein distance between strings `a` and `b`, or
+    `maxDistance + 1` if it is greater than `maxDistance`.
+    """
+    if abs(len(a) - len(b)) > maxDistance:
+        return maxDistance + 1
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(previous[j] + 1,
+                               current[j - 1] + 1,
+                               previous[j - 1] + (ca != cb)))
+        if min(current) > maxDistance:
+            return maxDistance + 1
+        previous = current
+    return min(previous[-1], maxDistance + 1)
+
+
+#--------------------------------------------------------------------
+
+class LexiconIndex(object):
+    """
+    An inverted index from forms to entry and sense guids.
+
+    Each lookup takes an optional writing system (language tag) and a
+    list of fields to restrict the search. All lookups return a list
+    of `SearchHit` tuples.
+
+    Usage::
+
+        index = project.LexiconSearchIndex()
+        if not index.Exact(word, "fr"):
+            for hit in index.Fuzzy(word, 2):
+                print(hit.guid, hit.field, hit.form)
+    """
+
+    def __init__(self, stamp=None):
+        # `stamp` identifies the state of the project that the index
+        # was built from (e.g. its last-modified date).
+        self.stamp = stamp
+        self.__postings = {}            # ws -> form -> [(guid, field)]
+        self.__folded = None            # ws -> folded form -> {form}
+        self.__sortedForms = None       # ws -> sorted [form]
+        self.__byLength = None          # ws -> length -> [folded form]
+
+
+    def Add(self, form, guid, field, ws):
+        """
+        Add `form` in writing system `ws` for the object `guid`.
+        Empty forms are ignored.
+        """
+        if not form:
+            return
+        form = unicodedata.normalize("NFC", form)
+        posting = (str(guid).lower(), field)
+        postings = self.__postings.setdefault(ws, {}).setdefault(form, [])
+        if posting not in postings:
+            postings.append(posting)
+        self.__folded = None
+        self.__sortedForms = None
+        self.__byLength = None
+
+
+    def __len__(self):
+        return sum(len(forms) for forms in self.__postings.values())
+
+
+    def WritingSystems(self):
+        """
+        Returns a list of the writing systems in the index.
+        """
+        return list(self.__postings)
+
+
+    #  Private functions for the derived lookup tables
+
+    def __Folded(self):
+        if self.__folded is None:
+            self.__folded = {}
+            for ws, forms in self.__postings.items():
+                folded = self.__folded[ws] = {}
+                for form in forms:
+                    folded.setdefault(FoldForm(form), set()).add(form)
+        return self.__folded
+
+    def __SortedForms(self, ws):
+        if self.__sortedForms is None:
+            self.__sortedForms = {ws: sorted(forms)
+                                  for ws, forms in self.__postings.items()}
+        return self.__sortedForms.get(ws, [])
+
+    def __ByLength(self, ws):
+        if self.__byLength is None:
+            self.__byLength = {}
+            for w, folded in self.__Folded().items():
+                byLength = self.__byLength[w] = {}
+                for f in folded:
+                    byLength.setdefault(len(f), []).append(f)
+        return self.__byLength.get(ws, {})
+
+    def __Hits(self, ws, forms, fields):
+        hits = []
+        postings = self.__postings[ws]
+        for form in forms:
+            for guid, field in postings.get(form, ()):
+                if fields is None or field in fields:
+                    hits.append(SearchHit(guid, field, ws, form))
+        return hits
+
+    def __WSList(self, ws):
+        return [ws] if ws else list(self.__postings)
+
+
+    # --- Lookups ---
+
+    def Exact(self, form, ws=None, fields=None):
+        """
+        Returns the hits for `form` exactly (after Unicode normalisation).
+        """
+        form = unicodedata.normalize("NFC", form)
+        hits = []
+        for w in self.__WSList(ws):
+            if w in self.__postings:
+                hits += self.__Hits(w, [form], fields)
+        return hits
+
+
+    def Prefix(self, prefix, ws=None, fields=None):
+        """
+        Returns the hits for all forms that start with `prefix`.
+        """
+        prefix = unicodedata.normalize("NFC", prefix)
+        hits = []
+        for w in self.__WSList(ws):
+            forms = self.__SortedForms(w)
+            start = bisect.bisect_left(forms, prefix)
+            end = start
+            while end < len(forms) and forms[end].startswith(prefix):
+                end += 1
+            if end > start:
+                hits += self.__Hits(w, forms[start:end], fields)
+        return hits
+
+
+    def Folded(self, form, ws=None, fields=None):
+        """
+        Returns the hits for `form` ignoring diacritics and case.
+        """
+        key = FoldForm(form)
+        hits = []
+        for w in self.__WSList(ws):
+            forms = self.__Folded().get(w, {}).get(key)
+            if forms:
+                hits += self.__Hits(w, sorted(forms), fields)
+        return hits
+
+
+    def Fuzzy(self, form, maxDistance=1, ws=None, fields=None):
+        """
+        Returns the hits for forms within `maxDistance` edits (insertions,
+        deletions or substitutions) of `form`, ignoring diacritics and
+        case. The closest matches are first.
+        """
+        key = FoldForm(form)
+        matches = []
+        for w in self.__WSList(ws):
+            byLength = self.__ByLength(w)
+            for length in range(len(key) - maxDistance,
+                                len(key) + maxDistance + 1):
+                for candidate in byLength.get(length, ()):
+                    distance = EditDistance(key, candidate, maxDistance)
+                    if distance <= maxDistance:
+                        matches.append((distance, w, candidate))
+        hits = []
+        folded = self.__Folded()
+        for distance, w, candidate in sorted(matches):
+            hits += self.__Hits(w, sorted(folded[w][candidate]), fields)
+        return hits
+
+
+    # --- Saving and loading ---
+
+    def Save(self, fileName):
+        """
+        Save the index to a (JSON) file.
+        """
+        with open(fileName, "w", encoding="utf-8") as f:
+            json.dump({"stamp"    : self.stamp,
+                       "postings" : self.__postings}, f, ensure_ascii=False)
+
+
+    @classmethod
+    def Load(cls, fileName):
+        """
+        Returns the index saved in `fileName`.
+        """
+        with open(fileName, encoding="utf-8") as f:
+            data = json.load(f)
+        index = cls(data["stamp"])
+        index.__postings = {ws: {form: [tuple(p) for p in postings]
+                                 for form, postings in forms.items()}
+                            for ws, forms in data["postings"].items()}
+        return index
+
+
+#--------------------------------------------------------------------
+
+def BuildLexiconIndex(project, stamp=None):
+    """
+    Builds a `LexiconIndex` from an open `FLExProject` or `FWDataProject`
+    in a single pass over the lexicon and the reversal indexes.
+    """
+    index = LexiconIndex(stamp)
+    vernWSs = sorted(project.GetAllVernacularWSs())
+    analWSs = sorted(project.GetAllAnalysisWSs())
+    defaultVernWS = project.GetDefaultVernacularWS()[0]
+
+    def AddSenses(senses):
+        for sense in senses:
+            for ws in analWSs:
+                index.Add(project.LexiconGetSenseGloss(sense, ws),
+                          sense.Guid, FieldGloss, ws)
+            AddSenses(sense.SensesOS)
+
+    for entry in project.LexiconAllEntries():
+        index.Add(project.LexiconGetHeadword(entry),
+                  entry.Guid, FieldHeadword, defaultVernWS)
+        for ws in vernWSs:
+            index.Add(project.LexiconGetLexemeForm(entry, ws),
+                      entry.Guid, FieldLexemeForm, ws)
+            index.Add(project.LexiconGetCitationForm(entry, ws),
+                      entry.Guid, FieldCitationForm, ws)
+        AddSenses(entry.SensesOS)
+
+    for ws in analWSs:
+        table = project.ReversalRegistry().Table(ws)
+        if table:
+            for entry, form in zip(table.entries, table.forms):
+                for sense in entry.SensesRS:
+                    index.Add(form, sense.Guid, FieldReversal, ws)
+
+    return index
+
+
+def LexiconStamp(project):
+    """
+    Returns a stamp of the state of the lexicon of an `FLExProject` or
+    `FWDataProject`, for `LexiconIndex.stamp`: the numbers of entries
+    and senses, the latest entry modification date, and the
+    modification date and size of each reversal index. The stamp is a
+    list, so that it compares equal after being saved as JSON.
+    """
+    def CountSenses(senses):
+        return sum(1 + CountSenses(sense.SensesOS) for sense in senses)
+
+    entryCount = senseCount = 0
+    latest = None
+    for entry in project.LexiconAllEntries():
+        entryCount += 1
+        senseCount += CountSenses(entry.SensesOS)
+        dateModified = project.DateModified(entry)
+        if dateModified and (latest is None or dateModified > latest):
+            latest = dateModified
+
+    registry = project.ReversalRegistry()
+    reversals = []
+    for languageTag in sorted(registry.languageTags):
+        ri = registry.Index(languageTag)
+        reversals.append([languageTag,
+                          str(project.DateModified(ri)),
+                          len(ri.EntriesOC)])
+
+    return [entryCount, senseCount, str(latest), reversals]
+
+
+def LexiconSearchIndex(project, fileName=None, stamp=None):
+    """
+    Returns a `LexiconIndex` for an open `FLExProject` or `FWDataProject`.
+    If `fileName` is given, the index is loaded from that file if it was
+    saved from the lexicon as it is now (according to `stamp`, which
+    defaults to `LexiconStamp(project)`); otherwise it is built and 
+    saved to the file.
+    Without `fileName` the index is built in memory and not stamped.
+    """
+    if fileName and stamp is None:
+        stamp = LexiconStamp(project)
+    if fileName:
+        try:
+            index = LexiconIndex.Load(fileName)
+            if index.stamp == stamp:
+                return index
+            logger.info("LexiconSearchIndex: %s is out of date" % fileName)
+        except (OSError, ValueError, KeyError) as e:
+            logger.info("LexiconSearchIndex: couldn't load %s: %s"
+                        % (fileName, e))
+
+    index = BuildLexiconIndex(project, stamp)
+    if fileName:
+        try:
+            index.Save(fileName)
+        except OSError as e:
+            logger.warning("LexiconSearchIndex: couldn't save %s: %s"
+                           % (fileName, e))
+    return index
@@ -0,0 +1,205 @@
+#
+#   FLExSemanticDomains.py
+#
+#   Module: A compact, array-based tree of the semantic domains.
+#
+#           The domains are stored in pre-order (the order of the
+#           semantic domain list), with the parent, depth and end of
+#           the sub-tree for each domain. A domain's descendants are
+#           then the range of indexes up to the end of its sub-tree, so
+#           ancestor/descendant tests are O(1) comparisons.
+#
+#           The tree is built by FLExProject.SemanticDomainTree() or
+#           FWDataProject.SemanticDomainTree().
+#
+#   Platform: Python 3
+#
+#   Copyright Craig Farrow, 2025
+#
+
+import array
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+#--------------------------------------------------------------------
+
+class SemanticDomainTree(object):
+    """
+    The semantic domain hierarchy, with a map from each domain to the
+    senses that use it.
+
+    Domains are referred to by their index in the tree (0 to
+    `len(tree) - 1`), which is in the order of the semantic domain
+    list. Use `Index()` or `FindAbbreviation()` to get the index.
+
+    domains:
+        An iterable of (guid, parentGuid, abbreviation, names) in
+        pre-order, where `parentGuid` is `None` for the top-level
+        domains and `names` is a dictionary of language tag to name.
+
+    senseDomains:
+        An iterable of (senseGuid, domainGuid) pairs.
+
+    Usage::
+
+        tree = project.SemanticDomainTree()
+        i = tree.FindAbbreviation("8.4.5")
+        for d in tree.Descendants(i):
+            print(tree.abbreviations[d], tree.Name(d, "en"),
+                  len(tree.Senses(d)))
+    """
+
+    def __init__(self, domains, senseDomains=()):
+        self.guids = []
+        self.abbreviations = []
+        self.names = {}                         # ws -> [name]
+        self.parents = array.array("i")         # -1 for top-level
+        self.depths = array.array("i")          # 0 for top-level
+        self.ends = array.array("i")            # end of sub-tree
+
+        self.__indexes = {}                     # guid -> index
+        self.__abbreviations = {}               # abbreviation -> index
+
+        for guid, parentGuid, abbreviation, names in domains:
+            i = len(self.guids)
+            guid = str(guid).lower()
+            parent = self.__indexes[str(parentGuid).lower()] \
+                     if parentGuid else -1
+            self.guids.append(guid)
+            self.abbreviations.append(abbreviation)
+            for ws, name in names.items():
+                self.names.setdefault(ws, [None] * i).append(name)
+            for wsNames in self.names.values():
+                if len(wsNames) == i:
+                    wsNames.append(None)
+            self.parents.append(parent)
+            self.depths.append(self.depths[parent] + 1 if parent >= 0 else 0)
+            self.ends.append(i + 1)
+            self.__indexes[guid] = i
+            if abbreviation:
+                self.__abbreviations.setdefault(abbreviation, i)
+
+            # Extend the sub-trees of all the ancestors
+            while parent >= 0:
+                self.ends[parent] = i + 1
+                parent = self.parents[parent]
+
+        self.__senses = {}                      # index -> [sense guid]
+        for senseGuid, domainGuid in senseDomains:
+            i = self.__indexes.get(str(domainGuid).lower())
+            if i is not None:
+                self.__senses.setdefault(i, []).append(str(senseGuid).lower())
+
+        logger.debug("SemanticDomainTree: %d domains; %d in use"
+                     % (len(self.guids), len(self.__senses)))
+
+
+    def __len__(self):
+        return len(self.guids)
+
+
+    # --- Lookups ---
+
+    def Index(self, guid):
+        """
+        Returns the index of the domain with the given guid, or `None`
+        if it isn't in the tree.
+        """
+        return self.__indexes.get(str(guid).lower())
+
+
+    def FindAbbreviation(self, abbreviation):
+        """
+        Returns the index of the domain with the given abbreviation
+        (e.g. "8.4.5.1.1"), or `None` if there isn't one.
+        """
+        return self.__abbreviations.get(abbreviation)
+
+
+    def Name(self, i, ws):
+        """
+        Returns the name of domain `i` in writing system `ws`, or `None`.
+        """
+        try:
+            return self.names[ws][i]
+        except KeyError:
+            return None
+
+
+    # --- Structure ---
+
+    def Parent(self, i):
+        """
+        Returns the index of the parent of domain `i`, or `None` for a
+        top-level domain.
+        """
+        parent = self.parents[i]
+        return parent if parent >= 0 else None
+
+
+    def Children(self, i=None):
+        """
+        Returns a list of the indexes of the children of domain `i`, or
+        of the top-level domains if `i` is `None`.
+        """
+        if i is None:
+            j, end = 0, len(self.guids)
+        else:
+            j, end = i + 1, self.ends[i]
+        children = []
+        while j < end:
+            children.append(j)
+            j = self.ends[j]
+        return children
+
+
+    def Ancestors(self, i):
+        """
+        Returns a list of the indexes of the ancestors of domain `i`,
+        starting with its parent.
+        """
+        ancestors = []
+        parent = self.parents[i]
+        while parent >= 0:
+            ancestors.append(parent)
+            parent = self.parents[parent]
+        return ancestors
+
+
+    def Descendants(self, i):
+        """
+        Returns a `range` of the indexes of all the descendants of
+        domain `i`.
+        """
+        return range(i + 1, self.ends[i])
+
+
+    def IsAncestor(self, ancestor, i):
+        """
+        Returns `True` if domain `ancestor` is an ancestor of domain `i`.
+        """
+        return ancestor < i < self.ends[ancestor]
+
+
+    # --- Senses ---
+
+    def Senses(self, i, includeDescendants=False):
+        """
+        Returns a list of the guids of the senses in domain `i` and,
+        optionally, all its descendants.
+        """
+        senses = list(self.__senses.get(i, []))
+        if includeDescendants:
+            for d in self.Descendants(i):
+                senses += self.__senses.get(d, [])
+        return senses
+
+
+    def DomainsInUse(self):
+        """
+        Returns a sorted list of the indexes of the domains that have
+        senses.
+        """
+        return sorted(self.__senses)
@@ -0,0 +1,542 @@
+#
+#   FLExServer.py
+#
+#   Module: A long-running project server, and a client for it.
+#
+#           Opening a project (FLExInitialize(), OpenProject() and
+#           building the caches) can take many seconds, so scripts that
+#           run many small queries can instead call the read functions
+#           of a project that a ProjectServer keeps open.
+#
+#           The server listens on a local TCP socket, and the protocol
+#           is one JSON object per line. Each request is a call of a
+#           project function by name, and the result is returned as
+#           JSON: LCM objects are sent as {"guid": ..., "class": ...},
+#           and can be passed back as parameters; other sequences are
+#           sent as lists.
+#
+#           The projects are opened read-only, and the calls to each
+#           project are made one at a time.
+#
+#   Platform: Python.NET
+#             FieldWorks Version 9
+#
+#   Copyright Craig Farrow, 2025
+#
+
+import json
+import socket
+import datetime
+import threading
+import collections
+import socketserver
+
+from . import FLExExceptions
+from .FLExExceptions import (
+    FP_ParameterError,
+    FP_ReadOnlyError,
+    FP_RuntimeError,
+    )
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+#--- Globals --------------------------------------------------------
+
+DefaultHost = "127.0.0.1"
+DefaultPort = 48621
+
+# The project functions that can be called through the server: only
+# those that read the project. Functions that write (to the project or
+# to a file, e.g. LexiconSearchIndex(fileName)) aren't included.
+ReadFunctions = frozenset({
+    "BestStr",
+    "BuildGotoURL",
+    "CustomFields",
+    "DateModified",
+    "GetAllAnalysisWSs",
+    "GetAllSemanticDomains",
+    "GetAllVernacularWSs",
+    "GetCustomFieldValue",
+    "GetDateLastModified",
+    "GetDefaultAnalysisWS",
+    "GetDefaultVernacularWS",
+    "GetFieldID",
+    "GetLexicalRelationTypes",
+    "GetPartsOfSpeech",
+    "GetPublications",
+    "GetWritingSystems",
+    "LexiconAllEntries",
+    "LexiconAllEntriesSorted",
+    "LexiconEntryAnalysesCount",
+    "LexiconFieldIsAnyStringType",
+    "LexiconFieldIsMultiType",
+    "LexiconFieldIsStringType",
+    "LexiconGetAllomorphCustomFields",
+    "LexiconGetCitationForm",
+    "LexiconGetEntryCustomFieldNamed",
+    "LexiconGetEntryCustomFields",
+    "LexiconGetExample",
+    "LexiconGetExampleCustomFields",
+    "LexiconGetExampleTranslation",
+    "LexiconGetFieldText",
+    "LexiconGetHeadword",
+    "LexiconGetLexemeForm",
+    "LexiconGetPronunciation",
+    "LexiconGetPublishInCount",
+    "LexiconGetSenseCustomFieldNamed",
+    "LexiconGetSenseCustomFields",
+    "LexiconGetSenseDefinition",
+    "LexiconGetSenseGloss",
+    "LexiconGetSenseNumber",
+    "LexiconGetSensePOS",
+    "LexiconGetSenseSemanticDomains",
+    "LexiconNumberOfEntries",
+    "LexiconSenseAnalysesCount",
+    "ListFieldPossibilities",
+    "ListFieldPossibilityList",
+    "Object",
+    "ObjectCountFor",
+    "ObjectIds",
+    "Objects",
+    "ObjectsIn",
+    "ProjectName",
+    "PublicationEntries",
+    "PublicationType",
+    "ReversalEntries",
+    "ReversalFind",
+    "ReversalGetForm",
+    "ReversalIndex",
+    "TextsGetAll",
+    "TextsGetParagraphRuns",
+    "TextsNumberOfTexts",
+    "WSHandle",
+    "WSUIName",
+    })
+
+RemoteObject = collections.namedtuple("RemoteObject", ["Guid", "ClassName"])
+RemoteObject.__doc__ = """
+An LCM object returned by a `ProjectClient`:
+    - `Guid`       - the object's guid (lower-case string)
+    - `ClassName`  - the LCM class name (e.g. "LexEntry")
+
+It can be passed as a parameter to other `ProjectClient` functions,
+and to `ProjectClient.Object()` to get the object's fields.
+"""
+
+
+def _IsObjectRef(value):
+    return isinstance(value, dict) and set(value) == {"guid", "class"}
+
+
+#--- Server ---------------------------------------------------------
+
+def _ToJSON(value):
+    # Converts a return value from a project function to JSON types.
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, dict):
+        return {str(k): _ToJSON(v) for k, v in value.items()}
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+    if hasattr(value, "ClassName") and hasattr(value, "Guid"):
+        return {"guid": str(value.Guid).lower(), "class": value.ClassName}
+    if hasattr(value, "Text"):
+        return value.Text                   # ITsString
+    try:
+        return [_ToJSON(v) for v in value]
+    except TypeError:
+        return str(value)
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        server = self.server.projectServer
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            requestId = None
+            try:
+                request = json.loads(line.decode("utf-8"))
+                requestId = request.get("id")
+                response = {"id": requestId,
+                            "result": server.HandleRequest(request)}
+            except Exception as e:
+                # The FP_* exceptions keep their text in .message
+                message = getattr(e, "message", None) or str(e)
+                logger.debug("ProjectServer: %s: %s"
+                             % (type(e).__name__, message))
+                response = {"id": requestId,
+                            "error": {"type": type(e).__name__,
+                                      "message": message}}
+            self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+            self.wfile.flush()
+
+
+class _TCPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class ProjectServer(object):
+    """
+    Keeps projects open and serves calls to their functions to
+    `ProjectClient`s on a local socket.
+
+    host, port:
+        The address to listen on. Use port 0 to pick a free port (see
+        `address`). Only bind to the local machine: there is no
+        authentication.
+
+    projectClass:
+        The class used to open each project. Defaults to `FLExProject`,
+        in which case `FLExInitialize()` is called. Use `FWDataProject`
+        to serve .fwdata files.
+
+    Projects are opened (read-only) on the first request for them, or
+    with `Open()`, and stay open until `Close()` or `Shutdown()`.
+
+    Usage::
+
+        # The server process
+        server = ProjectServer()
+        server.Open("Sena 3")
+        server.ServeForever()
+
+        # Each script
+        project = ProjectClient()
+        project.OpenProject("Sena 3")
+        for entry in project.LexiconAllEntries():
+            print(project.LexiconGetHeadword(entry))
+        project.CloseProject()
+    """
+
+    def __init__(self, host=DefaultHost, port=DefaultPort, projectClass=None):
+        if projectClass is None:
+            from .FLExInit import FLExInitialize
+            from .FLExProject import FLExProject
+            FLExInitialize()
+            projectClass = FLExProject
+        self.projectClass = projectClass
+
+        self.__projects = {}            # name -> (project, lock)
+        self.__opening = {}             # name -> lock, while opening
+        self.__lock = threading.Lock()
+        self.__thread = None
+
+        self.server = _TCPServer((host, port), _RequestHandler)
+        self.server.projectServer = self
+        self.address = self.server.server_address
+        logger.info("ProjectServer: listening on %s:%d" % self.address)
+
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.Shutdown()
+
+
+    # --- Projects ---
+
+    def __Project(self, projectName):
+        with self.__lock:
+            try:
+                return self.__projects[projectName]
+            except KeyError:
+                pass
+            opening = self.__opening.setdefault(projectName, threading.Lock())
+
+        # Opening can take a long time, so it is done outside the main
+        # lock: other projects can still be used, and other requests for
+        # this project wait here until it is open.
+        with opening:
+            with self.__lock:
+                if projectName in self.__projects:
+                    return self.__projects[projectName]
+            logger.info("ProjectServer: opening %s" % projectName)
+            project = self.projectClass()
+            project.OpenProject(projectName, writeEnabled=False)
+            with self.__lock:
+                self.__projects[projectName] = (project, threading.Lock())
+                self.__opening.pop(projectName, None)
+                return self.__projects[projectName]
+
+
+    def Open(self, projectName):
+        """
+        Opens `projectName` if it isn't already open.
+        """
+        self.__Project(projectName)
+
+
+    def Close(self, projectName):
+        """
+        Closes `projectName` if it is open.
+        """
+        with self.__lock:
+            project, lock = self.__projects.pop(projectName, (None, None))
+        if project:
+            with lock:
+                project.CloseProject()
+
+
+    def ProjectNames(self):
+        """
+        Returns a list of the names of the open projects.
+        """
+        with self.__lock:
+            return list(self.__projects)
+
+
+    # --- Requests ---
+
+    def Call(self, projectName, functionName, args=(), kwargs=None):
+        """
+        Calls the project function `functionName` with the parameters
+        from a client, and returns the result converted to JSON types.
+        Only the functions in `ReadFunctions` can be called.
+        """
+        if functionName not in ReadFunctions:
+            raise FP_ParameterError("%s can't be called through the server"
+                                    % functionName)
+        project, lock = self.__Project(projectName)
+        function = getattr(project, functionName, None)
+        if not callable(function):
+            raise FP_ParameterError("%s is not a project function"
+                                    % functionName)
+
+        def FromJSON(value):
+            if _IsObjectRef(value):
+                return project.Object(value["guid"])
+            if isinstance(value, list):
+                return [FromJSON(v) for v in value]
+            return value
+
+        with lock:
+            result = function(*[FromJSON(a) for a in args],
+                              **{k: FromJSON(v)
+                                 for k, v in (kwargs or {}).items()})
+            # Iterators must be read while the project is locked.
+            return _ToJSON(result)
+
+
+    def HandleRequest(self, request):
+        """
+        Returns the result of a request, which is either a function
+        call, {"project": ..., "function": ..., "args": [...],
+        "kwargs": {...}}, or a command, {"command": ...}.
+        """
+        command = request.get("command")
+        if command is None:
+            return self.Call(request["project"],
+                             request["function"],
+                             request.get("args", ()),
+                             request.get("kwargs"))
+        if command == "ping":
+            return "pong"
+        if command == "projects":
+            return self.ProjectNames()
+        if command == "open":
+            self.Open(request["project"])
+            return None
+        if command == "close":
+            self.Close(request["project"])
+            return None
+        raise FP_ParameterError("Unknown command: %s" % command)
+
+
+    # --- Running ---
+
+    def ServeForever(self):
+        """
+        Handles requests until `Shutdown()` is called (from another
+        thread) or the process is interrupted.
+        """
+        try:
+            self.server.serve_forever()
+        finally:
+            self.__CloseAll()
+
+
+    def Start(self):
+        """
+        Handles requests in a background thread.
+        """
+        self.__thread = threading.Thread(target=self.server.serve_forever,
+                                         daemon=True)
+        self.__thread.start()
+
+
+    def Shutdown(self):
+        """
+        Stops the server and closes all the projects.
+        """
+        if self.__thread:
+            self.server.shutdown()
+            self.__thread.join()
+            self.__thread = None
+        self.server.server_close()
+        self.__CloseAll()
+
+
+    def __CloseAll(self):
+        for projectName in self.ProjectNames():
+            self.Close(projectName)
+
+
+#--- Client ---------------------------------------------------------
+
+def _ToRequest(value):
+    if isinstance(value, RemoteObject):
+        return {"guid": value.Guid, "class": value.ClassName}
+    if isinstance(value, (list, tuple)):
+        return [_ToRequest(v) for v in value]
+    return value
+
+
+def _FromResponse(value):
+    if _IsObjectRef(value):
+        return RemoteObject(value["guid"], value["class"])
+    if isinstance(value, list):
+        return [_FromResponse(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _FromResponse(v) for k, v in value.items()}
+    return value
+
+
+class ProjectClient(object):
+    """
+    A proxy for a project held open by a `ProjectServer`, with the same
+    function names as `FLExProject`. The parameters and results are
+    passed as JSON, so:
+
+        - LCM objects are returned as `RemoteObject`s, which can be
+          passed back to other functions.
+        - Iterators are returned as lists.
+        - Strings (`ITsString`) are returned as `str`.
+        - Only the read functions can be used: the server's projects
+          are read-only.
+
+    Errors raised by the project are raised by the client as the same
+    FP_* exception, or as `FP_RuntimeError` for other exceptions.
+
+    Usage::
+
+        project = ProjectClient()
+        project.OpenProject("Sena 3")
+        for entry in project.LexiconAllEntries():
+            print(project.LexiconGetHeadword(entry))
+        project.CloseProject()
+    """
+
+    def __init__(self, host=DefaultHost, port=DefaultPort, timeout=None):
+        self.address = (host, port)
+        self.timeout = timeout
+        self.projectName = None
+        self.__socket = None
+        self.__file = None
+        self.__requestId = 0
+
+
+    def __Connect(self):
+        if self.__socket is None:
+            self.__socket = socket.create_connection(self.address, self.timeout)
+            self.__file = self.__socket.makefile("rwb")
+
+
+    def __Request(self, request):
+        self.__Connect()
+        self.__requestId += 1
+        request["id"] = self.__requestId
+        self.__file.write(json.dumps(request).encode("utf-8") + b"\n")
+        self.__file.flush()
+        line = self.__file.readline()
+        if not line:
+            self.Disconnect()
+            raise FP_RuntimeError("ProjectClient: the server closed the connection")
+        response = json.loads(line.decode("utf-8"))
+
+        error = response.get("error")
+        if error:
+            exceptionClass = getattr(FLExExceptions, error["type"], None)
+            if isinstance(exceptionClass, type) and \
+               issubclass(exceptionClass, Exception) and \
+               error["type"].startswith("FP_"):
+                # Re-create it without its __init__(), which may take
+                # different parameters.
+                e = exceptionClass.__new__(exceptionClass)
+                e.args = (error["message"],)
+                e.message = error["message"]
+                raise e
+            raise FP_RuntimeError("%s: %s" % (error["type"], error["message"]))
+        return _FromResponse(response.get("result"))
+
+
+    def Disconnect(self):
+        """
+        Closes the connection to the server.
+        """
+        if self.__socket:
+            self.__file.close()
+            self.__socket.close()
+            self.__socket = None
+            self.__file = None
+
+
+    # --- FLExProject functions ---
+
+    def OpenProject(self, projectName, writeEnabled=False):
+        """
+        Selects the project to use, and has the server open it if it
+        isn't already open.
+        """
+        if writeEnabled:
+            raise FP_ReadOnlyError()
+        self.__Request({"command": "open", "project": projectName})
+        self.projectName = projectName
+
+
+    def CloseProject(self):
+        """
+        Disconnects from the server. The project stays open in the
+        server.
+        """
+        self.Disconnect()
+        self.projectName = None
+
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        def Function(*args, **kwargs):
+            if self.projectName is None:
+                raise FP_ParameterError("ProjectClient: no project is open")
+            return self.__Request({"project": self.projectName,
+                                   "function": name,
+                                   "args": _ToRequest(list(args)),
+                                   "kwargs": {k: _ToRequest(v)
+                                              for k, v in kwargs.items()}})
+        Function.__name__ = name
+        return Function
+
+
+    # --- Server commands ---
+
+    def Ping(self):
+        """
+        Returns `True` if the server is running.
+        """
+        try:
+            return self.__Request({"command": "ping"}) == "pong"
+        except OSError:
+            return False
+
+
+    def ServerProjects(self):
+        """
+        Returns a list of the projects that the server has open.
+        """
+        return self.__Request({"command": "projects"})
@@ -0,0 +1,184 @@
+#
+#   FLExSort.py
+#
+#   Module: Sort keys for sorting lexicon entries by writing system.
+#
+#           Collation keys are computed once for each entry and cached,
+#           with the sort string, by guid and modification date. So
+#           re-sorting an unchanged lexicon doesn't read the sort
+#           strings, and only needs the (fast) comparison of the keys.
+#
+#           The key function can come from the writing system's ICU
+#           collator (via LCM), or from PyICU, if it is installed.
+#           Otherwise a pure-Python multi-level key is used.
+#
+#   Platform: Python 3
+#
+#   Copyright Craig Farrow, 2025
+#
+
+import json
+import unicodedata
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+#--------------------------------------------------------------------
+
+def SortKeyFallback(text):
+    """
+    A pure-Python sort key for `text`, returned as `bytes`.
+    Strings are compared by their base letters first, then by accents,
+    then by case, approximating the default Unicode collation order
+    for Latin-based scripts.
+    """
+    decomposed = unicodedata.normalize("NFD", text)
+    base = "".join(c for c in decomposed
+                   if not unicodedata.combining(c)).casefold()
+    accents = "".join(c for c in decomposed.casefold()
+                      if unicodedata.combining(c))
+    # Lower case sorts before upper case
+    case = "".join("1" if c.isupper() else "0" for c in decomposed)
+    # Each level is separated by a zero byte, which sorts before
+    # any character, so shorter strings sort first.
+    return b"\x00".join(level.encode("utf-8")
+                        for level in (base, accents, case, text))
+
+
+def SortKeyFunction(languageTag):
+    """
+    Returns a function that computes the sort key (`bytes`) of a
+    string for `languageTag`. PyICU is used if it is installed,
+    otherwise `SortKeyFallback()`.
+    """
+    try:
+        import icu
+    except ImportError:
+        return SortKeyFallback
+
+    # Private-use subtags (e.g. zh-CN-x-zhsort) are not known to ICU.
+    locale = icu.Locale(languageTag.split("-x-")[0].replace("-", "_"))
+    collator = icu.Collator.createInstance(locale)
+    return collator.getSortKey
+
+
+#--------------------------------------------------------------------
+
+class SortKeyCache(object):
+    """
+    A cache of sort keys for a writing system, keyed by object guid and
+    modification date. A key is only recomputed when the object has
+    been modified since its key was cached.
+
+    keyFunction:
+        A function that takes a string and returns its sort key (`bytes`).
+
+    fileName:
+        If given, the cache is loaded from this file (if it exists and
+        has the same `identity`), and `Save()` writes it back.
+
+    identity:
+        A string identifying the collation (e.g. the language tag and
+        collation rules). A saved cache with a different identity is
+        ignored.
+
+    Usage::
+
+        cache = SortKeyCache(SortKeyFunction("fr"))
+        items = [(entry.Guid, entry.DateModified,
+                  lambda: Headword(entry), entry) ...]
+        for entry in cache.Sorted(items):
+            ...
+    """
+
+    def __init__(self, keyFunction, fileName=None, identity=""):
+        self.keyFunction = keyFunction
+        self.fileName = fileName
+        self.identity = identity
+        self.hits = 0
+        self.misses = 0
+
+        self.__keys = {}
+        self.__changed = False
+        if fileName:
+            self.__Load()
+
+
+    def __Load(self):
+        try:
+            with open(self.fileName, encoding="utf-8") as f:
+                data = json.load(f)
+            if data["identity"] != self.identity:
+                logger.info("SortKeyCache: collation changed; ignoring %s"
+                            % self.fileName)
+                return
+            self.__keys = {guid: (modified, text, bytes.fromhex(key))
+                           for guid, (modified, text, key)
+                           in data["keys"].items()}
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+
+    def Save(self):
+        """
+        Write the cache to `fileName`, if it has changed.
+        """
+        if not self.fileName or not self.__changed:
+            return
+        data = {"identity" : self.identity,
+                "keys"     : {guid: (modified, text, key.hex())
+                              for guid, (modified, text, key)
+                              in self.__keys.items()}}
+        try:
+            with open(self.fileName, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            self.__changed = False
+        except OSError as e:
+            logger.warning("SortKeyCache: couldn't save %s: %s"
+                           % (self.fileName, e))
+
+
+    def __len__(self):
+        return len(self.__keys)
+
+
+    def Key(self, guid, modified, text):
+        """
+        Returns the sort key for `text`, which is the sort string of the
+        object with the given `guid` and modification date/time
+        (any JSON-compatible value, such as a string or integer ticks).
+
+        `text` can be a function that returns the sort string, in which
+        case it is only called if the object has been modified since
+        its key was cached. (Use this for sort strings that are slow to
+        read, such as headwords.) If `text` is a string, the key is also
+        recomputed if it differs from the cached text.
+        """
+        guid = str(guid).lower()
+        cached = self.__keys.get(guid)
+        if cached and cached[0] == modified \
+           and (callable(text) or cached[1] == text):
+            self.hits += 1
+            return cached[2]
+
+        self.misses += 1
+        if callable(text):
+            text = text()
+        key = self.keyFunction(text)
+        self.__keys[guid] = (modified, text, key)
+        self.__changed = True
+        return key
+
+
+    def Sorted(self, items):
+        """
+        Returns a list of objects sorted by their keys. `items` is an
+        iterable of (guid, modified, text, object) tuples, where `text`
+        is the sort string or a function that returns it (see `Key()`).
+        Objects with equal keys keep their original order.
+        """
+        keyed = [(self.Key(guid, modified, text), i, obj)
+                 for i, (guid, modified, text, obj) in enumerate(items)]
+        keyed.sort(key=lambda k: k[:2])
+        return [obj for key, i, obj in keyed]
@@ -0,0 +1,199 @@
+#
+#   FLExWritingSystems.py
+#
+#   Module: A registry of the writing systems in a project.
+#
+#           The registry is built once when the project is opened, and
+#           doesn't change, so that the writing system functions are
+#           simple dictionary lookups rather than enumerations of the
+#           LCM writing systems.
+#
+#   Platform: Python 3
+#
+#   Copyright Craig Farrow, 2025
+#
+
+import collections
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+#--------------------------------------------------------------------
+
+WritingSystem = collections.namedtuple("WritingSystem",
+                                       ["languageTag",
+                                        "normalisedTag",
+                                        "handle",
+                                        "name",
+                                        "isVernacular",
+                                        "isAnalysis",
+                                        "isDefaultVernacular",
+                                        "isDefaultAnalysis"])
+WritingSystem.__doc__ = """
+A writing system in a `WritingSystemRegistry`:
+    - `languageTag`          - the language tag (e.g. "en" or "zh-CN")
+    - `normalisedTag`        - the language tag in lower case and with
+                               '_' for '-'
+    - `handle`               - the LCM handle
+    - `name`                 - the display label
+    - `isVernacular`         - `True` if it is a current vernacular WS
+    - `isAnalysis`           - `True` if it is a current analysis WS
+    - `isDefaultVernacular`  - `True` for the default vernacular WS
+    - `isDefaultAnalysis`    - `True` for the default analysis WS
+"""
+
+
+def NormaliseLanguageTag(languageTag):
+    """
+    Returns `languageTag` in lower case and with '_' for '-', so that
+    tags can be matched ignoring these differences.
+    """
+    return languageTag.replace("-", "_").lower()
+
+
+#--------------------------------------------------------------------
+
+class WritingSystemRegistry(object):
+    """
+    An immutable registry of writing systems.
+
+    writingSystems:
+        An iterable of (languageTag, handle, name) for all the writing
+        systems.
+
+    vernacularTags, analysisTags:
+        The language tags of the current vernacular and analysis writing
+        systems, in order.
+
+    defaultVernacular, defaultAnalysis:
+        The language tags of the default writing systems.
+
+    Usage::
+
+        ws = project.writingSystems.Find("en")
+        print(ws.handle, ws.name, ws.isAnalysis)
+    """
+
+    __slots__ = ("__all", "__byTag", "__byHandle",
+                 "__vernacularTags", "__analysisTags",
+                 "__defaultVernacular", "__defaultAnalysis")
+
+    def __init__(self, writingSystems, vernacularTags, analysisTags,
+                 defaultVernacular, defaultAnalysis):
+        vernacularTags = tuple(vernacularTags)
+        analysisTags = tuple(analysisTags)
+        vernacularSet = {NormaliseLanguageTag(t) for t in vernacularTags}
+        analysisSet = {NormaliseLanguageTag(t) for t in analysisTags}
+        defaultVernacular = NormaliseLanguageTag(defaultVernacular)
+        defaultAnalysis = NormaliseLanguageTag(defaultAnalysis)
+
+        allWSs = []
+        byTag = {}
+        byHandle = {}
+        for languageTag, handle, name in writingSystems:
+            normalisedTag = NormaliseLanguageTag(languageTag)
+            ws = WritingSystem(languageTag,
+                               normalisedTag,
+                               handle,
+                               name,
+                               normalisedTag in vernacularSet,
+                               normalisedTag in analysisSet,
+                               normalisedTag == defaultVernacular,
+                               normalisedTag == defaultAnalysis)
+            allWSs.append(ws)
+            byTag.setdefault(normalisedTag, ws)
+            byHandle.setdefault(handle, ws)
+
+        self.__all = tuple(allWSs)
+        self.__byTag = byTag
+        self.__byHandle = byHandle
+        self.__vernacularTags = vernacularTags
+        self.__analysisTags = analysisTags
+        self.__defaultVernacular = byTag.get(defaultVernacular)
+        self.__defaultAnalysis = byTag.get(defaultAnalysis)
+
+        logger.debug("WritingSystemRegistry: %d writing systems" % len(allWSs))
+
+
+    def __len__(self):
+        return len(self.__all)
+
+    def __iter__(self):
+        return iter(self.__all)
+
+
+    # --- Lookups ---
+
+    def Find(self, languageTagOrHandle):
+        """
+        Returns the `WritingSystem` for a language tag (ignoring case
+        and '-'/'_' differences) or handle, or `None` if it isn't found.
+        """
+        if isinstance(languageTagOrHandle, str):
+            return self.__byTag.get(NormaliseLanguageTag(languageTagOrHandle))
+        return self.__byHandle.get(languageTagOrHandle)
+
+
+    def Handle(self, languageTag):
+        """
+        Returns the handle for `languageTag`, or `None`.
+        """
+        ws = self.__byTag.get(NormaliseLanguageTag(languageTag))
+        return ws.handle if ws else None
+
+
+    def Tag(self, handle):
+        """
+        Returns the language tag for `handle`, or `None`.
+        """
+        ws = self.__byHandle.get(handle)
+        return ws.languageTag if ws else None
+
+
+    def Name(self, languageTagOrHandle):
+        """
+        Returns the display name for a language tag or handle, or `None`.
+        """
+        ws = self.Find(languageTagOrHandle)
+        return ws.name if ws else None
+
+
+    # --- Current writing systems ---
+
+    @property
+    def vernacularTags(self):
+        """
+        The language tags of the current vernacular writing systems, in
+        order.
+        """
+        return self.__vernacularTags
+
+    @property
+    def analysisTags(self):
+        """
+        The language tags of the current analysis writing systems, in
+        order.
+        """
+        return self.__analysisTags
+
+    @property
+    def defaultVernacular(self):
+        """
+        The `WritingSystem` of the default vernacular writing system.
+        """
+        return self.__defaultVernacular
+
+    @property
+    def defaultAnalysis(self):
+        """
+        The `WritingSystem` of the default analysis writing system.
+        """
+        return self.__defaultAnalysis
+
+    def Active(self):
+        """
+        Returns a list of the current vernacular and analysis
+        `WritingSystem`s.
+        """
+        return [ws for ws in self.__all if ws.isVernacular or ws.isAnalysis]
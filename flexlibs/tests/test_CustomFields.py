@@ -63,6 +63,69 @@ class TestSuite(unittest.TestCase):
             fp.LexiconSetFieldText(lexEntry, flags_field, "")
                 
         self._closeProject(fp)
+
+    def test_SetFieldValues(self):
+        fp = self._openProject()
+        flags_field = fp.LexiconGetEntryCustomFieldNamed(CUSTOM_FIELD)
+        entries = list(fp.LexiconAllEntries())
+
+        rows = [(e, flags_field, CUSTOM_VALUE) for e in entries]
+        rows.append((None, flags_field, CUSTOM_VALUE))
+        failures = fp.LexiconSetFieldValues(rows)
+        self.assertEqual([rowNumber for rowNumber, e in failures], 
+                         [len(entries)])
+
+        for lexEntry in entries:
+            self.assertEqual(fp.LexiconGetFieldText(lexEntry, flags_field),
+                             CUSTOM_VALUE)
+
+        # Clear the field again
+        self.assertEqual(fp.LexiconSetFieldValues(
+                            (e.Hvo, flags_field, "") for e in entries), [])
+        self._closeProject(fp)
+
+    def test_ListFieldLookup(self):
+        fp = self._openProject()
+        sense = next(fp.LexiconAllEntries()).SensesOS[0]
+        status_field = fp.GetFieldID("LexSense", "Status")
+        for possibility in fp.ListFieldPossibilities(sense, status_field):
+            name = possibility.Name.BestAnalysisAlternative.Text
+            self.assertEqual(fp.ListFieldLookup(sense, status_field, name).Hvo,
+                             possibility.Hvo)
+            self.assertEqual(fp.ListFieldLookup(sense, status_field, 
+                                                name.upper(), 
+                                                ignoreCase=True).Hvo,
+                             possibility.Hvo)
+        self.assertIsNone(fp.ListFieldLookup(sense, status_field, "No such status"))
+
+        # A renamed possibility is found after a refresh.
+        from SIL.LCModel.Core.Text import TsStringUtils
+        possibility = list(fp.ListFieldPossibilities(sense, status_field))[0]
+        ws = fp.project.DefaultAnalWs
+        oldName = possibility.Name.get_String(ws)
+        try:
+            possibility.Name.set_String(ws, 
+                TsStringUtils.MakeString("Renamed status", ws))
+            self.assertEqual(fp.ListFieldLookup(sense, status_field,
+                                                "Renamed status",
+                                                refresh=True).Hvo,
+                             possibility.Hvo)
+        finally:
+            possibility.Name.set_String(ws, oldName)
+        self._closeProject(fp)
+
+    def test_Schema(self):
+        fp = self._openProject()
+        flags_field = fp.LexiconGetEntryCustomFieldNamed(CUSTOM_FIELD)
+        info = fp.schema.Field(flags_field)
+        self.assertTrue(info.isCustom)
+        self.assertEqual(info.label, CUSTOM_FIELD)
+        self.assertEqual(info.className, "LexEntry")
+        self.assertIn((flags_field, CUSTOM_FIELD), 
+                      fp.LexiconGetEntryCustomFields())
+        self.assertEqual(fp.GetFieldID("LexSense", "Gloss"),
+                         fp.schema.Field(fp.GetFieldID("LexSense", "Gloss")).flid)
+        self._closeProject(fp)
     
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,81 @@
+import unittest
+
+import os
+import shutil
+import tempfile
+
+from flexlibs import (
+    FWDataProject,
+    FWDataClassCounts,
+    FP_ParameterError,
+    FP_ProjectError,
+    )
+from flexlibs.code.FLExBackup import FWBackup
+
+# --- Constants ---
+
+TEST_PROJECT = r"__flexlibs_testing"
+TEST_BACKUP = os.path.join(os.path.dirname(__file__), "..", "..",
+                           "resources", TEST_PROJECT + ".fwbackup")
+
+#-----------------------------------------------------------
+
+class TestFWBackup(unittest.TestCase):
+    def setUp(self):
+        self.tempDir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tempDir)
+
+    def test_Backup(self):
+        with FWBackup(TEST_BACKUP) as backup:
+            self.assertEqual(backup.projectName, TEST_PROJECT)
+            with backup.OpenData() as f:
+                self.assertTrue(f.readline().startswith(b"<?xml"))
+            wsFiles = backup.WritingSystemFiles()
+            self.assertIn("en", wsFiles)
+            self.assertEqual(wsFiles["tr"], "WritingSystemStore/tr.ldml")
+            self.assertIn(b"<ldml", backup.ReadWritingSystem("tr"))
+            self.assertIsNone(backup.ReadWritingSystem("xx"))
+            self.assertEqual(len(backup.Hash()), 64)
+
+    def test_Extract(self):
+        with FWBackup(TEST_BACKUP) as backup:
+            fileName = backup.Extract(self.tempDir)
+            self.assertEqual(os.path.dirname(os.path.dirname(fileName)),
+                             os.path.join(self.tempDir, backup.Hash()))
+            self.assertEqual(os.path.getsize(fileName),
+                             backup.zip.getinfo(backup.dataFile).file_size)
+            self.assertTrue(os.path.isfile(os.path.join(
+                os.path.dirname(fileName), "WritingSystemStore", "en.ldml")))
+            # The cached copy is reused
+            mtime = os.path.getmtime(fileName)
+            self.assertEqual(backup.Extract(self.tempDir), fileName)
+            self.assertEqual(os.path.getmtime(fileName), mtime)
+            self.assertEqual(os.listdir(self.tempDir), [backup.Hash()])
+
+    def test_NotABackup(self):
+        fileName = os.path.join(self.tempDir, "x.fwbackup")
+        with open(fileName, "w") as f:
+            f.write("Not a zip file")
+        self.assertRaises(FP_ProjectError, FWBackup, fileName)
+
+    def test_FWDataProject(self):
+        fp = FWDataProject()
+        fp.OpenProject(TEST_BACKUP)
+        self.assertEqual(fp.ProjectName(), TEST_PROJECT)
+        self.assertEqual(fp.LexiconNumberOfEntries(), 10)
+        self.assertIn("apple", [fp.LexiconGetHeadword(e)
+                                for e in fp.LexiconAllEntries()])
+
+        with FWBackup(TEST_BACKUP) as backup:
+            fileName = backup.Extract(self.tempDir)
+        self.assertEqual(dict(fp.ObjectCounts()), FWDataClassCounts(fileName))
+        fp.CloseProject()
+
+        self.assertRaises(FP_ParameterError, fp.OpenProject,
+                          TEST_BACKUP, useIndex=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
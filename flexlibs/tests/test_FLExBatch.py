@@ -0,0 +1,62 @@
+import unittest
+
+import os
+
+from flexlibs import RunOnProjects, FWDataProject, FP_FileLockedError
+
+# --- Constants ---
+
+TEST_PROJECT = r"__flexlibs_testing"
+TEST_BACKUP = os.path.join(os.path.dirname(__file__), "..", "..",
+                           "resources", TEST_PROJECT + ".fwbackup")
+
+#-----------------------------------------------------------
+
+# Batch functions and project classes must be at module level so
+# that they can be sent to the worker processes.
+
+def CountEntries(project):
+    return project.LexiconNumberOfEntries()
+
+
+class LockedProject(FWDataProject):
+    def OpenProject(self, projectName, writeEnabled=False):
+        raise FP_FileLockedError()
+
+
+class TestRunOnProjects(unittest.TestCase):
+    @classmethod
+    def setUpClass(self):
+        # The test project (read from the backup) three times, to run
+        # in parallel
+        self.fileNames = [TEST_BACKUP] * 3
+
+    def test_RunOnProjects(self):
+        results = list(RunOnProjects(CountEntries,
+                                     self.fileNames,
+                                     maxWorkers = 2,
+                                     projectClass = FWDataProject))
+        self.assertEqual(sorted(r.projectName for r in results),
+                         sorted(self.fileNames))
+        for projectName, count, error in results:
+            self.assertIsNone(error)
+            self.assertEqual(count, 10)
+
+    def test_LockedProject(self):
+        results = list(RunOnProjects(CountEntries,
+                                     self.fileNames[:1],
+                                     retries = 2,
+                                     retryDelay = 0,
+                                     projectClass = LockedProject))
+        self.assertEqual(len(results), 1)
+        self.assertIsInstance(results[0].error, FP_FileLockedError)
+
+    def test_MissingProject(self):
+        results = list(RunOnProjects(CountEntries,
+                                     ["no such project.fwdata"],
+                                     projectClass = FWDataProject))
+        self.assertIsNotNone(results[0].error)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,38 @@
+import unittest
+
+from flexlibs.code.FLExCache import ObjectCache
+
+#-----------------------------------------------------------
+
+class TestObjectCache(unittest.TestCase):
+    def test_LRU(self):
+        cache = ObjectCache(maxSize=3)
+        for key in "abc":
+            cache.Put(key, key.upper())
+        self.assertEqual(cache.Get("a"), "A")       # a is now most recent
+        cache.Put("d", "D")                         # drops b
+        self.assertNotIn("b", cache)
+        self.assertIsNone(cache.Get("b"))
+        self.assertEqual(len(cache), 3)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+        cache.Remove("a")
+        cache.Remove("x")
+        self.assertEqual(len(cache), 2)
+        cache.Clear()
+        self.assertEqual((len(cache), cache.hits, cache.misses), (0, 0, 0))
+
+    def test_IsValid(self):
+        deleted = set()
+        cache = ObjectCache(isValid=lambda value: value not in deleted)
+        cache.Put(1, "one")
+        cache.Put(2, "two")
+        deleted.add("two")
+        self.assertEqual(cache.Get(1), "one")
+        self.assertIsNone(cache.Get(2))
+        self.assertNotIn(2, cache)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
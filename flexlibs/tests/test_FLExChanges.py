@@ -0,0 +1,76 @@
+import unittest
+
+import os
+import json
+import shutil
+import datetime
+import tempfile
+
+from flexlibs import FWDataProject, ChangeTracker
+
+# --- Constants ---
+
+TEST_PROJECT = r"__flexlibs_testing"
+TEST_BACKUP = os.path.join(os.path.dirname(__file__), "..", "..",
+                           "resources", TEST_PROJECT + ".fwbackup")
+
+#-----------------------------------------------------------
+
+class TestChanges(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tempDir = tempfile.mkdtemp()
+        cls.fp = FWDataProject()
+        cls.fp.OpenProject(TEST_BACKUP)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.fp.CloseProject()
+        shutil.rmtree(cls.tempDir)
+
+    def test_DateModified(self):
+        fp = self.fp
+        entry = next(fp.LexiconAllEntries())
+        self.assertIsInstance(fp.DateModified(entry), datetime.datetime)
+        # Senses use their entry's date
+        for sense in fp.ObjectsIn("LexSense"):
+            owner = sense.Owner
+            while owner.ClassName != "LexEntry":
+                owner = owner.Owner
+            self.assertEqual(fp.DateModified(sense), fp.DateModified(owner))
+
+    def test_ObjectsModifiedSince(self):
+        fp = self.fp
+        entries = fp.ObjectsModifiedSince("LexEntry")
+        self.assertEqual(len(entries), fp.LexiconNumberOfEntries())
+        dates = sorted(fp.DateModified(e) for e in entries)
+        since = dates[len(dates) // 2]
+        self.assertEqual(len(fp.ObjectsModifiedSince("LexEntry", since)),
+                         len([d for d in dates if d > since]))
+        self.assertEqual(fp.ObjectsModifiedSince("LexSense", dates[-1]), [])
+
+    def test_ChangeTracker(self):
+        fileName = os.path.join(self.tempDir, "changes.json")
+        tracker = ChangeTracker(self.fp, fileName, "website")
+        changes = tracker.Changes(["LexEntry", "LexSense"])
+        self.assertEqual(len(changes["LexEntry"]),
+                         self.fp.LexiconNumberOfEntries())
+        self.assertFalse(os.path.exists(fileName))
+        tracker.Commit()
+
+        # Another consumer has its own watermark
+        ChangeTracker(self.fp, fileName, "index").Commit()
+        with open(fileName) as f:
+            self.assertEqual(list(json.load(f)), ["website"])
+
+        tracker = ChangeTracker(self.fp, fileName, "website")
+        changes = tracker.Changes(["LexEntry", "LexSense"])
+        self.assertEqual(changes, {"LexEntry": [], "LexSense": []})
+
+        tracker.Reset()
+        self.assertEqual(len(tracker.Changes(["LexEntry"])["LexEntry"]),
+                         self.fp.LexiconNumberOfEntries())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+import unittest
+
+import os
+
+from flexlibs import FWDataProject
+from flexlibs.code.FLExCorpus import Corpus
+
+# --- Constants ---
+
+TEST_PROJECT = r"__flexlibs_testing"
+TEST_BACKUP = os.path.join(os.path.dirname(__file__), "..", "..",
+                           "resources", TEST_PROJECT + ".fwbackup")
+
+TEXTS = {
+    "t1" : [[("fr", "Le chat noir et le chien."), 
+             ("en", " The black cat.")],
+            [("fr", "Le chat dort.")]],
+    "t2" : [[("fr", "Un chat, un chien; l'oiseau.")]],
+    }
+
+#-----------------------------------------------------------
+
+class TestCorpus(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+        self.corpus = Corpus()
+        self.corpus.Update(self.__Texts({"t1": 1, "t2": 1}))
+
+    def __Texts(self, stamps):
+        def Paragraphs(guid):
+            self.calls.append(guid)
+            return TEXTS[guid]
+        return [(guid, stamp, guid.upper(), lambda g=guid: Paragraphs(g))
+                for guid, stamp in stamps.items()]
+
+    def test_Frequencies(self):
+        corpus = self.corpus
+        self.assertEqual(len(corpus), 2)
+        self.assertEqual(corpus.Frequencies("fr")["chat"], 3)
+        self.assertEqual(corpus.Frequencies("fr")["le"], 3)
+        self.assertEqual(corpus.Frequencies("en")["cat"], 1)
+        self.assertEqual(corpus.Frequencies()["chat"], 3)
+        self.assertEqual(corpus.TokenCount("en"), 3)
+        self.assertEqual(corpus.Frequencies("fr")["l'oiseau"], 1)
+
+    def test_NGrams(self):
+        bigrams = self.corpus.NGrams(2, "fr")
+        self.assertEqual(bigrams[("le", "chat")], 2)
+        # N-grams don't cross writing systems
+        self.assertEqual(self.corpus.NGrams(2)[("chien", "the")], 0)
+
+    def test_Concordance(self):
+        lines = self.corpus.Concordance("CHIEN", width=6)
+        self.assertEqual(len(lines), 2)
+        line = [l for l in lines if l.textName == "T1"][0]
+        self.assertEqual((line.left, line.word, line.right),
+                         ("et le ", "chien", ". The "))
+        self.assertEqual(self.corpus.Concordance("chien", ws="en"), [])
+
+    def test_Update(self):
+        self.assertEqual(sorted(self.calls), ["t1", "t2"])
+        TEXTS["t3"] = [[("fr", "Le chat.")]]
+        try:
+            self.assertEqual(self.corpus.Update(
+                                self.__Texts({"t1": 1, "t3": 1})), 1)
+        finally:
+            del TEXTS["t3"]
+        # Only the new text was tokenised, and t2 was removed
+        self.assertEqual(sorted(self.calls), ["t1", "t2", "t3"])
+        self.assertEqual(self.corpus.Frequencies("fr")["chat"], 3)
+        self.assertEqual(self.corpus.Frequencies("fr")["chien"], 1)
+
+        # A modified text is re-indexed
+        self.corpus.Update(self.__Texts({"t1": 2}))
+        self.assertEqual(self.calls[-1], "t1")
+        self.assertEqual(self.corpus.Frequencies("fr")["chat"], 2)
+
+    def test_FWDataProject(self):
+        fp = FWDataProject()
+        fp.OpenProject(TEST_BACKUP)
+        corpus = fp.TextsCorpus()
+        self.assertEqual(len(corpus), fp.TextsNumberOfTexts())
+        self.assertIs(fp.TextsCorpus(corpus), corpus)
+        fp.CloseProject()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,141 @@
+import unittest
+
+import os
+import collections
+import shutil
+import sqlite3
+import tempfile
+
+from flexlibs import (
+    FWDataProject,
+    ExportToSQLite,
+    ExportToArrow,
+    ExportToParquet,
+    )
+from flexlibs.code.FLExExport import ExportRows
+
+try:
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+# --- Constants ---
+
+TEST_PROJECT = r"__flexlibs_testing"
+TEST_BACKUP = os.path.join(os.path.dirname(__file__), "..", "..",
+                           "resources", TEST_PROJECT + ".fwbackup")
+
+#-----------------------------------------------------------
+
+class TestExportToSQLite(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tempDir = tempfile.mkdtemp()
+        cls.fwdata = TEST_BACKUP
+        cls.dbName = os.path.join(cls.tempDir, "snapshot.db")
+        cls.counts = ExportToSQLite(cls.fwdata, cls.dbName, batchSize=100)
+        cls.db = sqlite3.connect(cls.dbName)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.db.close()
+        shutil.rmtree(cls.tempDir)
+
+    def test_Counts(self):
+        fp = FWDataProject()
+        fp.OpenProject(self.fwdata)
+        self.assertEqual(self.counts["entries"], fp.LexiconNumberOfEntries())
+        self.assertEqual(self.counts["senses"], fp.ObjectCountFor("LexSense"))
+        self.assertEqual(self.counts["possibilities"],
+                         fp.ObjectCountFor("CmPossibility"))
+        self.assertEqual(self.counts["reversal_entries"],
+                         fp.ObjectCountFor("ReversalIndexEntry"))
+        self.assertEqual(self.counts["texts"], fp.TextsNumberOfTexts())
+        fp.CloseProject()
+
+        for table, count in self.counts.items():
+            self.assertEqual(self.db.execute("SELECT COUNT(*) FROM %s"
+                                             % table).fetchone()[0], count)
+
+    def test_Queries(self):
+        rows = self.db.execute(
+            "SELECT headword, gloss FROM entries "
+            "JOIN senses ON senses.entry_guid = entries.guid "
+            "WHERE headword = ? AND parent_guid IS NULL",
+            ("apple",)).fetchall()
+        self.assertEqual(len(rows), 1)
+
+        rows = self.db.execute(
+            "SELECT ws FROM strings WHERE field = 'Gloss' AND text = ?",
+            (rows[0][1],)).fetchall()
+        self.assertEqual(rows, [("en",)])
+
+        plan = self.db.execute("EXPLAIN QUERY PLAN SELECT guid FROM entries "
+                               "WHERE headword = 'apple'").fetchall()
+        self.assertIn("entries_headword", plan[0][-1])
+
+        domain = self.db.execute(
+            "SELECT guid, parent_guid FROM possibilities WHERE abbreviation = ?",
+            ("8.4.5",)).fetchone()
+        parent = self.db.execute(
+            "SELECT abbreviation FROM possibilities WHERE guid = ?",
+            (domain[1],)).fetchone()
+        self.assertEqual(parent, ("8.4",))
+
+    def test_ExportRows(self):
+        fp = FWDataProject()
+        fp.OpenProject(self.fwdata)
+        loaded = fp.LoadedClasses()
+        tables = {table for table, row in ExportRows(fp, ["senses",
+                                                          "reversal_senses"])}
+        self.assertEqual(tables, {"senses", "reversal_senses"})
+        # The classes loaded by the export are released again.
+        self.assertEqual(fp.LoadedClasses(), loaded | {"LangProject", "LexDb"})
+
+        entries = list(fp.LexiconAllEntries())
+        loaded = fp.LoadedClasses()
+        counts = collections.Counter(table for table, row in ExportRows(fp))
+        self.assertEqual(counts["entries"], len(entries))
+        self.assertEqual(fp.LoadedClasses(), loaded)
+        self.assertIs(fp.Object(entries[0].Guid), entries[0])
+        fp.CloseProject()
+
+
+@unittest.skipUnless(pyarrow, "pyarrow is not installed")
+class TestExportToArrow(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tempDir = tempfile.mkdtemp()
+        cls.fp = FWDataProject()
+        cls.fp.OpenProject(TEST_BACKUP)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.fp.CloseProject()
+        shutil.rmtree(cls.tempDir)
+
+    def test_Arrow(self):
+        tables = ExportToArrow(self.fp, tables=["senses", "strings"])
+        self.assertEqual(sorted(tables), ["senses", "strings"])
+        self.assertEqual(tables["senses"].num_rows,
+                         self.fp.ObjectCountFor("LexSense"))
+        glosses = tables["senses"].column("gloss").to_pylist()
+        self.assertIn("Apple.computer", glosses)
+        self.assertEqual(tables["senses"].schema.field("position").type,
+                         pyarrow.int64())
+
+    def test_Parquet(self):
+        directory = os.path.join(self.tempDir, "parquet")
+        counts = ExportToParquet(self.fp, directory, batchSize=7)
+        for table, count in counts.items():
+            parquet = pyarrow.parquet.ParquetFile(
+                            os.path.join(directory, table + ".parquet"))
+            self.assertEqual(parquet.metadata.num_rows, count)
+        self.assertGreater(pyarrow.parquet.ParquetFile(
+                                os.path.join(directory, "strings.parquet"))\
+                            .metadata.num_row_groups, 1)
+        self.assertEqual(counts["entries"], self.fp.LexiconNumberOfEntries())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,169 @@
+import unittest
+
+import os
+import shutil
+import tempfile
+import zipfile
+
+from flexlibs import FWDataProject, FWDataClassCounts
+from flexlibs import FP_ParameterError, FP_WritingSystemError
+from flexlibs.code.FLExFWDataIndex import FWDataIndex
+
+# --- Constants ---
+
+TEST_PROJECT = r"__flexlibs_testing"
+TEST_BACKUP = os.path.join(os.path.dirname(__file__), "..", "..",
+                           "resources", TEST_PROJECT + ".fwbackup")
+
+#-----------------------------------------------------------
+
+def _ExtractTestProject():
+    tempDir = tempfile.mkdtemp()
+    with zipfile.ZipFile(TEST_BACKUP) as backup:
+        backup.extract(TEST_PROJECT + ".fwdata", tempDir)
+    return tempDir, os.path.join(tempDir, TEST_PROJECT + ".fwdata")
+
+
+class TestFWDataProject(unittest.TestCase):
+    @classmethod
+    def setUpClass(self):
+        self.tempDir, self.fileName = _ExtractTestProject()
+
+    @classmethod
+    def tearDownClass(self):
+        shutil.rmtree(self.tempDir)
+
+    def setUp(self):
+        self.fp = FWDataProject()
+        self.fp.OpenProject(self.fileName)
+
+    def tearDown(self):
+        self.fp.CloseProject()
+
+    def test_OpenProject(self):
+        self.assertEqual(self.fp.ProjectName(), TEST_PROJECT)
+        with self.assertRaises(FP_ParameterError):
+            FWDataProject().OpenProject(self.fileName, writeEnabled=True)
+
+    def test_WritingSystems(self):
+        self.assertEqual(self.fp.GetDefaultVernacularWS()[0], "tr")
+        self.assertEqual(self.fp.GetDefaultAnalysisWS()[0], "en")
+        self.assertIn("zh-CN-x-zhsort", self.fp.GetAllAnalysisWSs())
+
+    def test_ReadLexicon(self):
+        self.assertEqual(self.fp.LexiconNumberOfEntries(), 10)
+
+        headwords = []
+        for lexEntry in self.fp.LexiconAllEntriesSorted():
+            headwords.append(self.fp.LexiconGetHeadword(lexEntry))
+            for sense in lexEntry.SensesOS:
+                self.assertIsInstance(self.fp.LexiconGetSenseGloss(sense), str)
+                self.assertEqual(self.fp.LexiconGetSensePOS(sense), "n")
+        self.assertEqual(headwords[:5],
+                         ["apple", "Apple", "computer", "date1", "date2"])
+
+    def test_SenseGloss(self):
+        for lexEntry in self.fp.LexiconAllEntries():
+            if self.fp.LexiconGetLexemeForm(lexEntry) == "table":
+                sense = lexEntry.SensesOS[0]
+                self.assertEqual(self.fp.LexiconGetSenseGloss(sense), "table")
+                self.assertEqual(self.fp.LexiconGetSenseGloss(sense, "zh-CN"), "桌子")
+                with self.assertRaises(FP_WritingSystemError):
+                    self.fp.LexiconGetSenseGloss(sense, "xyz")
+                break
+        else:
+            self.fail("Entry 'table' not found")
+
+    def test_CustomFields(self):
+        flid = self.fp.LexiconGetEntryCustomFieldNamed("EntryFlags")
+        self.assertTrue(flid)
+        for lexEntry in self.fp.LexiconAllEntries():
+            self.assertIsInstance(self.fp.LexiconGetFieldText(lexEntry, flid), str)
+
+    def test_Texts(self):
+        self.assertEqual(self.fp.TextsNumberOfTexts(), 1)
+        self.assertEqual([name for name, text in self.fp.TextsGetAll()],
+                         ["Example text"])
+
+    def test_ObjectCounts(self):
+        counts = FWDataClassCounts(self.fileName)
+        self.assertEqual(counts["CmDomainQ"], 7939)
+        self.assertEqual(counts["CmSemanticDomain"], 1792)
+        self.assertEqual(counts["LexEntry"], 10)
+        self.assertEqual(FWDataClassCounts(self.fileName, ["LexEntry", "LexEntryRef"]),
+                         {"LexEntry": 10, "LexEntryRef": 0})
+        self.assertEqual(self.fp.ObjectCounts(), counts)
+        self.assertEqual(self.fp.LexiconNumberOfEntries(), 10)
+
+    def test_Object(self):
+        entry = next(self.fp.LexiconAllEntries())
+        self.assertIs(self.fp.Object(entry.Guid.upper()), entry)
+        self.assertIsNone(self.fp.Object("00000000-0000-0000-0000-000000000000"))
+
+    def test_Objects(self):
+        senses = list(self.fp.ObjectsIn("LexSense"))
+        missing = "00000000-0000-0000-0000-000000000000"
+        guids = [senses[1].Guid.upper(), missing, senses[0].Guid, senses[1].Guid]
+        objects = self.fp.Objects(guids)
+        self.assertEqual(objects, [senses[1], None, senses[0], senses[1]])
+        self.assertEqual(self.fp.ObjectIds(guids)[:2],
+                         [("LexSense", senses[1].Guid), None])
+
+
+class TestFWDataIndex(unittest.TestCase):
+    @classmethod
+    def setUpClass(self):
+        self.tempDir, self.fileName = _ExtractTestProject()
+
+    @classmethod
+    def tearDownClass(self):
+        shutil.rmtree(self.tempDir)
+
+    def test_Index(self):
+        index = FWDataIndex(self.fileName)
+        self.assertTrue(os.path.isfile(index.indexFileName))
+        self.assertEqual(index.ClassCounts()["CmSemanticDomain"], 1792)
+        self.assertEqual(len(index.RecordsOfClass("LexEntry")), 10)
+
+        guid, offset, length, ownerGuid = index.RecordsOfClass("LexSense")[0]
+        self.assertEqual(index.Find(guid.upper())[3], "LexSense")
+        self.assertTrue(index.ReadRecord(guid).startswith(b'<rt class="LexSense"'))
+        self.assertIsNone(index.Find("00000000-0000-0000-0000-000000000000"))
+        index.Close()
+
+        # Reused while the .fwdata file is unchanged...
+        savedTime = os.stat(index.indexFileName).st_mtime_ns
+        index = FWDataIndex(self.fileName)
+        self.assertEqual(os.stat(index.indexFileName).st_mtime_ns, savedTime)
+        index.Close()
+
+        # ...and rebuilt when it changes.
+        os.utime(self.fileName, ns=(savedTime, savedTime + 10**9))
+        index = FWDataIndex(self.fileName)
+        self.assertNotEqual(os.stat(index.indexFileName).st_mtime_ns, savedTime)
+        self.assertEqual(len(index.RecordsOfClass("LexEntry")), 10)
+        index.Close()
+
+    def test_ProjectWithIndex(self):
+        fp = FWDataProject()
+        fp.OpenProject(self.fileName, useIndex=True)
+        self.assertEqual(fp.ObjectCountFor("ICmDomainQRepository"), 7939)
+        headwords = [fp.LexiconGetHeadword(e) for e in fp.LexiconAllEntries()]
+        self.assertEqual(len(headwords), 10)
+        self.assertIn("date2", headwords)
+        fp.CloseProject()
+
+        fp = FWDataProject()
+        fp.OpenProject(self.fileName, useIndex=True)
+        guids = [guid for guid, offset, length, ownerGuid
+                 in fp.index.RecordsOfClass("LexSense")]
+        self.assertEqual(fp.ObjectIds(guids[:2]),
+                         [("LexSense", guids[0]), ("LexSense", guids[1])])
+        senses = fp.Objects(reversed(guids))
+        self.assertEqual([s.Guid for s in senses], guids[::-1])
+        self.assertIs(fp.Object(guids[0]), senses[-1])
+        fp.CloseProject()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,5 @@
 import unittest
-from flexlibs import FLExInitialize, FLExCleanup
+from flexlibs import FLExInitialize, FLExCleanup, StartupProfile
 
 
 class TestFLExInit(unittest.TestCase):
@@ -8,6 +8,11 @@ class TestFLExInit(unittest.TestCase):
             FLExInitialize()
         except:
             self.fail("Failed to initialize")
+        phases = dict(StartupProfile())
+        for phase in ("pythonnet", "assemblies", "ICU", "SLDR"):
+            self.assertIn(phase, phases)
+        # A second call does nothing
+        FLExInitialize()
         try:
             FLExCleanup()
         except:
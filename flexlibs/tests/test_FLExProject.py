@@ -6,7 +6,13 @@ import logging
 logging.basicConfig(filename='flexlibs.log', filemode='w', level=logging.DEBUG)
 
 from flexlibs import FLExInitialize, FLExCleanup
-from flexlibs import FLExProject, AllProjectNames
+from flexlibs import FLExProject, AllProjectNames, FP_ReadOnlyError
+
+from SIL.LCModel import IWfiMorphBundleRepository, ILexSenseRepository
+
+# --- Constants ---
+
+TEST_PROJECT = r"__flexlibs_testing"
 
 class TestFLExProject(unittest.TestCase):
     @classmethod
@@ -32,6 +38,11 @@ class TestFLExProject(unittest.TestCase):
                         (projectName, e.message))
         fp.CloseProject()
 
+    def test_OpenBackupReadOnly(self):
+        fp = FLExProject()
+        self.assertRaises(FP_ReadOnlyError, fp.OpenProject,
+                          "test.fwbackup", writeEnabled = True)
+
     def test_ReadLexicon(self):
         fp = FLExProject()
         projectName = AllProjectNames()[0]
@@ -47,6 +58,141 @@ class TestFLExProject(unittest.TestCase):
 
         fp.CloseProject()
 
+    def test_ExportColumns(self):
+        fp = FLExProject()
+        projectName = AllProjectNames()[0]
+        try:
+            fp.OpenProject(projectName,
+                           writeEnabled = False)
+        except Exception as e:
+            self.fail("Exception opening project %s" % projectName)
+
+        columns = fp.LexiconExportColumns(["Headword", "CitationForm"])
+        self.assertEqual(len(columns["guid"]), fp.LexiconNumberOfEntries())
+        self.assertEqual(len(columns["Headword"]), len(columns["guid"]))
+
+        columns = fp.LexiconExportColumns(["Headword", "Gloss", "POS"],
+                                          senses=True)
+        for column in ("entryGuid", "Headword", "Gloss", "POS"):
+            self.assertEqual(len(columns[column]), len(columns["guid"]))
+
+        # Each LexemeForm column reads its own writing system.
+        wsTags = [fp.GetDefaultVernacularWS()[0], fp.GetDefaultAnalysisWS()[0]]
+        columns = fp.LexiconExportColumns([("LexemeForm", ws) 
+                                           for ws in wsTags])
+        entries = list(fp.LexiconAllEntries())
+        for ws in wsTags:
+            self.assertEqual(columns["LexemeForm:%s" % ws],
+                             [fp.LexiconGetLexemeForm(e, ws) or "" 
+                              for e in entries])
+
+        fp.CloseProject()
+
+
+    def test_AnalysesCounts(self):
+        fp = FLExProject()
+        projectName = AllProjectNames()[0]
+        try:
+            fp.OpenProject(projectName,
+                           writeEnabled = False)
+        except Exception as e:
+            self.fail("Exception opening project %s" % projectName)
+
+        counts = fp.LexiconAnalysesCounts()
+        for entry in fp.LexiconAllEntries():
+            self.assertEqual(counts[str(entry.Guid)],
+                             fp.LexiconEntryAnalysesCount(entry))
+            for sense in entry.SensesOS:
+                self.assertEqual(counts[str(sense.Guid)],
+                                 fp.LexiconSenseAnalysesCount(sense))
+        self.assertIs(fp.LexiconAnalysesCounts(), counts)
+
+        fp.CloseProject()
+
+    def test_AnalysesCountsBundleEdit(self):
+        fp = FLExProject()
+        try:
+            fp.OpenProject(TEST_PROJECT,
+                           writeEnabled = True)
+        except Exception as e:
+            self.fail("Exception opening project %s" % TEST_PROJECT)
+
+        counts = fp.LexiconAnalysesCounts()
+        bundles = [b for b in fp.ObjectsIn(IWfiMorphBundleRepository)
+                   if b.SenseRA and counts[str(b.SenseRA.Guid)]]
+        senses = list(fp.ObjectsIn(ILexSenseRepository))
+        if not bundles or len(senses) < 2:
+            fp.CloseProject()
+            self.skipTest("No analysed senses in %s" % TEST_PROJECT)
+
+        bundle = bundles[0]
+        oldSense = bundle.SenseRA
+        newSense = [s for s in senses if s.Guid != oldSense.Guid][0]
+        try:
+            bundle.SenseRA = newSense
+            # Retargeting a bundle isn't in the stamp: refresh is needed.
+            self.assertIs(fp.LexiconAnalysesCounts(), counts)
+            newCounts = fp.LexiconAnalysesCounts(refresh=True)
+            self.assertIsNot(newCounts, counts)
+            self.assertNotEqual(newCounts, counts)
+            self.assertGreater(newCounts[str(newSense.Guid)],
+                               counts[str(newSense.Guid)])
+        finally:
+            bundle.SenseRA = oldSense
+        self.assertEqual(fp.LexiconAnalysesCounts(refresh=True), counts)
+
+        fp.CloseProject()
+
+
+    def test_StringReader(self):
+        fp = FLExProject()
+        projectName = AllProjectNames()[0]
+        try:
+            fp.OpenProject(projectName,
+                           writeEnabled = False)
+        except Exception as e:
+            self.fail("Exception opening project %s" % projectName)
+
+        glossReader = fp.StringReader("LexSense", "Gloss")
+        lexemeReader = fp.StringReader("LexEntry", "LexemeForm.Form")
+        senses = []
+        for entry in fp.LexiconAllEntries():
+            self.assertEqual(lexemeReader(entry),
+                             fp.LexiconGetLexemeForm(entry) or "")
+            senses.extend(entry.SensesOS)
+        self.assertEqual(glossReader.Many(senses),
+                         [fp.LexiconGetSenseGloss(s) or "" for s in senses])
+        self.assertEqual(glossReader.Many([s.Hvo for s in senses]),
+                         glossReader.Many(senses))
+
+        fp.CloseProject()
+
+    def test_Objects(self):
+        fp = FLExProject()
+        projectName = AllProjectNames()[0]
+        try:
+            fp.OpenProject(projectName,
+                           writeEnabled = False)
+        except Exception as e:
+            self.fail("Exception opening project %s" % projectName)
+
+        entries = list(fp.LexiconAllEntries())[:3]
+        missing = "00000000-0000-0000-0000-000000000000"
+        items = [entries[0].Hvo, str(entries[1].Guid).upper(), missing,
+                 entries[2].Guid, entries[0].Hvo]
+        objects = fp.Objects(items)
+        self.assertEqual([o.Hvo if o else None for o in objects],
+                         [entries[0].Hvo, entries[1].Hvo, None,
+                          entries[2].Hvo, entries[0].Hvo])
+        self.assertEqual(fp.ObjectIds(items)[1],
+                         ("LexEntry", entries[1].Hvo))
+        self.assertIsNone(fp.ObjectIds(items)[2])
+        hits = fp.objectCache.hits
+        self.assertEqual(fp.Object(entries[1].Guid).Hvo, entries[1].Hvo)
+        self.assertEqual(fp.objectCache.hits, hits + 1)
+
+        fp.CloseProject()
+
 
 
 if __name__ == "__main__":
@@ -0,0 +1,96 @@
+import unittest
+
+import os
+
+from flexlibs import FWDataProject, FP_ParameterError
+from flexlibs.code.FLExPublications import (
+    PublicationMembership,
+    BitCount,
+    BitIndexes,
+    )
+
+# --- Constants ---
+
+TEST_PROJECT = r"__flexlibs_testing"
+TEST_BACKUP = os.path.join(os.path.dirname(__file__), "..", "..",
+                           "resources", TEST_PROJECT + ".fwbackup")
+
+PUBLICATIONS = [("P1", "Main"), ("P2", "Web"), ("P3", "School")]
+
+ENTRIES = [
+    ("e0", [],           [("s0", [], []),
+                          ("s1", ["P2"], [("s2", [], [])])]),
+    ("e1", ["P1"],       [("s3", [], [])]),
+    ("e2", ["P2", "P3"], []),
+    ] + [("e%d" % i, [], []) for i in range(3, 20)]
+
+#-----------------------------------------------------------
+
+class TestPublicationMembership(unittest.TestCase):
+    def setUp(self):
+        self.pubs = PublicationMembership(PUBLICATIONS, ENTRIES)
+
+    def test_Bits(self):
+        self.assertEqual(BitCount(0b101101), 4)
+        self.assertEqual(list(BitIndexes(0)), [])
+        self.assertEqual(list(BitIndexes((1 << 17) | 0b1010)), [1, 3, 17])
+
+    def test_Entries(self):
+        pubs = self.pubs
+        self.assertEqual(len(pubs), 3)
+        self.assertEqual(pubs.Index("Web"), 1)
+        self.assertEqual(pubs.Index("p3"), 2)
+        self.assertIsNone(pubs.Index("Print"))
+        self.assertRaises(FP_ParameterError, pubs.Entries, "Print")
+
+        self.assertEqual(BitCount(pubs.Entries("Main")), 19)
+        self.assertEqual(BitCount(pubs.Entries("Web")), 19)
+        self.assertEqual(pubs.allEntries, (1 << 20) - 1)
+        mainOnly = pubs.Entries("Main") & ~pubs.Entries("Web")
+        self.assertEqual(list(pubs.EntryGuids(mainOnly)), ["e2"])
+        notMain = pubs.allEntries & ~pubs.Entries("Main")
+        self.assertEqual(list(pubs.EntryGuids(notMain)), ["e1"])
+        self.assertEqual(pubs.EntryPublications(1), [1, 2])
+
+    def test_Stamp(self):
+        self.assertIsNone(self.pubs.stamp)
+        pubs = PublicationMembership([], ENTRIES, stamp=(20, None, ()))
+        self.assertEqual(pubs.stamp, (20, None, ()))
+        self.assertEqual(len(pubs), 0)
+        self.assertEqual(len(pubs.entryGuids), 20)
+
+    def test_Senses(self):
+        pubs = self.pubs
+        # Subsenses inherit the exclusions of their owners.
+        self.assertEqual(list(pubs.SenseGuids(pubs.Senses("Web"))),
+                         ["s0", "s3"])
+        self.assertEqual(list(pubs.SenseGuids(pubs.Senses("Main"))),
+                         ["s0", "s1", "s2"])
+        self.assertEqual(pubs.Senses(2), pubs.allSenses)
+
+    def test_FWDataProject(self):
+        fp = FWDataProject()
+        fp.OpenProject(TEST_BACKUP)
+        # The publication names don't need the lexicon.
+        self.assertEqual(fp.GetPublications(), ["Main Dictionary"])
+        self.assertNotIn("LexEntry", fp.LoadedClasses())
+        pubs = fp.PublicationMembership()
+        self.assertEqual(pubs.names, fp.GetPublications())
+        self.assertEqual(pubs.Entries("Main Dictionary"), pubs.allEntries)
+        self.assertEqual(BitCount(pubs.allSenses), 12)
+        entries = list(fp.PublicationEntries("Main Dictionary"))
+        self.assertEqual([e.Guid for e in entries],
+                         [e.Guid for e in fp.LexiconAllEntries()])
+        self.assertEqual(list(fp.PublicationEntries("Main Dictionary",
+                              excluding="Main Dictionary")), [])
+        self.assertEqual(fp.PublicationType("Main Dictionary").Guid,
+                         pubs.guids[0])
+        self.assertIsNone(fp.PublicationType("Web"))
+        # Rebuilt only when the lexicon or publications change
+        self.assertIs(fp.PublicationMembership(), pubs)
+        self.assertIsNot(fp.PublicationMembership(refresh=True), pubs)
+        fp.CloseProject()
+
+
+if __name__ == "__main__":
+    unittest.main()
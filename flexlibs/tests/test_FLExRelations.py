@@ -0,0 +1,114 @@
+import unittest
+
+import os
+
+from flexlibs import FWDataProject, FP_ParameterError
+from flexlibs.code.FLExRelations import (
+    RelationGraph,
+    MappingTypeShape,
+    ShapeTree,
+    ShapeUnidirectional,
+    Symmetric, Forward, Reverse,
+    )
+
+# --- Constants ---
+
+TEST_PROJECT = r"__flexlibs_testing"
+TEST_BACKUP = os.path.join(os.path.dirname(__file__), "..", "..",
+                           "resources", TEST_PROJECT + ".fwbackup")
+
+def Senses(*guids):
+    return [(g, "LexSense") for g in guids]
+
+RELATION_TYPES = [
+    ("T1", "Synonyms", None,    0,  [Senses("a", "b", "c"),
+                                     Senses("x", "y")]),
+    ("T2", "Part",     "Whole", 3,  [Senses("house", "room", "roof"),
+                                     Senses("room", "wall")]),
+    ("T3", "Calendar", None,    4,  [Senses("mon", "tue", "wed")]),
+    ("T4", "Compare",  None,    15, [Senses("a", "x")]),
+    ]
+
+#-----------------------------------------------------------
+
+class TestRelationGraph(unittest.TestCase):
+    def setUp(self):
+        self.graph = RelationGraph(RELATION_TYPES)
+
+    def test_MappingTypes(self):
+        self.assertEqual(MappingTypeShape(3), ShapeTree)
+        self.assertEqual(MappingTypeShape(8), ShapeTree)
+        self.assertEqual(MappingTypeShape(17), ShapeUnidirectional)
+
+    def test_Neighbours(self):
+        graph = self.graph
+        self.assertEqual(len(graph), 12)
+        self.assertEqual(graph.RelationType("Part"), 1)
+        self.assertEqual(graph.RelationType("t3"), 2)
+        self.assertRaises(FP_ParameterError, graph.RelationType, "Antonym")
+
+        a = graph.Node("A")
+        self.assertEqual(sorted((graph.guids[e.target], e.direction)
+                                for e in graph.Neighbours(a)),
+                         [("b", Symmetric), ("c", Symmetric),
+                          ("x", Forward)])
+        self.assertEqual(graph.Neighbours(a, "Compare", Reverse), [])
+        # Unidirectional: no edge back
+        self.assertEqual(graph.Neighbours(graph.Node("x"), "Compare"), [])
+
+        room = graph.Node("room")
+        names = sorted((graph.guids[e.target], graph.EdgeName(e))
+                       for e in graph.Neighbours(room))
+        self.assertEqual(names, [("house", "Whole"), ("wall", "Part")])
+
+    def test_Traversal(self):
+        graph = self.graph
+        house = graph.Node("house")
+        self.assertEqual({graph.guids[n] for n in
+                          graph.Closure(house, "Part", Forward)},
+                         {"room", "roof", "wall"})
+        self.assertEqual(graph.Closure(graph.Node("wall"), "Part", Forward),
+                         set())
+        path = graph.ShortestPath(graph.Node("mon"), graph.Node("wed"))
+        self.assertEqual([graph.guids[n] for n in path], ["mon", "tue", "wed"])
+        self.assertIsNone(graph.ShortestPath(graph.Node("wed"),
+                                             graph.Node("mon"),
+                                             direction=Forward))
+        self.assertIsNone(graph.ShortestPath(house, graph.Node("a")))
+        path = graph.ShortestPath(graph.Node("b"), graph.Node("y"))
+        self.assertEqual([graph.guids[n] for n in path], ["b", "a", "x", "y"])
+
+    def test_Components(self):
+        graph = self.graph
+        components = [[graph.guids[n] for n in c] for c in graph.Components()]
+        self.assertEqual(components, [["a", "b", "c", "x", "y"],
+                                      ["house", "room", "roof", "wall"],
+                                      ["mon", "tue", "wed"]])
+        self.assertEqual(len(graph.Components("Synonyms")), 2)
+
+    def test_EdgeList(self):
+        graph = self.graph
+        self.assertEqual(graph.EdgeList("Part"),
+                         [("house", "room", "Part"),
+                          ("house", "roof", "Part"),
+                          ("room", "wall", "Part")])
+        self.assertEqual(len(graph.EdgeList("Synonyms")), 4)
+        self.assertEqual(len(graph.EdgeList()), 10)
+
+    def test_FWDataProject(self):
+        fp = FWDataProject()
+        fp.OpenProject(TEST_BACKUP)
+        self.assertEqual(len(list(fp.GetLexicalRelationTypes())), 7)
+        graph = fp.LexicalRelationGraph()
+        self.assertEqual(len(graph), 2)
+        self.assertEqual(graph.classNames, ["LexSense", "LexSense"])
+        whole, part = graph.EdgeList()[0][:2]
+        self.assertEqual(graph.Closure(graph.Node(whole), "Part",
+                                       graph.Forward),
+                         {graph.Node(part)})
+        self.assertEqual(fp.Object(part).ClassName, "LexSense")
+        fp.CloseProject()
+
+
+if __name__ == "__main__":
+    unittest.main()
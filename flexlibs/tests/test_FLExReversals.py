@@ -0,0 +1,114 @@
+import unittest
+
+import os
+
+from flexlibs import FWDataProject
+from flexlibs.code.FLExReversals import ReversalRegistry
+
+# --- Constants ---
+
+TEST_PROJECT = r"__flexlibs_testing"
+TEST_BACKUP = os.path.join(os.path.dirname(__file__), "..", "..",
+                           "resources", TEST_PROJECT + ".fwbackup")
+
+#-----------------------------------------------------------
+
+class Entry(object):
+    def __init__(self, guid, form, subentries=()):
+        self.Guid = guid
+        self.form = form
+        self.SubentriesOS = list(subentries)
+
+class Index(object):
+    def __init__(self, ws, entries):
+        self.WritingSystem = ws
+        self.EntriesOC = list(entries)
+        self.dateModified = 1
+
+class LexDB(object):
+    def __init__(self, indexes):
+        self.ReversalIndexesOC = list(indexes)
+
+class Project(object):
+    def __init__(self, indexes):
+        self.lexDB = LexDB(indexes)
+        self.formCalls = 0
+    def ReversalGetForm(self, entry, languageTag):
+        self.formCalls += 1
+        return entry.form
+    def DateModified(self, obj):
+        return obj.dateModified
+
+
+class TestReversalRegistry(unittest.TestCase):
+    def setUp(self):
+        self.en = Index("en", [
+            Entry("A", "animal", [Entry("A1", "dog", [Entry("A11", "puppy")]),
+                                  Entry("A2", "Cat")]),
+            Entry("B", "dog"),
+            ])
+        self.fr = Index("fr", [Entry("C", "chien")])
+        self.project = Project([self.en, self.fr])
+        self.registry = ReversalRegistry(self.project)
+
+    def test_Table(self):
+        table = self.registry.Table("EN")
+        self.assertEqual(table.forms, ["animal", "dog", "puppy", "Cat", "dog"])
+        self.assertEqual(list(table.depths), [0, 1, 2, 1, 0])
+        self.assertEqual(list(table.parents), [-1, 0, 1, 0, -1])
+        self.assertEqual(table.TopLevel(), [0, 4])
+        self.assertEqual(table.Subentries(0), [1, 3])
+        self.assertEqual(table.Ancestors(2), [1, 0])
+        self.assertEqual(table.Index("a11"), 2)
+        self.assertEqual(table.Find("dog"), [1, 4])
+        self.assertEqual(table.Find("cat"), [])
+        self.assertEqual(table.Find("cat", ignoreCase=True), [3])
+
+    def test_Lookups(self):
+        registry = self.registry
+        self.assertEqual(registry.languageTags, ["en", "fr"])
+        self.assertIs(registry.Index("fr"), self.fr)
+        self.assertIsNone(registry.Index("de"))
+        self.assertIsNone(registry.Table("de"))
+        self.assertEqual([e.Guid for e in registry.Find("dog", "en")],
+                         ["A1", "B"])
+        self.assertEqual([e.Guid for e in registry.Entries("en", False)],
+                         ["A", "B"])
+        self.assertEqual(len(registry.Entries("en")), 5)
+
+    def test_Refresh(self):
+        registry = self.registry
+        table = registry.Table("en")
+        registry.Table("fr")
+        calls = self.project.formCalls
+        self.assertIs(registry.Table("en"), table)
+        self.assertEqual(self.project.formCalls, calls)
+
+        # Only the modified index is rebuilt.
+        self.en.EntriesOC.append(Entry("D", "bird"))
+        self.en.dateModified = 2
+        table = registry.Table("en")
+        self.assertEqual(table.Find("bird"), [5])
+        self.assertEqual(self.project.formCalls, calls + 6)
+        registry.Table("fr")
+        self.assertEqual(self.project.formCalls, calls + 6)
+
+        self.project.lexDB.ReversalIndexesOC.append(Index("de", []))
+        self.assertEqual(len(registry.languageTags), 3)
+
+    def test_FWDataProject(self):
+        fp = FWDataProject()
+        fp.OpenProject(TEST_BACKUP)
+        self.assertEqual(len(fp.ReversalRegistry().languageTags), 5)
+        entries = list(fp.ReversalEntries("zh-CN", includeSubentries=True))
+        self.assertEqual(len(entries), 8)
+        found = fp.ReversalFind("苹果", "zh-CN")
+        self.assertEqual(len(found), 1)
+        self.assertEqual(fp.ReversalGetForm(found[0], "zh-CN"), "苹果")
+        self.assertEqual(fp.ReversalFind("apple", "zh-CN"), [])
+        self.assertIsNone(fp.ReversalEntries("xx"))
+        fp.CloseProject()
+
+
+if __name__ == "__main__":
+    unittest.main()
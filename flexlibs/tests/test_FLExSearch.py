@@ -0,0 +1,96 @@
+import unittest
+
+import os
+import json
+import shutil
+import tempfile
+
+from flexlibs import FWDataProject
+from flexlibs.code.FLExSearch import (
+    LexiconIndex,
+    FieldGloss,
+    FieldReversal,
+    EditDistance,
+    LexiconStamp,
+    )
+
+# --- Constants ---
+
+TEST_PROJECT = r"__flexlibs_testing"
+TEST_BACKUP = os.path.join(os.path.dirname(__file__), "..", "..",
+                           "resources", TEST_PROJECT + ".fwbackup")
+
+#-----------------------------------------------------------
+
+class TestFLExSearch(unittest.TestCase):
+    @classmethod
+    def setUpClass(self):
+        self.tempDir = tempfile.mkdtemp()
+        self.fp = FWDataProject()
+        self.fp.OpenProject(TEST_BACKUP)
+        self.index = self.fp.LexiconSearchIndex()
+
+    @classmethod
+    def tearDownClass(self):
+        self.fp.CloseProject()
+        shutil.rmtree(self.tempDir)
+
+    def test_Unstamped(self):
+        # An in-memory index doesn't need (or compute) a lexicon stamp.
+        self.assertIsNone(self.index.stamp)
+
+    def test_Exact(self):
+        hits = self.index.Exact("table", "tr")
+        self.assertTrue(hits)
+        entry = self.fp.Object(hits[0].guid)
+        self.assertEqual(self.fp.LexiconGetLexemeForm(entry), "table")
+        self.assertEqual(self.index.Exact("tabel"), [])
+
+    def test_Prefix(self):
+        forms = {hit.form for hit in self.index.Prefix("da", "tr")}
+        self.assertEqual(forms, {"date", "date1", "date2"})
+        self.assertEqual({hit.field for hit in self.index.Prefix("桌")},
+                         {FieldGloss, FieldReversal})
+
+    def test_Folded(self):
+        hits = self.index.Folded("PINGGUO DIANNAO", "zh-CN-x-py")
+        self.assertEqual([hit.form for hit in hits], ["píngguǒ diànnǎo"])
+
+    def test_Fuzzy(self):
+        self.assertEqual(EditDistance("kitten", "sitting", 5), 3)
+        self.assertEqual(EditDistance("kitten", "sitting", 2), 3)
+        hits = self.index.Fuzzy("tabel", 2, "tr")
+        self.assertEqual(hits[0].form, "table")
+        self.assertEqual(self.index.Fuzzy("tabel", 1, "tr"), [])
+
+    def test_SaveAndLoad(self):
+        fileName = os.path.join(self.tempDir, "index.json")
+        self.fp.LexiconSearchIndex(fileName)
+        index = LexiconIndex.Load(fileName)
+        self.assertEqual(len(index), len(self.index))
+        self.assertEqual(index.Exact("table"), self.index.Exact("table"))
+
+        # The saved index is reused while its stamp matches.
+        stamp = index.stamp
+        os.utime(fileName, (0, 0))
+        self.fp.LexiconSearchIndex(fileName)
+        self.assertEqual(os.path.getmtime(fileName), 0)
+        with open(fileName, encoding="utf-8") as f:
+            data = json.load(f)
+        data["stamp"] = "out of date"
+        with open(fileName, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.utime(fileName, (0, 0))
+        self.fp.LexiconSearchIndex(fileName)
+        self.assertNotEqual(os.path.getmtime(fileName), 0)
+        self.assertEqual(LexiconIndex.Load(fileName).stamp, stamp)
+
+    def test_LexiconStamp(self):
+        stamp = LexiconStamp(self.fp)
+        self.assertEqual(stamp[:2], [10, 12])
+        self.assertEqual(len(stamp[3]), 5)
+        self.assertEqual(stamp, json.loads(json.dumps(stamp)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+
+import os
+
+from flexlibs import FWDataProject
+from flexlibs.code.FLExSemanticDomains import SemanticDomainTree
+
+# --- Constants ---
+
+TEST_PROJECT = r"__flexlibs_testing"
+TEST_BACKUP = os.path.join(os.path.dirname(__file__), "..", "..",
+                           "resources", TEST_PROJECT + ".fwbackup")
+
+DOMAINS = [
+    ("g1",   None,  "1",     {"en": "Universe"}),
+    ("g11",  "g1",  "1.1",   {"en": "Sky"}),
+    ("g111", "g11", "1.1.1", {"en": "Sun", "fr": "Soleil"}),
+    ("g12",  "g1",  "1.2",   {"en": "World"}),
+    ("g2",   None,  "2",     {"en": "Person"}),
+    ]
+
+#-----------------------------------------------------------
+
+class TestSemanticDomainTree(unittest.TestCase):
+    def setUp(self):
+        self.tree = SemanticDomainTree(DOMAINS, 
+                                       [("s1", "g111"), ("s2", "g12"),
+                                        ("s3", "g111"), ("s4", "G2")])
+
+    def test_Structure(self):
+        tree = self.tree
+        self.assertEqual(len(tree), 5)
+        sun = tree.FindAbbreviation("1.1.1")
+        self.assertEqual(tree.Index("G111"), sun)
+        self.assertEqual(tree.depths[sun], 2)
+        self.assertEqual(tree.Ancestors(sun), [tree.Index("g11"), 0])
+        self.assertEqual(tree.Children(0), [1, 3])
+        self.assertEqual(tree.Children(), [0, 4])
+        self.assertEqual(list(tree.Descendants(0)), [1, 2, 3])
+        self.assertTrue(tree.IsAncestor(0, sun))
+        self.assertFalse(tree.IsAncestor(sun, 0))
+        self.assertFalse(tree.IsAncestor(4, sun))
+        self.assertIsNone(tree.Parent(4))
+        self.assertEqual(tree.Name(sun, "fr"), "Soleil")
+        self.assertIsNone(tree.Name(0, "fr"))
+
+    def test_Senses(self):
+        tree = self.tree
+        self.assertEqual(tree.Senses(tree.Index("g111")), ["s1", "s3"])
+        self.assertEqual(tree.Senses(0), [])
+        self.assertEqual(sorted(tree.Senses(0, includeDescendants=True)),
+                         ["s1", "s2", "s3"])
+        self.assertEqual(tree.DomainsInUse(), [2, 3, 4])
+
+    def test_FWDataProject(self):
+        fp = FWDataProject()
+        fp.OpenProject(TEST_BACKUP)
+        tree = fp.SemanticDomainTree()
+        self.assertEqual(len(tree), 1792)
+        i = tree.FindAbbreviation("8.4.5")
+        self.assertEqual(tree.Name(i, "en"), "Relative time")
+        self.assertEqual([tree.abbreviations[a] for a in tree.Ancestors(i)],
+                         ["8.4", "8"])
+        self.assertEqual(len(tree.Children()), 9)
+        fp.CloseProject()
+
+
+if __name__ == "__main__":
+    unittest.main()
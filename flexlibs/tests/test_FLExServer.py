@@ -0,0 +1,93 @@
+import unittest
+
+import os
+import shutil
+import tempfile
+
+from flexlibs import (
+    FWDataProject,
+    ProjectServer,
+    ProjectClient,
+    FP_ParameterError,
+    FP_ReadOnlyError,
+    FP_WritingSystemError,
+    )
+from flexlibs.code.FLExServer import RemoteObject
+
+# --- Constants ---
+
+TEST_PROJECT = r"__flexlibs_testing"
+TEST_BACKUP = os.path.join(os.path.dirname(__file__), "..", "..",
+                           "resources", TEST_PROJECT + ".fwbackup")
+
+#-----------------------------------------------------------
+
+class TestProjectServer(unittest.TestCase):
+    @classmethod
+    def setUpClass(self):
+        self.tempDir = tempfile.mkdtemp()
+        self.fileName = TEST_BACKUP
+        self.server = ProjectServer(port=0, projectClass=FWDataProject)
+        self.server.Start()
+
+    @classmethod
+    def tearDownClass(self):
+        self.server.Shutdown()
+        shutil.rmtree(self.tempDir)
+
+    def setUp(self):
+        self.client = ProjectClient(*self.server.address)
+        self.client.OpenProject(self.fileName)
+
+    def tearDown(self):
+        self.client.CloseProject()
+
+    def test_Calls(self):
+        client = self.client
+        self.assertTrue(client.Ping())
+        self.assertEqual(client.ServerProjects(), [self.fileName])
+
+        entries = client.LexiconAllEntries()
+        self.assertEqual(len(entries), 10)
+        self.assertIsInstance(entries[0], RemoteObject)
+        self.assertEqual(entries[0].ClassName, "LexEntry")
+
+        # Objects can be passed back as parameters.
+        fp = FWDataProject()
+        fp.OpenProject(self.fileName)
+        expected = [fp.LexiconGetHeadword(e) for e in fp.LexiconAllEntries()]
+        fp.CloseProject()
+        self.assertEqual([client.LexiconGetHeadword(e) for e in entries],
+                         expected)
+        self.assertEqual(client.Object(entries[0].Guid), entries[0])
+        self.assertEqual(client.GetPublications(), ["Main Dictionary"])
+
+    def test_Errors(self):
+        client = self.client
+        entry = client.LexiconAllEntries()[0]
+        self.assertRaises(FP_WritingSystemError,
+                          client.LexiconGetLexemeForm, entry, "xx")
+        self.assertRaises(FP_ParameterError, client.CloseProject_)
+        self.assertRaises(FP_ParameterError, client.OpenProject_)
+        # Only the read functions can be called.
+        self.assertRaises(FP_ParameterError, client.LexiconSearchIndex,
+                          os.path.join(self.tempDir, "index.json"))
+        self.assertFalse(os.path.exists(os.path.join(self.tempDir,
+                                                     "index.json")))
+        self.assertRaises(FP_ParameterError, client.RawRecords)
+        self.assertRaises(FP_ReadOnlyError, client.OpenProject,
+                          self.fileName, writeEnabled=True)
+        # The connection is still usable.
+        self.assertEqual(len(client.LexiconAllEntries()), 10)
+
+    def test_Clients(self):
+        other = ProjectClient(*self.server.address)
+        other.OpenProject(self.fileName)
+        self.assertEqual(other.LexiconNumberOfEntries(),
+                         self.client.LexiconNumberOfEntries())
+        other.CloseProject()
+        self.assertEqual(self.server.ProjectNames(), [self.fileName])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+import unittest
+
+import os
+import shutil
+import tempfile
+
+from flexlibs.code.FLExSort import SortKeyFallback, SortKeyCache
+
+
+class TestFLExSort(unittest.TestCase):
+    def test_SortKeyFallback(self):
+        words = ["éclair", "Eclair", "eclair", "ecl", "zebra", "Ärger", "apple"]
+        self.assertEqual(sorted(words, key=SortKeyFallback),
+                         ["apple", "Ärger", "ecl", "eclair", "Eclair", 
+                          "éclair", "zebra"])
+
+    def test_SortKeyCache(self):
+        cache = SortKeyCache(SortKeyFallback)
+        items = [("g1", 1, "pear", "P"), 
+                 ("g2", 1, "apple", "A"), 
+                 ("g3", 1, "fig", "F")]
+        self.assertEqual(cache.Sorted(items), ["A", "F", "P"])
+        self.assertEqual((cache.hits, cache.misses), (0, 3))
+
+        # Only the modified object's key is recomputed
+        items[0] = ("g1", 2, "banana", "B")
+        self.assertEqual(cache.Sorted(items), ["A", "B", "F"])
+        self.assertEqual((cache.hits, cache.misses), (2, 4))
+
+    def test_SortStringFunction(self):
+        cache = SortKeyCache(SortKeyFallback)
+        calls = []
+        def Text(text):
+            def Read():
+                calls.append(text)
+                return text
+            return Read
+
+        items = [("g1", 1, Text("pear"), "P"),
+                 ("g2", 1, Text("apple"), "A")]
+        self.assertEqual(cache.Sorted(items), ["A", "P"])
+        self.assertEqual(calls, ["pear", "apple"])
+
+        # The sort string is only read again for modified objects
+        items[0] = ("g1", 2, Text("zucchini"), "Z")
+        self.assertEqual(cache.Sorted(items), ["A", "Z"])
+        self.assertEqual(calls, ["pear", "apple", "zucchini"])
+        self.assertEqual((cache.hits, cache.misses), (1, 3))
+
+    def test_SaveAndLoad(self):
+        tempDir = tempfile.mkdtemp()
+        try:
+            fileName = os.path.join(tempDir, "keys.json")
+            cache = SortKeyCache(SortKeyFallback, fileName, "en")
+            cache.Key("G1", 1, "one")
+            cache.Save()
+
+            cache = SortKeyCache(SortKeyFallback, fileName, "en")
+            self.assertEqual(len(cache), 1)
+            cache.Key("g1", 1, "one")
+            self.assertEqual(cache.hits, 1)
+
+            # A different collation doesn't use the saved keys
+            cache = SortKeyCache(SortKeyFallback, fileName, "fr")
+            self.assertEqual(len(cache), 0)
+        finally:
+            shutil.rmtree(tempDir)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+import unittest
+
+from flexlibs.code.FLExWritingSystems import (
+    WritingSystemRegistry,
+    NormaliseLanguageTag,
+    )
+
+#-----------------------------------------------------------
+
+class TestWritingSystemRegistry(unittest.TestCase):
+    def setUp(self):
+        self.registry = WritingSystemRegistry(
+                            [("en", 1, "English"),
+                             ("fr", 2, "French"),
+                             ("zh-CN", 3, "Chinese"),
+                             ("qaa-x-old", 4, "Unused")],
+                            ["fr"],
+                            ["en", "zh-CN"],
+                            "fr",
+                            "en")
+
+    def test_Lookups(self):
+        registry = self.registry
+        self.assertEqual(len(registry), 4)
+        self.assertEqual(registry.Handle("zh_cn"), 3)
+        self.assertEqual(registry.Handle("xx"), None)
+        self.assertEqual(registry.Tag(3), "zh-CN")
+        self.assertEqual(registry.Tag(99), None)
+        self.assertEqual(registry.Name("ZH-CN"), "Chinese")
+        self.assertEqual(registry.Name(2), "French")
+        ws = registry.Find("fr")
+        self.assertTrue(ws.isVernacular)
+        self.assertTrue(ws.isDefaultVernacular)
+        self.assertFalse(ws.isAnalysis)
+        self.assertEqual(ws.normalisedTag, NormaliseLanguageTag("FR"))
+
+    def test_Current(self):
+        registry = self.registry
+        self.assertEqual(registry.vernacularTags, ("fr",))
+        self.assertEqual(registry.analysisTags, ("en", "zh-CN"))
+        self.assertEqual(registry.defaultAnalysis.handle, 1)
+        self.assertEqual([ws.languageTag for ws in registry.Active()],
+                         ["en", "fr", "zh-CN"])
+
+    def test_Immutable(self):
+        with self.assertRaises(AttributeError):
+            self.registry.cache = {}
+        with self.assertRaises(AttributeError):
+            self.registry.analysisTags = ()
+
+
+if __name__ == "__main__":
+    unittest.main()